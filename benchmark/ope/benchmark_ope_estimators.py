@@ -73,13 +73,15 @@ def main(cfg: DictConfig) -> None:
     random_state = cfg.setting.random_state
     np.random.seed(random_state)
 
-    # define dataset
-    dataset_ts = OpenBanditDataset(
-        behavior_policy="bts", campaign=campaign, data_path=obd_path
-    )
-    dataset_ur = OpenBanditDataset(
-        behavior_policy="random", campaign=campaign, data_path=obd_path
+    # define dataset (the logs of both behavior policies are loaded concurrently)
+    datasets = OpenBanditDataset.load_multiple(
+        behavior_policies=["bts", "random"],
+        campaigns=[campaign],
+        data_path=obd_path,
+        n_jobs=2,
     )
+    dataset_ts = datasets[("bts", campaign)]
+    dataset_ur = datasets[("random", campaign)]
 
     # prepare logged bandit feedback and evaluation policies
     if behavior_policy == "random":
@@ -92,10 +94,7 @@ def main(cfg: DictConfig) -> None:
             bandit_feedback_ur = dataset_ur.obtain_batch_bandit_feedback()
         bandit_feedbacks = [bandit_feedback_ur]
         # obtain the ground-truth policy value
-        ground_truth_ts = OpenBanditDataset.calc_on_policy_policy_value_estimate(
-            behavior_policy="bts",
-            campaign=campaign,
-            data_path=obd_path,
+        ground_truth_ts = dataset_ts.calc_on_policy_policy_value(
             test_size=test_size,
             is_timeseries_split=is_timeseries_split,
         )
@@ -119,10 +118,7 @@ def main(cfg: DictConfig) -> None:
             bandit_feedback_ts = dataset_ts.obtain_batch_bandit_feedback()
         bandit_feedbacks = [bandit_feedback_ts]
         # obtain the ground-truth policy value
-        ground_truth_ur = OpenBanditDataset.calc_on_policy_policy_value_estimate(
-            behavior_policy="random",
-            campaign=campaign,
-            data_path=obd_path,
+        ground_truth_ur = dataset_ur.calc_on_policy_policy_value(
             test_size=test_size,
             is_timeseries_split=is_timeseries_split,
         )
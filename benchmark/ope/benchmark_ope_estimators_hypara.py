@@ -86,10 +86,7 @@ def main(cfg: DictConfig) -> None:
             bandit_feedback_ur = dataset_ur.obtain_batch_bandit_feedback()
         bandit_feedbacks = [bandit_feedback_ur]
         # obtain the ground-truth policy value
-        ground_truth_ts = OpenBanditDataset.calc_on_policy_policy_value_estimate(
-            behavior_policy="bts",
-            campaign=campaign,
-            data_path=obd_path,
+        ground_truth_ts = dataset_ts.calc_on_policy_policy_value(
             test_size=test_size,
             is_timeseries_split=is_timeseries_split,
         )
@@ -113,10 +110,7 @@ def main(cfg: DictConfig) -> None:
             bandit_feedback_ts = dataset_ts.obtain_batch_bandit_feedback()
         bandit_feedbacks = [bandit_feedback_ts]
         # obtain the ground-truth policy value
-        ground_truth_ur = OpenBanditDataset.calc_on_policy_policy_value_estimate(
-            behavior_policy="random",
-            campaign=campaign,
-            data_path=obd_path,
+        ground_truth_ur = dataset_ur.calc_on_policy_policy_value(
             test_size=test_size,
             is_timeseries_split=is_timeseries_split,
         )
@@ -22,6 +22,7 @@ from obp.ope import SelfNormalizedInverseProbabilityWeighting
 from obp.ope import SwitchDoublyRobustTuning
 from obp.policy import BernoulliTS
 from obp.policy import Random
+from obp.types import BootstrapReplicate
 
 
 evaluation_policy_dict = dict(bts=BernoulliTS, random=Random)
@@ -135,9 +136,9 @@ if __name__ == "__main__":
         campaign=campaign,
     )
 
-    def process(b: int):
+    def process(replicate: BootstrapReplicate):
         # sample bootstrap from batch logged bandit feedback
-        bandit_feedback = obd.sample_bootstrap_bandit_feedback(random_state=b)
+        bandit_feedback = replicate.materialize()
         # estimate the reward function with an ML model
         regression_model = RegressionModel(
             n_actions=obd.n_actions,
@@ -171,10 +172,14 @@ if __name__ == "__main__":
 
         return relative_ee_b
 
+    # the workers receive only the seeds of the replicates and map the shared logged bandit data
+    replicates = obd.generate_bootstrap_replicates(
+        n_replicates=n_runs, random_state=random_state, shared_memory=True
+    )
     processed = Parallel(
         n_jobs=n_jobs,
         verbose=50,
-    )([delayed(process)(i) for i in np.arange(n_runs)])
+    )(delayed(process)(replicate) for replicate in replicates)
     metric_dict = {est.estimator_name: dict() for est in ope_estimators}
     for b, relative_ee_b in enumerate(processed):
         for (
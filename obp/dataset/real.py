@@ -3,28 +3,46 @@
 
 """Dataset Class for Real-World Logged Bandit Data."""
 from dataclasses import dataclass
+import hashlib
+import inspect
 from logging import basicConfig
 from logging import getLogger
 from logging import INFO
+import os
 from pathlib import Path
+import shutil
+import tempfile
+import threading
+from typing import Dict
+from typing import Iterator
 from typing import Optional
+from typing import Sequence
 from typing import Tuple
 from typing import Union
 
+from joblib import delayed
+from joblib import Parallel
 import numpy as np
 import pandas as pd
+from scipy import sparse
 from scipy.stats import rankdata
 from sklearn.preprocessing import LabelEncoder
 from sklearn.utils import check_random_state
 from sklearn.utils import check_scalar
 
 from ..types import BanditFeedback
+from ..types import BootstrapReplicate
+from ..types import ColumnarBanditFeedback
+from ..version import __version__
 from .base import BaseRealBanditDataset
 
 
 logger = getLogger(__name__)
 basicConfig(level=INFO)
 
+# parsed item contexts shared by the datasets loaded together by `OpenBanditDataset.load_multiple`
+_shared_item_contexts = threading.local()
+
 
 @dataclass
 class OpenBanditDataset(BaseRealBanditDataset):
@@ -51,6 +69,28 @@ class OpenBanditDataset(BaseRealBanditDataset):
     dataset_name: str, default='obd'
         Name of the dataset.
 
+    cache_dir: str or Path, default=None
+        Directory where the preprocessed arrays are cached as `.npy` files.
+        When given, the arrays are loaded from the cache as read-only memory-mapped arrays
+        instead of parsing and preprocessing the raw csv files, which is the dominant cost of loading the full-size dataset.
+        The cache is keyed on the size and modification time of the raw csv files and the source code of
+        `load_raw_data` and `pre_process`, and thus it is invalidated when either of them changes.
+        Note that `data` and `item_context` (the raw data frames) are not available when the arrays are loaded from the cache.
+
+    chunk_size: int, default=None
+        Number of rows of the raw csv file parsed at a time.
+        When given, the raw csv file is streamed chunk by chunk with explicit dtypes and only the columns used by
+        the default preprocessing are parsed into preallocated compact arrays, so that the raw data frame
+        (which is several times larger than the preprocessed arrays for the full-size dataset) is never materialized.
+        The resulting arrays (and thus `obtain_batch_bandit_feedback`) are the same as those of the default loading.
+        This option is available only with the default `load_raw_data` and `pre_process`, and `data` is not available.
+
+    sparse_context: bool, default=False
+        Whether to build the one-hot user features (`context`) as a `scipy.sparse.csr_matrix`.
+        Most of the one-hot features are zeros, and the sparse context flows through
+        `RegressionModel`, `ImportanceWeightEstimator`, `PropensityScoreEstimator`, `IPWLearner`, and `QLearner`
+        without densification (when their base models accept sparse inputs).
+
     References
     ------------
     Yuta Saito, Shunsuke Aihara, Megumi Matsutani, Yusuke Narita.
@@ -62,6 +102,9 @@ class OpenBanditDataset(BaseRealBanditDataset):
     campaign: str
     data_path: Optional[Union[str, Path]] = None
     dataset_name: str = "obd"
+    cache_dir: Optional[Union[str, Path]] = None
+    chunk_size: Optional[int] = None
+    sparse_context: bool = False
 
     def __post_init__(self) -> None:
         """Initialize Open Bandit Dataset Class."""
@@ -97,18 +140,193 @@ class OpenBanditDataset(BaseRealBanditDataset):
         self.data_path = self.data_path / self.behavior_policy / self.campaign
         self.raw_data_file = f"{self.campaign}.csv"
 
-        self.load_raw_data()
-        self.pre_process()
+        if self.chunk_size is not None:
+            check_scalar(self.chunk_size, name="chunk_size", target_type=int, min_val=1)
+            if (
+                type(self).load_raw_data is not OpenBanditDataset.load_raw_data
+                or type(self).pre_process is not OpenBanditDataset.pre_process
+            ):
+                raise ValueError(
+                    "`chunk_size` can be used only with the default `load_raw_data` and `pre_process`"
+                )
+
+        if self.cache_dir is None:
+            self._load_and_pre_process()
+        else:
+            if not isinstance(self.cache_dir, (str, Path)):
+                raise ValueError("`cache_dir` must be a string or Path")
+            cache_path = self._obtain_cache_path()
+            if cache_path.exists():
+                self._load_cache(cache_path)
+            else:
+                self._load_and_pre_process()
+                self._save_cache(cache_path)
+
+    def _load_and_pre_process(self) -> None:
+        """Load and preprocess raw open bandit dataset, chunk by chunk when `chunk_size` is given."""
+        if self.chunk_size is None:
+            self.load_raw_data()
+            self.pre_process()
+        else:
+            self._load_raw_data_by_chunk()
+            self.action_context = self._pre_process_item_context()
+
+    def _load_raw_data_by_chunk(self) -> None:
+        """Load raw open bandit dataset chunk by chunk and build the arrays of `load_raw_data` and `pre_process`."""
+        self.item_context = _read_item_context(self.data_path / "item_context.csv")
+        raw_data_path = self.data_path / self.raw_data_file
+        columns = pd.read_csv(raw_data_path, index_col=0, nrows=0).columns
+        user_cols = list(columns[columns.str.contains("user_feature")])
+        dtype = {
+            "timestamp": str,
+            "item_id": np.int64,
+            "position": np.int64,
+            "click": np.int64,
+            "propensity_score": np.float64,
+        }
+        dtype.update({col: str for col in user_cols})
+
+        # the number of lines is an upper bound of the number of rows (blank lines are skipped by `read_csv`)
+        n_rows = _count_data_lines(raw_data_path)
+        timestamp = np.empty(n_rows, dtype=np.int64)
+        action = np.empty(n_rows, dtype=np.int32)
+        position = np.empty(n_rows, dtype=np.int16)
+        reward = np.empty(n_rows, dtype=np.int8)
+        pscore = np.empty(n_rows, dtype=np.float64)
+        user_codes = np.empty((n_rows, len(user_cols)), dtype=np.int32)
+        user_categories = [dict() for _ in user_cols]
+        epoch = pd.Timestamp("1970-01-01", tz="UTC")
+        start = 0
+        for chunk in pd.read_csv(
+            raw_data_path,
+            usecols=list(dtype),
+            dtype=dtype,
+            chunksize=self.chunk_size,
+        ):
+            end = start + chunk.shape[0]
+            timestamp[start:end] = (
+                pd.to_datetime(chunk["timestamp"], utc=True) - epoch
+            ) // pd.Timedelta(1, "us")
+            action[start:end] = chunk["item_id"].values
+            position[start:end] = chunk["position"].values
+            reward[start:end] = chunk["click"].values
+            pscore[start:end] = chunk["propensity_score"].values
+            for j, col in enumerate(user_cols):
+                # map the codes of each chunk to the codes over the whole data (in order of appearance)
+                codes, uniques = pd.factorize(chunk[col])
+                global_codes = np.array(
+                    [
+                        user_categories[j].setdefault(value, len(user_categories[j]))
+                        for value in uniques
+                    ]
+                    + [-1],
+                    dtype=np.int32,
+                )
+                user_codes[start:end, j] = global_codes[codes]
+            start = end
+            del chunk
+
+        order = np.argsort(timestamp[:start], kind="stable")
+        self.action = action[order].astype(int)
+        self.position = np.unique(position[:start], return_inverse=True)[1][
+            order
+        ].astype(int)
+        self.reward = reward[order].astype(int)
+        self.pscore = pscore[order]
+        user_data = dict()
+        for j, col in enumerate(user_cols):
+            # `get_dummies` orders the categories of each column in ascending order
+            categories = sorted(user_categories[j])
+            sorted_codes = np.empty(len(categories) + 1, dtype=np.int32)
+            sorted_codes[
+                [user_categories[j][value] for value in categories]
+            ] = np.arange(len(categories))
+            sorted_codes[-1] = -1
+            user_data[col] = pd.Categorical.from_codes(
+                sorted_codes[user_codes[order, j]], categories=categories
+            )
+        self.context = _dummies_to_context(
+            pd.get_dummies(
+                pd.DataFrame(user_data), drop_first=True, sparse=self.sparse_context
+            )
+        )
+
+    def _obtain_cache_path(self) -> Path:
+        """Obtain the path of the cache keyed on the raw csv files, the preprocessing implementation, and the library versions."""
+        key = hashlib.sha256()
+        for file_ in [
+            self.data_path / self.raw_data_file,
+            self.data_path / "item_context.csv",
+        ]:
+            stat = file_.stat()
+            key.update(f"{file_.resolve()}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+        # the preprocessing implementation including its helpers
+        for function in [
+            type(self).load_raw_data,
+            type(self).pre_process,
+            type(self)._pre_process_item_context,
+            type(self)._load_raw_data_by_chunk,
+            _read_item_context,
+            _dummies_to_context,
+        ]:
+            try:
+                source = inspect.getsource(function)
+            except (OSError, TypeError):
+                source = function.__qualname__
+            key.update(source.encode())
+        # the outputs of the preprocessing depend on the library versions, e.g., the dtype of `pd.get_dummies`
+        key.update(f"obp:{__version__}:pandas:{pd.__version__}".encode())
+        key.update(f"sparse_context:{self.sparse_context}".encode())
+        return (
+            Path(self.cache_dir)
+            / f"{self.dataset_name}_{self.behavior_policy}_{self.campaign}_{key.hexdigest()[:16]}"
+        )
+
+    def _save_cache(self, cache_path: Path) -> None:
+        """Save the preprocessed arrays, i.e., the array (and sparse matrix) attributes set by `load_raw_data` and `pre_process`."""
+        arrays = {
+            name: value
+            for name, value in vars(self).items()
+            if isinstance(value, np.ndarray)
+        }
+        sparse_matrices = {
+            name: value for name, value in vars(self).items() if sparse.issparse(value)
+        }
+        if any(array.dtype.hasobject for array in arrays.values()):
+            logger.info(
+                "The preprocessed arrays are not cached because some of them contain python objects."
+            )
+            return
+        Path(self.cache_dir).mkdir(parents=True, exist_ok=True)
+        # write to a temporary directory first so that readers never see a partially written cache
+        tmp_path = Path(tempfile.mkdtemp(dir=self.cache_dir))
+        for name, array in arrays.items():
+            np.save(tmp_path / f"{name}.npy", array)
+        for name, matrix in sparse_matrices.items():
+            sparse.save_npz(tmp_path / f"{name}.npz", matrix, compressed=False)
+        try:
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # another process has created the same cache
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+    def _load_cache(self, cache_path: Path) -> None:
+        """Load the preprocessed arrays as read-only memory-mapped arrays."""
+        for file_ in cache_path.glob("*.npy"):
+            setattr(self, file_.stem, np.load(file_, mmap_mode="r"))
+        # sparse matrices cannot be memory-mapped and are loaded into memory
+        for file_ in cache_path.glob("*.npz"):
+            setattr(self, file_.stem, sparse.load_npz(file_))
 
     @property
     def n_rounds(self) -> int:
         """Size of the logged bandit data."""
-        return self.data.shape[0]
+        return self.action.shape[0]
 
     @property
     def n_actions(self) -> int:
         """Number of actions."""
-        return int(self.action.max() + 1)
+        return int(self.action.max()) + 1
 
     @property
     def dim_context(self) -> int:
@@ -118,7 +336,118 @@ class OpenBanditDataset(BaseRealBanditDataset):
     @property
     def len_list(self) -> int:
         """Length of recommendation lists, slate size."""
-        return int(self.position.max() + 1)
+        return int(self.position.max()) + 1
+
+    @classmethod
+    def load_multiple(
+        cls,
+        behavior_policies: Sequence[str] = ("bts", "random"),
+        campaigns: Sequence[str] = ("all", "men", "women"),
+        data_path: Optional[Union[str, Path]] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        chunk_size: Optional[int] = None,
+        sparse_context: bool = False,
+        n_jobs: int = 1,
+        prefer: str = "threads",
+    ) -> Dict[Tuple[str, str], "OpenBanditDataset"]:
+        """Load the datasets of several pairs of behavior policy and campaign concurrently.
+
+        Note
+        -----
+        The item context files are parsed only once per distinct content before the datasets are loaded,
+        and the parsed `item_context` is shared by the datasets with the same item context.
+
+        Parameters
+        ----------
+        behavior_policies: Sequence[str], default=("bts", "random")
+            Names of the behavior policies whose logged bandit data are loaded.
+
+        campaigns: Sequence[str], default=("all", "men", "women")
+            Campaigns whose logged bandit data are loaded.
+            The data of all the pairs of `behavior_policies` and `campaigns` are loaded.
+
+        data_path: str or Path, default=None
+            Path where the Open Bandit Dataset is stored.
+            When `None` is given, the example small-sized data is loaded.
+
+        cache_dir: str or Path, default=None
+            Directory where the preprocessed arrays are cached (see `OpenBanditDataset`).
+
+        chunk_size: int, default=None
+            Number of rows of the raw csv files parsed at a time (see `OpenBanditDataset`).
+
+        sparse_context: bool, default=False
+            Whether to build `context` as a `scipy.sparse.csr_matrix` (see `OpenBanditDataset`).
+
+        n_jobs: int, default=1
+            Number of workers used to load the datasets in parallel.
+            `-1` means using all the available processors.
+
+        prefer: str, default="threads"
+            Whether to load the datasets in threads ("threads") or processes ("processes").
+            Threads avoid copying the loaded arrays between processes, while processes
+            avoid contention on the GIL in the parts of the preprocessing implemented in python.
+
+        Returns
+        ----------
+        datasets: dict
+            Loaded datasets keyed by the pairs of behavior policy and campaign, i.e., `(behavior_policy, campaign)`.
+
+        """
+        check_scalar(n_jobs, name="n_jobs", target_type=int)
+        if prefer not in ["threads", "processes"]:
+            raise ValueError(
+                f"`prefer` must be either 'threads' or 'processes', but {prefer} is given"
+            )
+        keys = [
+            (behavior_policy, campaign)
+            for behavior_policy in behavior_policies
+            for campaign in campaigns
+        ]
+        base_path = Path(__file__).parent / "obd" if data_path is None else data_path
+        item_contexts_by_digest = dict()
+        item_contexts = dict()
+        for behavior_policy, campaign in keys:
+            if not isinstance(base_path, (str, Path)):
+                break
+            path = (
+                Path(base_path)
+                / str(behavior_policy)
+                / str(campaign)
+                / "item_context.csv"
+            )
+            if not path.is_file():
+                continue
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            if digest not in item_contexts_by_digest:
+                item_contexts_by_digest[digest] = pd.read_csv(path, index_col=0)
+            item_contexts[str(path.resolve())] = item_contexts_by_digest[digest]
+
+        datasets = Parallel(n_jobs=n_jobs, prefer=prefer)(
+            delayed(_load_with_shared_item_contexts)(
+                dataset_cls=cls,
+                item_contexts=item_contexts,
+                behavior_policy=behavior_policy,
+                campaign=campaign,
+                data_path=data_path,
+                cache_dir=cache_dir,
+                chunk_size=chunk_size,
+                sparse_context=sparse_context,
+            )
+            for behavior_policy, campaign in keys
+        )
+        for dataset in datasets:
+            # datasets loaded in other processes (or from the cache) have their own copies
+            item_context = item_contexts.get(
+                str((dataset.data_path / "item_context.csv").resolve())
+            )
+            if item_context is None:
+                continue
+            if not hasattr(dataset, "item_context") or dataset.item_context.equals(
+                item_context
+            ):
+                dataset.item_context = item_context
+        return dict(zip(keys, datasets))
 
     @classmethod
     def calc_on_policy_policy_value_estimate(
@@ -128,6 +457,7 @@ class OpenBanditDataset(BaseRealBanditDataset):
         data_path: Optional[Path] = None,
         test_size: float = 0.3,
         is_timeseries_split: bool = False,
+        cache_dir: Optional[Union[str, Path]] = None,
     ) -> float:
         """Calculate the on-policy policy value estimate (used as a ground-truth policy value).
 
@@ -152,6 +482,10 @@ class OpenBanditDataset(BaseRealBanditDataset):
         is_timeseries_split: bool, default=False
             If true, split the original logged bandit data by time series.
 
+        cache_dir: str or Path, default=None
+            Directory where the preprocessed arrays are cached.
+            When the cache exists, the rewards are loaded from it without parsing the raw csv files.
+
         Returns
         ---------
         on_policy_policy_value_estimate: float
@@ -160,9 +494,40 @@ class OpenBanditDataset(BaseRealBanditDataset):
             This is used as a ground-truth policy value in the evaluation of OPE estimators.
 
         """
-        bandit_feedback = cls(
-            behavior_policy=behavior_policy, campaign=campaign, data_path=data_path
-        ).obtain_batch_bandit_feedback(
+        return cls(
+            behavior_policy=behavior_policy,
+            campaign=campaign,
+            data_path=data_path,
+            cache_dir=cache_dir,
+        ).calc_on_policy_policy_value(
+            test_size=test_size, is_timeseries_split=is_timeseries_split
+        )
+
+    def calc_on_policy_policy_value(
+        self, test_size: float = 0.3, is_timeseries_split: bool = False
+    ) -> float:
+        """Calculate the on-policy policy value estimate of the loaded dataset (used as a ground-truth policy value).
+
+        This is the same as `calc_on_policy_policy_value_estimate` without loading the dataset again.
+
+        Parameters
+        ----------
+        test_size: float, default=0.3
+            Proportion of the dataset included in the test split.
+            If float, should be between 0.0 and 1.0.
+            This argument matters only when `is_timeseries_split=True` (the out-sample case).
+
+        is_timeseries_split: bool, default=False
+            If true, split the original logged bandit data by time series.
+
+        Returns
+        ---------
+        on_policy_policy_value_estimate: float
+            Policy value of the behavior policy estimated by on-policy estimation, i.e., :math:`\\mathbb{E}_{n} [r_i]`.
+            This is used as a ground-truth policy value in the evaluation of OPE estimators.
+
+        """
+        bandit_feedback = self.obtain_batch_bandit_feedback(
             test_size=test_size, is_timeseries_split=is_timeseries_split
         )
         if is_timeseries_split:
@@ -174,10 +539,8 @@ class OpenBanditDataset(BaseRealBanditDataset):
     def load_raw_data(self) -> None:
         """Load raw open bandit dataset."""
         self.data = pd.read_csv(self.data_path / self.raw_data_file, index_col=0)
-        self.item_context = pd.read_csv(
-            self.data_path / "item_context.csv", index_col=0
-        )
-        self.data.sort_values("timestamp", inplace=True)
+        self.item_context = _read_item_context(self.data_path / "item_context.csv")
+        self.data.sort_values("timestamp", inplace=True, kind="stable")
         self.action = self.data["item_id"].values
         self.position = (rankdata(self.data["position"].values, "dense") - 1).astype(
             int
@@ -196,19 +559,26 @@ class OpenBanditDataset(BaseRealBanditDataset):
 
         """
         user_cols = self.data.columns.str.contains("user_feature")
-        self.context = pd.get_dummies(
-            self.data.loc[:, user_cols], drop_first=True
-        ).values
+        self.context = _dummies_to_context(
+            pd.get_dummies(
+                self.data.loc[:, user_cols], drop_first=True, sparse=self.sparse_context
+            )
+        )
+        self.action_context = self._pre_process_item_context()
+
+    def _pre_process_item_context(self) -> np.ndarray:
+        """Preprocess the item context into the action context."""
         item_feature_0 = self.item_context["item_feature_0"].to_frame()
         item_feature_cat = self.item_context.drop(
-            columns=["item_id", "item_feature_0"], axis=1
+            columns=["item_id", "item_feature_0"]
         ).apply(LabelEncoder().fit_transform)
-        self.action_context = pd.concat(
-            objs=[item_feature_cat, item_feature_0], axis=1
-        ).values
+        return pd.concat(objs=[item_feature_cat, item_feature_0], axis=1).values
 
     def obtain_batch_bandit_feedback(
-        self, test_size: float = 0.3, is_timeseries_split: bool = False
+        self,
+        test_size: float = 0.3,
+        is_timeseries_split: bool = False,
+        columnar: bool = False,
     ) -> Union[BanditFeedback, Tuple[BanditFeedback, BanditFeedback]]:
         """Obtain batch logged bandit data.
 
@@ -222,6 +592,10 @@ class OpenBanditDataset(BaseRealBanditDataset):
         is_timeseries_split: bool, default=False
             If true, split the original logged bandit data into train and test sets based on time series.
 
+        columnar: bool, default=False
+            If true, return `obp.types.ColumnarBanditFeedback`, which stores the round-wise columns in compact dtypes
+            only once, and the train and test sets are views sharing these columns.
+
         Returns
         --------
         bandit_feedback: BanditFeedback
@@ -237,20 +611,14 @@ class OpenBanditDataset(BaseRealBanditDataset):
             - action_context: item-related context vectors
 
         """
-        if not isinstance(is_timeseries_split, bool):
-            raise TypeError(
-                f"`is_timeseries_split` must be a bool, but {type(is_timeseries_split)} is given"
-            )
+        n_rounds_train = self._calc_n_rounds_train(
+            test_size=test_size, is_timeseries_split=is_timeseries_split
+        )
+        check_scalar(columnar, name="columnar", target_type=bool)
 
         if is_timeseries_split:
-            check_scalar(
-                test_size,
-                name="target_size",
-                target_type=(float),
-                min_val=0.0,
-                max_val=1.0,
-            )
-            n_rounds_train = np.int32(self.n_rounds * (1.0 - test_size))
+            if columnar:
+                return self._obtain_columnar_bandit_feedback().split(n_rounds_train)
             bandit_feedback_train = dict(
                 n_rounds=n_rounds_train,
                 n_actions=self.n_actions,
@@ -272,6 +640,8 @@ class OpenBanditDataset(BaseRealBanditDataset):
                 action_context=self.action_context,
             )
             return bandit_feedback_train, bandit_feedback_test
+        elif columnar:
+            return self._obtain_columnar_bandit_feedback().take(slice(None))
         else:
             return dict(
                 n_rounds=self.n_rounds,
@@ -284,12 +654,40 @@ class OpenBanditDataset(BaseRealBanditDataset):
                 action_context=self.action_context,
             )
 
+    def _calc_n_rounds_train(
+        self, test_size: float, is_timeseries_split: bool
+    ) -> Optional[int]:
+        """Validate the arguments of the train-test split and calculate the number of rounds in the train set (None if not split)."""
+        if not isinstance(is_timeseries_split, bool):
+            raise TypeError(
+                f"`is_timeseries_split` must be a bool, but {type(is_timeseries_split)} is given"
+            )
+        if not is_timeseries_split:
+            return None
+        check_scalar(
+            test_size,
+            name="test_size",
+            target_type=(float),
+            min_val=0.0,
+            max_val=1.0,
+        )
+        return np.int32(self.n_rounds * (1.0 - test_size))
+
+    def _obtain_columnar_bandit_feedback(self) -> ColumnarBanditFeedback:
+        """Obtain the whole logged bandit data in the columnar format, which is created only once."""
+        if not hasattr(self, "columnar_bandit_feedback_"):
+            self.columnar_bandit_feedback_ = ColumnarBanditFeedback(
+                self.obtain_batch_bandit_feedback()
+            )
+        return self.columnar_bandit_feedback_
+
     def sample_bootstrap_bandit_feedback(
         self,
         sample_size: Optional[int] = None,
         test_size: float = 0.3,
         is_timeseries_split: bool = False,
         random_state: Optional[int] = None,
+        columnar: bool = False,
     ) -> BanditFeedback:
         """Obtain bootstrap logged bandit feedback.
 
@@ -311,6 +709,10 @@ class OpenBanditDataset(BaseRealBanditDataset):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        columnar: bool, default=False
+            If true, return `obp.types.ColumnarBanditFeedback`, which is a view of the bootstrap samples
+            storing only their indices instead of copying the columns.
+
         Returns
         --------
         bandit_feedback: BanditFeedback
@@ -328,11 +730,15 @@ class OpenBanditDataset(BaseRealBanditDataset):
         """
         if is_timeseries_split:
             bandit_feedback = self.obtain_batch_bandit_feedback(
-                test_size=test_size, is_timeseries_split=is_timeseries_split
+                test_size=test_size,
+                is_timeseries_split=is_timeseries_split,
+                columnar=columnar,
             )[0]
         else:
             bandit_feedback = self.obtain_batch_bandit_feedback(
-                test_size=test_size, is_timeseries_split=is_timeseries_split
+                test_size=test_size,
+                is_timeseries_split=is_timeseries_split,
+                columnar=columnar,
             )
         n_rounds = bandit_feedback["n_rounds"]
         if sample_size is None:
@@ -349,7 +755,160 @@ class OpenBanditDataset(BaseRealBanditDataset):
         bootstrap_idx = random_.choice(
             np.arange(n_rounds), size=sample_size, replace=True
         )
+        if columnar:
+            return bandit_feedback.take(bootstrap_idx)
         for key_ in ["action", "position", "reward", "pscore", "context"]:
             bandit_feedback[key_] = bandit_feedback[key_][bootstrap_idx]
         bandit_feedback["n_rounds"] = sample_size
         return bandit_feedback
+
+    def generate_bootstrap_replicates(
+        self,
+        n_replicates: int,
+        sample_size: Optional[int] = None,
+        test_size: float = 0.3,
+        is_timeseries_split: bool = False,
+        random_state: Optional[int] = None,
+        shared_memory: bool = False,
+    ) -> Iterator[BootstrapReplicate]:
+        """Generate descriptors of bootstrap replicates of logged bandit feedback.
+
+        Note
+        -------
+        `sample_bootstrap_bandit_feedback` copies the sampled rows of every column for each replicate,
+        and passing the replicates to parallel workers pickles these copies.
+        This method instead yields `obp.types.BootstrapReplicate`, which stores only the random seed of the replicate
+        and refers to the logged bandit data in the columnar format (`obp.types.ColumnarBanditFeedback`) shared by all the replicates.
+        The worker calls `materialize` of the descriptor to obtain the replicate, and only the accessed columns of the sampled rows are gathered.
+        The replicate with a seed is identical to `sample_bootstrap_bandit_feedback(random_state=seed, columnar=True)`.
+
+        When `shared_memory=True`, the shared logged bandit data is stored in shared memory once per dataset,
+        and pickling a descriptor, e.g., by joblib with the process-based backends, sends only the seed and the paths of the columns.
+
+        Parameters
+        -----------
+        n_replicates: int
+            Number of bootstrap replicates.
+
+        sample_size: int, default=None
+            Number of data sampled by bootstrap in each replicate.
+            If None, the original data size (n_rounds) is used as `sample_size`.
+            The value must be smaller than the original data size.
+
+        test_size: float, default=0.3
+            Proportion of the dataset included in the test split.
+            If float, should be between 0.0 and 1.0.
+            This argument matters only when `is_timeseries_split=True` (the out-sample case).
+
+        is_timeseries_split: bool, default=False
+            If true, the replicates are sampled from the training set split based on time series.
+
+        random_state: int, default=None
+            Controls the random seeds of the replicates.
+
+        shared_memory: bool, default=False
+            If true, the logged bandit data shared by the replicates is stored in shared memory.
+
+        Returns
+        --------
+        replicates: Iterator[BootstrapReplicate]
+            Descriptors of the bootstrap replicates.
+
+        Examples
+        ----------
+
+        .. code-block:: python
+
+            >>> from joblib import delayed, Parallel
+            >>> from obp.dataset import OpenBanditDataset
+            >>> dataset = OpenBanditDataset(behavior_policy="random", campaign="all")
+            >>> def process(replicate):
+                    bandit_feedback = replicate.materialize()
+                    return bandit_feedback["reward"].mean()
+            >>> Parallel(n_jobs=4)(
+                    delayed(process)(replicate)
+                    for replicate in dataset.generate_bootstrap_replicates(
+                        n_replicates=100, random_state=12345, shared_memory=True
+                    )
+                )
+
+        """
+        check_scalar(n_replicates, name="n_replicates", target_type=int, min_val=1)
+        check_scalar(shared_memory, name="shared_memory", target_type=bool)
+        n_rounds_train = self._calc_n_rounds_train(
+            test_size=test_size, is_timeseries_split=is_timeseries_split
+        )
+        n_rounds = self.n_rounds if n_rounds_train is None else n_rounds_train
+        if sample_size is None:
+            sample_size = n_rounds
+        else:
+            check_scalar(
+                sample_size,
+                name="sample_size",
+                target_type=(int),
+                min_val=0,
+                max_val=n_rounds,
+            )
+        random_ = check_random_state(random_state)
+
+        # the logged bandit data is stored in shared memory only after all the arguments are validated
+        if shared_memory:
+            if not hasattr(self, "shared_columnar_bandit_feedback_"):
+                self.shared_columnar_bandit_feedback_ = (
+                    self._obtain_columnar_bandit_feedback().share_memory()
+                )
+            bandit_feedback = self.shared_columnar_bandit_feedback_
+        else:
+            bandit_feedback = self._obtain_columnar_bandit_feedback()
+        if is_timeseries_split:
+            bandit_feedback = bandit_feedback.split(n_rounds_train)[0]
+        return (
+            BootstrapReplicate(
+                bandit_feedback=bandit_feedback,
+                random_state=int(seed),
+                sample_size=sample_size,
+            )
+            for seed in random_.randint(np.iinfo(np.int32).max, size=n_replicates)
+        )
+
+
+def _count_data_lines(path: Path, block_size: int = 1 << 24) -> int:
+    """Count the lines of a csv file except for the header without parsing it."""
+    n_lines, last_block = 0, b""
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            n_lines += block.count(b"\n")
+            last_block = block
+    if last_block and not last_block.endswith(b"\n"):
+        n_lines += 1
+    return max(n_lines - 1, 0)
+
+
+def _read_item_context(path: Path) -> pd.DataFrame:
+    """Read the item context file, or reuse the one parsed by `OpenBanditDataset.load_multiple`."""
+    item_contexts = getattr(_shared_item_contexts, "item_contexts", None)
+    if item_contexts is not None:
+        item_context = item_contexts.get(str(path.resolve()))
+        if item_context is not None:
+            return item_context
+    return pd.read_csv(path, index_col=0)
+
+
+def _load_with_shared_item_contexts(
+    dataset_cls: type, item_contexts: Dict[str, pd.DataFrame], **kwargs
+) -> OpenBanditDataset:
+    """Load a dataset reusing the parsed item contexts."""
+    _shared_item_contexts.item_contexts = item_contexts
+    try:
+        return dataset_cls(**kwargs)
+    finally:
+        _shared_item_contexts.item_contexts = None
+
+
+def _dummies_to_context(dummies: pd.DataFrame) -> Union[np.ndarray, sparse.csr_matrix]:
+    """Convert one-hot encoded features into context vectors (a CSR matrix when they are sparse)."""
+    if dummies.shape[1] > 0 and all(
+        isinstance(dtype, pd.SparseDtype) for dtype in dummies.dtypes
+    ):
+        return dummies.sparse.to_coo().tocsr()
+    return dummies.values
@@ -3,9 +3,13 @@
 
 """Classification Model Class for Estimating Propensity Score and Importance Weight."""
 from dataclasses import dataclass
+from typing import Iterable
+from typing import List
 from typing import Optional
+from typing import Tuple
 
 import numpy as np
+from scipy import sparse
 from sklearn.base import BaseEstimator
 from sklearn.base import clone
 from sklearn.calibration import CalibratedClassifierCV
@@ -15,13 +19,23 @@ from sklearn.utils import check_scalar
 
 from ..utils import check_array
 from ..utils import check_bandit_feedback_inputs
+from ..utils import concatenate_features
 from ..utils import sample_action_fast
+from .helper import fit_base_models
 
 
 @dataclass
 class ImportanceWeightEstimator(BaseEstimator):
     """Machine learning model to estimate the importance weights induced by the behavior and evaluation policies leveraging  classifier-based density ratio estimation.
 
+    Note
+    -------
+    `context` can be a scipy sparse matrix such as the one-hot user features of Open Bandit Dataset.
+    Then, the training data of the classifier (the logged and evaluation-policy samples) are stacked
+    into a CSR matrix without densifying `context`, and `base_model` must accept sparse inputs.
+    When `context` is dense, the two samples are written into a single preallocated array
+    so that the context block is not copied into intermediate feature arrays before being stacked.
+
     Parameters
     ------------
     base_model: BaseEstimator
@@ -50,6 +64,17 @@ class ImportanceWeightEstimator(BaseEstimator):
         Number of folds in the calibration procedure.
         If calibration_cv <= 1, classification model is not calibrated.
 
+    n_jobs: int, default=1
+        Number of workers fitting the classification models of the positions (and of the folds in the cross-fitting procedure) in parallel.
+        `-1` means using all the available processors.
+        The number of threads of the BLAS and OpenMP libraries in each worker is limited to
+        `cpu_count // n_workers` to avoid oversubscription.
+
+    prefer: str, default='processes'
+        Whether the workers are processes or threads. Must be either 'processes' or 'threads'.
+        Threads avoid copying the training data to the workers and are efficient with base models
+        that release the GIL during fitting.
+
     References
     -----------
     Arjun Sondhi, David Arbour, and Drew Dimmery
@@ -63,12 +88,19 @@ class ImportanceWeightEstimator(BaseEstimator):
     action_context: Optional[np.ndarray] = None
     fitting_method: str = "sample"
     calibration_cv: int = 2
+    n_jobs: int = 1
+    prefer: str = "processes"
 
     def __post_init__(self) -> None:
         """Initialize Class."""
         check_scalar(self.n_actions, "n_actions", int, min_val=2)
         check_scalar(self.len_list, "len_list", int, min_val=1)
         check_scalar(self.calibration_cv, "calibration_cv", int)
+        check_scalar(self.n_jobs, "n_jobs", int)
+        if self.prefer not in ["processes", "threads"]:
+            raise ValueError(
+                f"`prefer` must be either 'processes' or 'threads', but {self.prefer} is given"
+            )
         if not (
             isinstance(self.fitting_method, str)
             and self.fitting_method in ["sample", "raw"]
@@ -133,6 +165,7 @@ class ImportanceWeightEstimator(BaseEstimator):
             reward=np.zeros_like(action),  # use dummy reward
             position=position,
             action_context=self.action_context,
+            accept_sparse=True,
         )
         check_array(array=action_dist, name="action_dist", expected_dim=3)
         n = context.shape[0]
@@ -152,8 +185,28 @@ class ImportanceWeightEstimator(BaseEstimator):
         if not np.allclose(action_dist.sum(axis=1), 1):
             raise ValueError("`action_dist` must be a probability distribution")
 
+        self.base_model_list = self._fit_base_models(
+            self._iter_training_data(
+                context=context,
+                action=action,
+                action_dist=action_dist,
+                position=position,
+                random_state=random_state,
+            ),
+            n_models=self.len_list,
+        )
+
+    def _iter_training_data(
+        self,
+        context: np.ndarray,
+        action: np.ndarray,
+        action_dist: np.ndarray,
+        position: np.ndarray,
+        random_state: Optional[int] = None,
+    ) -> Iterable[Tuple[np.ndarray, np.ndarray, None]]:
+        """Yield the feature vectors and the labels to train the classification model of each position."""
         # If self.fitting_method != "sample", `sampled_action` has no information
-        sampled_action = np.zeros(n, dtype=int)
+        sampled_action = np.zeros(context.shape[0], dtype=int)
         if self.fitting_method == "sample":
             for pos_ in np.arange(self.len_list):
                 idx = position == pos_
@@ -174,7 +227,22 @@ class ImportanceWeightEstimator(BaseEstimator):
             )
             if X.shape[0] == 0:
                 raise ValueError(f"No training data at position {pos_}")
-            self.base_model_list[pos_].fit(X, y)
+            yield X, y, None
+
+    def _fit_base_models(
+        self,
+        training_data: Iterable[Tuple[np.ndarray, np.ndarray, None]],
+        n_models: int,
+    ) -> List[BaseEstimator]:
+        """Fit a clone of the (calibrated) classification model on each training data with `n_jobs` workers."""
+        return fit_base_models(
+            base_model_list=[
+                clone(self.base_model_list[0]) for _ in np.arange(n_models)
+            ],
+            training_data=training_data,
+            n_jobs=self.n_jobs,
+            prefer=self.prefer,
+        )
 
     def predict(
         self,
@@ -271,6 +339,7 @@ class ImportanceWeightEstimator(BaseEstimator):
             reward=np.zeros_like(action),  # use dummy reward
             position=position,
             action_context=self.action_context,
+            accept_sparse=True,
         )
         n = context.shape[0]
 
@@ -306,16 +375,28 @@ class ImportanceWeightEstimator(BaseEstimator):
             estimated_importance_weights = np.zeros(n)
         kf = KFold(n_splits=n_folds, shuffle=True, random_state=random_state)
         kf.get_n_splits(context)
+        folds = list(kf.split(context))
+        # the classification models of all the folds and positions are fitted at once so that they can be fitted in parallel
+        fold_base_model_list = self._fit_base_models(
+            (
+                training_data
+                for train_idx, _ in folds
+                for training_data in self._iter_training_data(
+                    context=context[train_idx],
+                    action=action[train_idx],
+                    action_dist=action_dist[train_idx],
+                    position=position[train_idx],
+                    random_state=random_state,
+                )
+            ),
+            n_models=n_folds * self.len_list,
+        )
         if evaluate_model_performance:
             self.eval_result = {"y": [], "proba": []}
-        for train_idx, test_idx in kf.split(context):
-            self.fit(
-                context=context[train_idx],
-                action=action[train_idx],
-                position=position[train_idx],
-                action_dist=action_dist[train_idx],
-                random_state=random_state,
-            )
+        for k, (_, test_idx) in enumerate(folds):
+            self.base_model_list = fold_base_model_list[
+                k * self.len_list : (k + 1) * self.len_list
+            ]
             estimated_importance_weights[test_idx] = self.predict(
                 context=context[test_idx],
                 action=action[test_idx],
@@ -378,19 +459,37 @@ class ImportanceWeightEstimator(BaseEstimator):
             Actions sampled by evaluation policy for each data at each position.
 
         """
-        behavior_policy_feature = np.c_[context, self.action_context[action]]
+        behavior_action_feature = self.action_context[action]
         if is_prediction:
-            return behavior_policy_feature, None
+            return concatenate_features([context, behavior_action_feature]), None
         if self.fitting_method == "raw":
-            evaluation_policy_feature = np.c_[context, action_dist_at_pos]
+            evaluation_action_feature = action_dist_at_pos
         elif self.fitting_method == "sample":
-            evaluation_policy_feature = np.c_[
-                context, self.action_context[sampled_action_at_position]
-            ]
-        X = np.copy(behavior_policy_feature)
-        y = np.zeros(X.shape[0], dtype=int)
-        X = np.r_[X, evaluation_policy_feature]
-        y = np.r_[y, np.ones(evaluation_policy_feature.shape[0], dtype=int)]
+            evaluation_action_feature = self.action_context[sampled_action_at_position]
+        n_rounds = context.shape[0]
+        y = np.repeat(np.array([0, 1]), n_rounds)
+        if sparse.issparse(context):
+            X = concatenate_features(
+                [
+                    concatenate_features([context, behavior_action_feature]),
+                    concatenate_features([context, evaluation_action_feature]),
+                ],
+                axis=0,
+            )
+            return X, y
+        # write the logged and evaluation-policy samples into a single array
+        # instead of stacking two concatenated copies of the context block
+        dim_context = context.shape[1]
+        X = np.empty(
+            (2 * n_rounds, dim_context + behavior_action_feature.shape[1]),
+            dtype=np.result_type(
+                context, behavior_action_feature, evaluation_action_feature
+            ),
+        )
+        X[:n_rounds, :dim_context] = context
+        X[n_rounds:, :dim_context] = context
+        X[:n_rounds, dim_context:] = behavior_action_feature
+        X[n_rounds:, dim_context:] = evaluation_action_feature
         return X, y
 
 
@@ -398,6 +497,10 @@ class ImportanceWeightEstimator(BaseEstimator):
 class PropensityScoreEstimator(BaseEstimator):
     """Machine learning model to estimate propensity scores (:math:`\\pi_{b}(a|x)`).
 
+    Note
+    -------
+    `context` can be a scipy sparse matrix, which is passed to `base_model` as it is.
+
     Parameters
     ------------
     base_model: BaseEstimator
@@ -414,6 +517,17 @@ class PropensityScoreEstimator(BaseEstimator):
         Number of folds in the calibration procedure.
         If calibration_cv <= 1, calibration will not be applied.
 
+    n_jobs: int, default=1
+        Number of workers fitting the classification models of the positions (and of the folds in the cross-fitting procedure) in parallel.
+        `-1` means using all the available processors.
+        The number of threads of the BLAS and OpenMP libraries in each worker is limited to
+        `cpu_count // n_workers` to avoid oversubscription.
+
+    prefer: str, default='processes'
+        Whether the workers are processes or threads. Must be either 'processes' or 'threads'.
+        Threads avoid copying the training data to the workers and are efficient with base models
+        that release the GIL during fitting.
+
     References
     -----------
     Arjun Sondhi, David Arbour, and Drew Dimmery
@@ -425,12 +539,19 @@ class PropensityScoreEstimator(BaseEstimator):
     n_actions: int
     len_list: int = 1
     calibration_cv: int = 2
+    n_jobs: int = 1
+    prefer: str = "processes"
 
     def __post_init__(self) -> None:
         """Initialize Class."""
         check_scalar(self.n_actions, "n_actions", int, min_val=2)
         check_scalar(self.len_list, "len_list", int, min_val=1)
         check_scalar(self.calibration_cv, "calibration_cv", int)
+        check_scalar(self.n_jobs, "n_jobs", int)
+        if self.prefer not in ["processes", "threads"]:
+            raise ValueError(
+                f"`prefer` must be either 'processes' or 'threads', but {self.prefer} is given"
+            )
         if not isinstance(self.base_model, BaseEstimator):
             raise ValueError(
                 "`base_model` must be BaseEstimator or a child class of BaseEstimator"
@@ -478,6 +599,7 @@ class PropensityScoreEstimator(BaseEstimator):
             reward=np.zeros_like(action),  # use dummy reward
             position=position,
             action_context=np.eye(self.n_actions, dtype=int),
+            accept_sparse=True,
         )
 
         if position is None or self.len_list == 1:
@@ -488,11 +610,42 @@ class PropensityScoreEstimator(BaseEstimator):
                     f"`position` elements must be smaller than `len_list`, but the maximum value is {position.max()} (>= {self.len_list})"
                 )
 
+        self.base_model_list = self._fit_base_models(
+            self._iter_training_data(
+                context=context,
+                action=action,
+                position=position,
+            ),
+            n_models=self.len_list,
+        )
+
+    def _iter_training_data(
+        self,
+        context: np.ndarray,
+        action: np.ndarray,
+        position: np.ndarray,
+    ) -> Iterable[Tuple[np.ndarray, np.ndarray, None]]:
+        """Yield the contexts and the actions to train the classification model of each position."""
         for pos_ in np.arange(self.len_list):
             idx = position == pos_
             if context[idx].shape[0] == 0:
                 raise ValueError(f"No training data at position {pos_}")
-            self.base_model_list[pos_].fit(context[idx], action[idx])
+            yield context[idx], action[idx], None
+
+    def _fit_base_models(
+        self,
+        training_data: Iterable[Tuple[np.ndarray, np.ndarray, None]],
+        n_models: int,
+    ) -> List[BaseEstimator]:
+        """Fit a clone of the (calibrated) classification model on each training data with `n_jobs` workers."""
+        return fit_base_models(
+            base_model_list=[
+                clone(self.base_model_list[0]) for _ in np.arange(n_models)
+            ],
+            training_data=training_data,
+            n_jobs=self.n_jobs,
+            prefer=self.prefer,
+        )
 
     def predict(
         self,
@@ -584,6 +737,7 @@ class PropensityScoreEstimator(BaseEstimator):
             reward=np.zeros_like(action),  # use dummy reward
             position=position,
             action_context=np.eye(self.n_actions, dtype=int),
+            accept_sparse=True,
         )
         if position is None or self.len_list == 1:
             position = np.zeros_like(action)
@@ -606,15 +760,26 @@ class PropensityScoreEstimator(BaseEstimator):
             estimated_pscore = np.zeros(context.shape[0])
         kf = KFold(n_splits=n_folds, shuffle=True, random_state=random_state)
         kf.get_n_splits(context)
+        folds = list(kf.split(context))
+        # the classification models of all the folds and positions are fitted at once so that they can be fitted in parallel
+        fold_base_model_list = self._fit_base_models(
+            (
+                training_data
+                for train_idx, _ in folds
+                for training_data in self._iter_training_data(
+                    context=context[train_idx],
+                    action=action[train_idx],
+                    position=position[train_idx],
+                )
+            ),
+            n_models=n_folds * self.len_list,
+        )
         if evaluate_model_performance:
             self.eval_result = {"y": [], "proba": []}
-        for train_idx, test_idx in kf.split(context):
-            self.fit(
-                context=context[train_idx],
-                action=action[train_idx],
-                position=position[train_idx],
-            )
-
+        for k, (_, test_idx) in enumerate(folds):
+            self.base_model_list = fold_base_model_list[
+                k * self.len_list : (k + 1) * self.len_list
+            ]
             estimated_pscore[test_idx] = self.predict(
                 context=context[test_idx],
                 action=action[test_idx],
@@ -7,15 +7,22 @@ from abc import abstractmethod
 from dataclasses import dataclass
 from typing import Dict
 from typing import Optional
+from typing import Tuple
+from typing import Union
 
 import numpy as np
 from sklearn.utils import check_scalar
 
+from ..types import SparseActionDist
+from ..utils import average_over_action_dist
 from ..utils import check_array
+from ..utils import check_estimated_rewards_by_reg_model
 from ..utils import check_ope_inputs
-from ..utils import estimate_confidence_interval_by_bootstrap
+from ..utils import take_factual_action_dist
 from .helper import estimate_bias_in_ope
+from .helper import estimate_confidence_interval
 from .helper import estimate_high_probability_upper_bound_bias
+from .helper import RoundRewardStatistics
 
 
 @dataclass
@@ -34,9 +41,104 @@ class BaseOffPolicyEstimator(metaclass=ABCMeta):
 
     @abstractmethod
     def estimate_interval(self) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap."""
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method."""
         raise NotImplementedError
 
+    def _estimate_round_reward_components(
+        self, **kwargs
+    ) -> Tuple[np.ndarray, Optional[np.ndarray], Optional[np.ndarray]]:
+        """Decompose the round-wise rewards into :math:`(a_i, b_i, c_i)` such that they are :math:`a_i + b_i / \\mathbb{E}_{n}[c_i]`.
+
+        Estimators without self-normalization return the round-wise rewards as :math:`a_i` and None for the others.
+        See `obp.ope.helper.RoundRewardStatistics` for details.
+
+        """
+        return self._estimate_round_rewards(**kwargs), None, None
+
+    def _update_round_reward_statistics(self, **kwargs) -> "BaseOffPolicyEstimator":
+        """Accumulate the sufficient statistics of the round-wise rewards estimated on a chunk of logged bandit data."""
+        round_reward_statistics = RoundRewardStatistics.from_components(
+            *self._estimate_round_reward_components(**kwargs)
+        )
+        if hasattr(self, "round_reward_statistics_"):
+            round_reward_statistics = self.round_reward_statistics_.merge(
+                round_reward_statistics
+            )
+        self.round_reward_statistics_ = round_reward_statistics
+        return self
+
+    def _check_round_reward_statistics(self) -> None:
+        """Check that the sufficient statistics of the round-wise rewards have been accumulated."""
+        if not hasattr(self, "round_reward_statistics_"):
+            raise ValueError(
+                "This estimator has not accumulated any data yet. Call `partial_fit` first."
+            )
+
+    def merge(self, other: "BaseOffPolicyEstimator") -> "BaseOffPolicyEstimator":
+        """Merge the sufficient statistics accumulated by another estimator via `partial_fit`.
+
+        Parameters
+        ----------
+        other: BaseOffPolicyEstimator
+            Estimator of the same class with the same hyperparameters that accumulated disjoint chunks of logged bandit data,
+            e.g., in another worker process.
+
+        Returns
+        ----------
+        self: BaseOffPolicyEstimator
+            Estimator accumulating the data of both estimators.
+
+        """
+        if type(other) is not type(self) or other != self:
+            raise ValueError(
+                "`other` must be an estimator of the same class with the same hyperparameters"
+            )
+        other._check_round_reward_statistics()
+        if hasattr(self, "round_reward_statistics_"):
+            self.round_reward_statistics_ = self.round_reward_statistics_.merge(
+                other.round_reward_statistics_
+            )
+        else:
+            self.round_reward_statistics_ = other.round_reward_statistics_
+        return self
+
+    def estimate_policy_value_from_statistics(self) -> float:
+        """Estimate the policy value of evaluation policy from the statistics accumulated by `partial_fit` and `merge`.
+
+        Returns
+        ----------
+        V_hat: float
+            Estimated policy value of evaluation policy.
+
+        """
+        self._check_round_reward_statistics()
+        return self.round_reward_statistics_.estimate_mean()
+
+    def estimate_interval_from_statistics(
+        self, alpha: float = 0.05, ci_method: str = "normal"
+    ) -> Dict[str, float]:
+        """Estimate the confidence interval of the policy value from the statistics accumulated by `partial_fit` and `merge`.
+
+        Parameters
+        ----------
+        alpha: float, default=0.05
+            Significance level.
+
+        ci_method: str, default='normal'
+            Method to estimate the confidence interval, which must be one of 'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            The resampling methods are not available as they need the round-wise rewards themselves.
+
+        Returns
+        ----------
+        estimated_confidence_interval: Dict[str, float]
+            Dictionary storing the estimated mean and upper-lower confidence bounds.
+
+        """
+        self._check_round_reward_statistics()
+        return self.round_reward_statistics_.estimate_interval(
+            alpha=alpha, ci_method=ci_method
+        )
+
 
 @dataclass
 class ReplayMethod(BaseOffPolicyEstimator):
@@ -74,7 +176,7 @@ class ReplayMethod(BaseOffPolicyEstimator):
         self,
         reward: np.ndarray,
         action: np.ndarray,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         position: Optional[np.ndarray] = None,
         **kwargs,
     ) -> np.ndarray:
@@ -88,7 +190,7 @@ class ReplayMethod(BaseOffPolicyEstimator):
         action: array-like, shape (n_rounds,)
             Actions sampled by the logging/behavior policy for each data in logged bandit data, i.e., :math:`a_i`.
 
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         position: array-like, shape (n_rounds,), default=None
@@ -106,18 +208,38 @@ class ReplayMethod(BaseOffPolicyEstimator):
             position = np.zeros(action_dist.shape[0], dtype=int)
 
         action_match = np.array(
-            action_dist[np.arange(action.shape[0]), action, position] == 1
+            take_factual_action_dist(
+                action_dist=action_dist, action=action, position=position
+            )
+            == 1
         )
         estimated_rewards = np.zeros_like(action_match)
         if action_match.sum() > 0.0:
             estimated_rewards = action_match * reward / action_match.mean()
         return estimated_rewards
 
+    def _estimate_round_reward_components(
+        self,
+        reward: np.ndarray,
+        action: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
+        position: np.ndarray,
+        **kwargs,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Decompose the round-wise rewards normalized by the frequency of action matches."""
+        action_match = (
+            take_factual_action_dist(
+                action_dist=action_dist, action=action, position=position
+            )
+            == 1
+        )
+        return np.zeros(action.shape[0]), action_match * reward, action_match
+
     def estimate_policy_value(
         self,
         reward: np.ndarray,
         action: np.ndarray,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         position: Optional[np.ndarray] = None,
         **kwargs,
     ) -> float:
@@ -131,7 +253,7 @@ class ReplayMethod(BaseOffPolicyEstimator):
         action: array-like, shape (n_rounds,)
             Actions sampled by the logging/behavior policy for each data in logged bandit data, i.e., :math:`a_i`.
 
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         position: array-like, shape (n_rounds,), default=None
@@ -164,14 +286,15 @@ class ReplayMethod(BaseOffPolicyEstimator):
         self,
         reward: np.ndarray,
         action: np.ndarray,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         position: Optional[np.ndarray] = None,
         alpha: float = 0.05,
         n_bootstrap_samples: int = 100,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -181,7 +304,7 @@ class ReplayMethod(BaseOffPolicyEstimator):
         action: array-like, shape (n_rounds,)
             Actions sampled by the logging/behavior policy for each data in logged bandit data, i.e., :math:`a_i`.
 
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         position: array-like, shape (n_rounds,), default=None
@@ -198,6 +321,11 @@ class ReplayMethod(BaseOffPolicyEstimator):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
@@ -218,11 +346,63 @@ class ReplayMethod(BaseOffPolicyEstimator):
             position=position,
             action_dist=action_dist,
         )
-        return estimate_confidence_interval_by_bootstrap(
+        return estimate_confidence_interval(
             samples=estimated_round_rewards,
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
+        )
+
+    def partial_fit(
+        self,
+        reward: np.ndarray,
+        action: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
+        position: Optional[np.ndarray] = None,
+        **kwargs,
+    ) -> "ReplayMethod":
+        """Accumulate the sufficient statistics of the round-wise rewards on a chunk of logged bandit data.
+
+        Call this method on each chunk (e.g., an hourly partition of the logs) and then use
+        `estimate_policy_value_from_statistics` and `estimate_interval_from_statistics`.
+        The estimates are computed in constant memory with respect to the total number of rounds.
+
+        Parameters
+        ------------
+        reward: array-like, shape (n_rounds,)
+            Rewards observed for each data in logged bandit data, i.e., :math:`r_i`.
+
+        action: array-like, shape (n_rounds,)
+            Actions sampled by the logging/behavior policy for each data in logged bandit data, i.e., :math:`a_i`.
+
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
+            Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
+
+        position: array-like, shape (n_rounds,), default=None
+            Indices to differentiate positions in a recommendation interface where the actions are presented.
+            If None, the effect of position on the reward will be ignored.
+            (If only a single action is chosen for each data, you can just ignore this argument.)
+
+        Returns
+        ----------
+        self: ReplayMethod
+            Estimator accumulating the given chunk.
+
+        """
+        check_array(array=reward, name="reward", expected_dim=1)
+        check_array(array=action, name="action", expected_dim=1)
+        check_ope_inputs(
+            action_dist=action_dist, position=position, action=action, reward=reward
+        )
+        if position is None:
+            position = np.zeros(action_dist.shape[0], dtype=int)
+
+        return self._update_round_reward_statistics(
+            reward=reward,
+            action=action,
+            position=position,
+            action_dist=action_dist,
         )
 
 
@@ -297,7 +477,7 @@ class InverseProbabilityWeighting(BaseOffPolicyEstimator):
         reward: np.ndarray,
         action: np.ndarray,
         pscore: np.ndarray,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         position: Optional[np.ndarray] = None,
         **kwargs,
     ) -> np.ndarray:
@@ -314,7 +494,7 @@ class InverseProbabilityWeighting(BaseOffPolicyEstimator):
         pscore: array-like, shape (n_rounds,)
             Action choice probabilities of the logging/behavior policy (propensity scores), i.e., :math:`\\pi_b(a_i|x_i)`.
 
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         position: array-like, shape (n_rounds,), default=None
@@ -331,7 +511,7 @@ class InverseProbabilityWeighting(BaseOffPolicyEstimator):
         if position is None:
             position = np.zeros(action_dist.shape[0], dtype=int)
 
-        iw = action_dist[np.arange(action.shape[0]), action, position] / pscore
+        iw = take_factual_action_dist(action_dist, action, position) / pscore
         # weight clipping
         if isinstance(iw, np.ndarray):
             iw = np.minimum(iw, self.lambda_)
@@ -341,7 +521,7 @@ class InverseProbabilityWeighting(BaseOffPolicyEstimator):
         self,
         reward: np.ndarray,
         action: np.ndarray,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         pscore: Optional[np.ndarray] = None,
         position: Optional[np.ndarray] = None,
         estimated_pscore: Optional[np.ndarray] = None,
@@ -357,7 +537,7 @@ class InverseProbabilityWeighting(BaseOffPolicyEstimator):
         action: array-like, shape (n_rounds,)
             Actions sampled by the logging/behavior policy for each data in logged bandit data, i.e., :math:`a_i`.
 
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         pscore: array-like, shape (n_rounds,), default=None
@@ -410,16 +590,17 @@ class InverseProbabilityWeighting(BaseOffPolicyEstimator):
         self,
         reward: np.ndarray,
         action: np.ndarray,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         pscore: Optional[np.ndarray] = None,
         position: Optional[np.ndarray] = None,
         estimated_pscore: Optional[np.ndarray] = None,
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -429,7 +610,7 @@ class InverseProbabilityWeighting(BaseOffPolicyEstimator):
         action: array-like, shape (n_rounds,)
             Actions sampled by the logging/behavior policy for each data in logged bandit data, i.e., :math:`a_i`.
 
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         pscore: array-like, shape (n_rounds,), default=None
@@ -454,6 +635,11 @@ class InverseProbabilityWeighting(BaseOffPolicyEstimator):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
@@ -486,11 +672,85 @@ class InverseProbabilityWeighting(BaseOffPolicyEstimator):
             pscore=pscore_,
             action_dist=action_dist,
         )
-        return estimate_confidence_interval_by_bootstrap(
+        return estimate_confidence_interval(
             samples=estimated_round_rewards,
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
+        )
+
+    def partial_fit(
+        self,
+        reward: np.ndarray,
+        action: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
+        pscore: Optional[np.ndarray] = None,
+        position: Optional[np.ndarray] = None,
+        estimated_pscore: Optional[np.ndarray] = None,
+        **kwargs,
+    ) -> "InverseProbabilityWeighting":
+        """Accumulate the sufficient statistics of the round-wise rewards on a chunk of logged bandit data.
+
+        Call this method on each chunk (e.g., an hourly partition of the logs) and then use
+        `estimate_policy_value_from_statistics` and `estimate_interval_from_statistics`.
+        The estimates are computed in constant memory with respect to the total number of rounds.
+
+        Parameters
+        ----------
+        reward: array-like, shape (n_rounds,)
+            Rewards observed for each data in logged bandit data, i.e., :math:`r_i`.
+
+        action: array-like, shape (n_rounds,)
+            Actions sampled by the logging/behavior policy for each data in logged bandit data, i.e., :math:`a_i`.
+
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
+            Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
+
+        pscore: array-like, shape (n_rounds,), default=None
+            Action choice probabilities of the logging/behavior policy (propensity scores), i.e., :math:`\\pi_b(a_i|x_i)`.
+            If `use_estimated_pscore` is False, `pscore` must be given.
+
+        position: array-like, shape (n_rounds,), default=None
+            Indices to differentiate positions in a recommendation interface where the actions are presented.
+            If None, the effect of position on the reward will be ignored.
+            (If only a single action is chosen for each data, you can just ignore this argument.)
+
+        estimated_pscore: array-like, shape (n_rounds,), default=None
+            Estimated behavior policy (propensity scores), i.e., :math:`\\hat{\\pi}_b(a_i|x_i)`.
+            If `self.use_estimated_pscore` is True, `estimated_pscore` must be given.
+
+        Returns
+        ----------
+        self: InverseProbabilityWeighting
+            Estimator accumulating the given chunk.
+
+        """
+        check_array(array=reward, name="reward", expected_dim=1)
+        check_array(array=action, name="action", expected_dim=1)
+        if self.use_estimated_pscore:
+            check_array(array=estimated_pscore, name="estimated_pscore", expected_dim=1)
+            pscore_ = estimated_pscore
+        else:
+            check_array(array=pscore, name="pscore", expected_dim=1)
+            pscore_ = pscore
+
+        check_ope_inputs(
+            action_dist=action_dist,
+            position=position,
+            action=action,
+            reward=reward,
+            pscore=pscore_,
+        )
+        if position is None:
+            position = np.zeros(action_dist.shape[0], dtype=int)
+
+        return self._update_round_reward_statistics(
+            reward=reward,
+            action=action,
+            position=position,
+            pscore=pscore_,
+            action_dist=action_dist,
         )
 
     def _estimate_mse_score(
@@ -498,7 +758,7 @@ class InverseProbabilityWeighting(BaseOffPolicyEstimator):
         reward: np.ndarray,
         action: np.ndarray,
         pscore: np.ndarray,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         position: Optional[np.ndarray] = None,
         use_bias_upper_bound: bool = True,
         delta: float = 0.05,
@@ -517,7 +777,7 @@ class InverseProbabilityWeighting(BaseOffPolicyEstimator):
         pscore: array-like, shape (n_rounds,)
             Action choice probabilities of the logging/behavior policy (propensity scores), i.e., :math:`\\pi_b(a_i|x_i)`.
 
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         position: array-like, shape (n_rounds,), default=None
@@ -555,7 +815,7 @@ class InverseProbabilityWeighting(BaseOffPolicyEstimator):
         sample_variance /= n
 
         # estimate the (high probability) upper bound of the bias of IPW with clipping
-        iw = action_dist[np.arange(n), action, position] / pscore
+        iw = take_factual_action_dist(action_dist, action, position) / pscore
         if use_bias_upper_bound:
             bias_term = estimate_high_probability_upper_bound_bias(
                 reward=reward, iw=iw, iw_hat=np.minimum(iw, self.lambda_), delta=delta
@@ -618,7 +878,7 @@ class SelfNormalizedInverseProbabilityWeighting(InverseProbabilityWeighting):
         reward: np.ndarray,
         action: np.ndarray,
         pscore: np.ndarray,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         position: Optional[np.ndarray] = None,
         **kwargs,
     ) -> np.ndarray:
@@ -635,7 +895,7 @@ class SelfNormalizedInverseProbabilityWeighting(InverseProbabilityWeighting):
         pscore: array-like, shape (n_rounds,)
             Action choice probabilities of the logging/behavior policy (propensity scores), i.e., :math:`\\pi_b(a_i|x_i)`.
 
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         position: array-like, shape (n_rounds,), default=None
@@ -652,9 +912,22 @@ class SelfNormalizedInverseProbabilityWeighting(InverseProbabilityWeighting):
         if position is None:
             position = np.zeros(action_dist.shape[0], dtype=int)
 
-        iw = action_dist[np.arange(action.shape[0]), action, position] / pscore
+        iw = take_factual_action_dist(action_dist, action, position) / pscore
         return reward * iw / iw.mean()
 
+    def _estimate_round_reward_components(
+        self,
+        reward: np.ndarray,
+        action: np.ndarray,
+        pscore: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
+        position: np.ndarray,
+        **kwargs,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Decompose the round-wise rewards normalized by the mean of the importance weights."""
+        iw = take_factual_action_dist(action_dist, action, position) / pscore
+        return np.zeros(action.shape[0]), reward * iw, iw
+
 
 @dataclass
 class DirectMethod(BaseOffPolicyEstimator):
@@ -702,7 +975,7 @@ class DirectMethod(BaseOffPolicyEstimator):
 
     def _estimate_round_rewards(
         self,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         estimated_rewards_by_reg_model: np.ndarray,
         position: Optional[np.ndarray] = None,
         **kwargs,
@@ -711,7 +984,7 @@ class DirectMethod(BaseOffPolicyEstimator):
 
         Parameters
         ----------
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         estimated_rewards_by_reg_model: array-like, shape (n_rounds, n_actions, len_list)
@@ -731,18 +1004,15 @@ class DirectMethod(BaseOffPolicyEstimator):
         if position is None:
             position = np.zeros(action_dist.shape[0], dtype=int)
 
-        n = position.shape[0]
-        q_hat_at_position = estimated_rewards_by_reg_model[np.arange(n), :, position]
-        pi_e_at_position = action_dist[np.arange(n), :, position]
-        return np.average(
-            q_hat_at_position,
-            weights=pi_e_at_position,
-            axis=1,
+        return average_over_action_dist(
+            values=estimated_rewards_by_reg_model,
+            action_dist=action_dist,
+            position=position,
         )
 
     def estimate_policy_value(
         self,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         estimated_rewards_by_reg_model: np.ndarray,
         position: Optional[np.ndarray] = None,
         **kwargs,
@@ -751,7 +1021,7 @@ class DirectMethod(BaseOffPolicyEstimator):
 
         Parameters
         ----------
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         estimated_rewards_by_reg_model: array-like, shape (n_rounds, n_actions, len_list)
@@ -768,11 +1038,7 @@ class DirectMethod(BaseOffPolicyEstimator):
             Estimated policy value of evaluation policy.
 
         """
-        check_array(
-            array=estimated_rewards_by_reg_model,
-            name="estimated_rewards_by_reg_model",
-            expected_dim=3,
-        )
+        check_estimated_rewards_by_reg_model(estimated_rewards_by_reg_model)
         check_ope_inputs(
             action_dist=action_dist,
             estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
@@ -789,19 +1055,20 @@ class DirectMethod(BaseOffPolicyEstimator):
 
     def estimate_interval(
         self,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         estimated_rewards_by_reg_model: np.ndarray,
         position: Optional[np.ndarray] = None,
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         estimated_rewards_by_reg_model: array-like, shape (n_rounds, n_actions, len_list)
@@ -821,17 +1088,18 @@ class DirectMethod(BaseOffPolicyEstimator):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
             Dictionary storing the estimated mean and upper-lower confidence bounds.
 
         """
-        check_array(
-            array=estimated_rewards_by_reg_model,
-            name="estimated_rewards_by_reg_model",
-            expected_dim=3,
-        )
+        check_estimated_rewards_by_reg_model(estimated_rewards_by_reg_model)
         check_ope_inputs(
             action_dist=action_dist,
             estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
@@ -845,11 +1113,59 @@ class DirectMethod(BaseOffPolicyEstimator):
             estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
             action_dist=action_dist,
         )
-        return estimate_confidence_interval_by_bootstrap(
+        return estimate_confidence_interval(
             samples=estimated_round_rewards,
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
+        )
+
+    def partial_fit(
+        self,
+        action_dist: Union[np.ndarray, SparseActionDist],
+        estimated_rewards_by_reg_model: np.ndarray,
+        position: Optional[np.ndarray] = None,
+        **kwargs,
+    ) -> "DirectMethod":
+        """Accumulate the sufficient statistics of the round-wise rewards on a chunk of logged bandit data.
+
+        Call this method on each chunk (e.g., an hourly partition of the logs) and then use
+        `estimate_policy_value_from_statistics` and `estimate_interval_from_statistics`.
+        The estimates are computed in constant memory with respect to the total number of rounds.
+
+        Parameters
+        ----------
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
+            Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
+
+        estimated_rewards_by_reg_model: array-like, shape (n_rounds, n_actions, len_list)
+            Estimated expected rewards given context, action, and position, i.e., :math:`\\hat{q}(x_i,a_i)`.
+
+        position: array-like, shape (n_rounds,), default=None
+            Indices to differentiate positions in a recommendation interface where the actions are presented.
+            If None, the effect of position on the reward will be ignored.
+            (If only a single action is chosen for each data, you can just ignore this argument.)
+
+        Returns
+        ----------
+        self: DirectMethod
+            Estimator accumulating the given chunk.
+
+        """
+        check_estimated_rewards_by_reg_model(estimated_rewards_by_reg_model)
+        check_ope_inputs(
+            action_dist=action_dist,
+            estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
+            position=position,
+        )
+        if position is None:
+            position = np.zeros(action_dist.shape[0], dtype=int)
+
+        return self._update_round_reward_statistics(
+            position=position,
+            estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
+            action_dist=action_dist,
         )
 
 
@@ -939,7 +1255,7 @@ class DoublyRobust(BaseOffPolicyEstimator):
         reward: np.ndarray,
         action: np.ndarray,
         pscore: np.ndarray,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         estimated_rewards_by_reg_model: np.ndarray,
         position: Optional[np.ndarray] = None,
         **kwargs,
@@ -957,7 +1273,7 @@ class DoublyRobust(BaseOffPolicyEstimator):
         pscore: array-like, shape (n_rounds,)
             Action choice probabilities of the logging/behavior policy (propensity scores), i.e., :math:`\\pi_b(a_i|x_i)`.
 
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         estimated_rewards_by_reg_model: array-like, shape (n_rounds, n_actions, len_list)
@@ -978,18 +1294,16 @@ class DoublyRobust(BaseOffPolicyEstimator):
             position = np.zeros(action_dist.shape[0], dtype=int)
 
         n = action.shape[0]
-        iw = action_dist[np.arange(n), action, position] / pscore
+        iw = take_factual_action_dist(action_dist, action, position) / pscore
         # weight clipping
         if isinstance(iw, np.ndarray):
             iw = np.minimum(iw, self.lambda_)
 
-        q_hat_at_position = estimated_rewards_by_reg_model[np.arange(n), :, position]
         q_hat_factual = estimated_rewards_by_reg_model[np.arange(n), action, position]
-        pi_e_at_position = action_dist[np.arange(n), :, position]
-        estimated_rewards = np.average(
-            q_hat_at_position,
-            weights=pi_e_at_position,
-            axis=1,
+        estimated_rewards = average_over_action_dist(
+            values=estimated_rewards_by_reg_model,
+            action_dist=action_dist,
+            position=position,
         )
         estimated_rewards += iw * (reward - q_hat_factual)
 
@@ -999,7 +1313,7 @@ class DoublyRobust(BaseOffPolicyEstimator):
         self,
         reward: np.ndarray,
         action: np.ndarray,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         estimated_rewards_by_reg_model: np.ndarray,
         pscore: Optional[np.ndarray] = None,
         position: Optional[np.ndarray] = None,
@@ -1016,7 +1330,7 @@ class DoublyRobust(BaseOffPolicyEstimator):
         action: array-like, shape (n_rounds,)
             Actions sampled by the logging/behavior policy for each data in logged bandit data, i.e., :math:`a_i`.
 
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         estimated_rewards_by_reg_model: array-like, shape (n_rounds, n_actions, len_list)
@@ -1041,11 +1355,7 @@ class DoublyRobust(BaseOffPolicyEstimator):
             Estimated policy value of evaluation policy.
 
         """
-        check_array(
-            array=estimated_rewards_by_reg_model,
-            name="estimated_rewards_by_reg_model",
-            expected_dim=3,
-        )
+        check_estimated_rewards_by_reg_model(estimated_rewards_by_reg_model)
         check_array(array=reward, name="reward", expected_dim=1)
         check_array(array=action, name="action", expected_dim=1)
         if self.use_estimated_pscore:
@@ -1078,7 +1388,7 @@ class DoublyRobust(BaseOffPolicyEstimator):
         self,
         reward: np.ndarray,
         action: np.ndarray,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         estimated_rewards_by_reg_model: np.ndarray,
         pscore: Optional[np.ndarray] = None,
         position: Optional[np.ndarray] = None,
@@ -1086,9 +1396,10 @@ class DoublyRobust(BaseOffPolicyEstimator):
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -1098,7 +1409,7 @@ class DoublyRobust(BaseOffPolicyEstimator):
         action: array-like, shape (n_rounds,)
             Actions sampled by the logging/behavior policy for each data in logged bandit data, i.e., :math:`a_i`.
 
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         estimated_rewards_by_reg_model: array-like, shape (n_rounds, n_actions, len_list)
@@ -1126,17 +1437,18 @@ class DoublyRobust(BaseOffPolicyEstimator):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
             Dictionary storing the estimated mean and upper-lower confidence bounds.
 
         """
-        check_array(
-            array=estimated_rewards_by_reg_model,
-            name="estimated_rewards_by_reg_model",
-            expected_dim=3,
-        )
+        check_estimated_rewards_by_reg_model(estimated_rewards_by_reg_model)
         check_array(array=reward, name="reward", expected_dim=1)
         check_array(array=action, name="action", expected_dim=1)
         if self.use_estimated_pscore:
@@ -1164,11 +1476,91 @@ class DoublyRobust(BaseOffPolicyEstimator):
             action_dist=action_dist,
             estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
         )
-        return estimate_confidence_interval_by_bootstrap(
+        return estimate_confidence_interval(
             samples=estimated_round_rewards,
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
+        )
+
+    def partial_fit(
+        self,
+        reward: np.ndarray,
+        action: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
+        estimated_rewards_by_reg_model: np.ndarray,
+        pscore: Optional[np.ndarray] = None,
+        position: Optional[np.ndarray] = None,
+        estimated_pscore: Optional[np.ndarray] = None,
+        **kwargs,
+    ) -> "DoublyRobust":
+        """Accumulate the sufficient statistics of the round-wise rewards on a chunk of logged bandit data.
+
+        Call this method on each chunk (e.g., an hourly partition of the logs) and then use
+        `estimate_policy_value_from_statistics` and `estimate_interval_from_statistics`.
+        The estimates are computed in constant memory with respect to the total number of rounds.
+
+        Parameters
+        ----------
+        reward: array-like, shape (n_rounds,)
+            Rewards observed for each data in logged bandit data, i.e., :math:`r_i`.
+
+        action: array-like, shape (n_rounds,)
+            Actions sampled by the logging/behavior policy for each data in logged bandit data, i.e., :math:`a_i`.
+
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
+            Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
+
+        estimated_rewards_by_reg_model: array-like, shape (n_rounds, n_actions, len_list)
+            Estimated expected rewards given context, action, and position, i.e., :math:`\\hat{q}(x_i,a_i)`.
+
+        pscore: array-like, shape (n_rounds,), default=None
+            Action choice probabilities of the logging/behavior policy (propensity scores), i.e., :math:`\\pi_b(a_i|x_i)`.
+            If `use_estimated_pscore` is False, `pscore` must be given.
+
+        position: array-like, shape (n_rounds,), default=None
+            Indices to differentiate positions in a recommendation interface where the actions are presented.
+            If None, the effect of position on the reward will be ignored.
+            (If only a single action is chosen for each data, you can just ignore this argument.)
+
+        estimated_pscore: array-like, shape (n_rounds,), default=None
+            Estimated behavior policy (propensity scores), i.e., :math:`\\hat{\\pi}_b(a_i|x_i)`.
+            If `self.use_estimated_pscore` is True, `estimated_pscore` must be given.
+
+        Returns
+        ----------
+        self: DoublyRobust
+            Estimator accumulating the given chunk.
+
+        """
+        check_estimated_rewards_by_reg_model(estimated_rewards_by_reg_model)
+        check_array(array=reward, name="reward", expected_dim=1)
+        check_array(array=action, name="action", expected_dim=1)
+        if self.use_estimated_pscore:
+            check_array(array=estimated_pscore, name="estimated_pscore", expected_dim=1)
+            pscore_ = estimated_pscore
+        else:
+            check_array(array=pscore, name="pscore", expected_dim=1)
+            pscore_ = pscore
+        check_ope_inputs(
+            action_dist=action_dist,
+            position=position,
+            action=action,
+            reward=reward,
+            pscore=pscore_,
+            estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
+        )
+        if position is None:
+            position = np.zeros(action_dist.shape[0], dtype=int)
+
+        return self._update_round_reward_statistics(
+            reward=reward,
+            action=action,
+            position=position,
+            pscore=pscore_,
+            action_dist=action_dist,
+            estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
         )
 
     def _estimate_mse_score(
@@ -1176,7 +1568,7 @@ class DoublyRobust(BaseOffPolicyEstimator):
         reward: np.ndarray,
         action: np.ndarray,
         pscore: np.ndarray,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         estimated_rewards_by_reg_model: np.ndarray,
         position: Optional[np.ndarray] = None,
         use_bias_upper_bound: bool = True,
@@ -1195,7 +1587,7 @@ class DoublyRobust(BaseOffPolicyEstimator):
         pscore: array-like, shape (n_rounds,)
             Action choice probabilities of the logging/behavior policy (propensity scores), i.e., :math:`\\pi_b(a_i|x_i)`.
 
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         position: array-like, shape (n_rounds,), default=None
@@ -1237,7 +1629,7 @@ class DoublyRobust(BaseOffPolicyEstimator):
         sample_variance /= n
 
         # estimate the (high probability) upper bound of the bias of DR with clipping
-        iw = action_dist[np.arange(n), action, position] / pscore
+        iw = take_factual_action_dist(action_dist, action, position) / pscore
         if use_bias_upper_bound:
             bias_term = estimate_high_probability_upper_bound_bias(
                 reward=reward,
@@ -1305,7 +1697,7 @@ class SelfNormalizedDoublyRobust(DoublyRobust):
         reward: np.ndarray,
         action: np.ndarray,
         pscore: np.ndarray,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         estimated_rewards_by_reg_model: np.ndarray,
         position: Optional[np.ndarray] = None,
         **kwargs,
@@ -1323,7 +1715,7 @@ class SelfNormalizedDoublyRobust(DoublyRobust):
         pscore: array-like, shape (n_rounds,)
             Action choice probabilities of the logging/behavior policy (propensity scores), i.e., :math:`\\pi_b(a_i|x_i)`.
 
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         estimated_rewards_by_reg_model: array-like, shape (n_rounds, n_actions, len_list)
@@ -1341,19 +1733,38 @@ class SelfNormalizedDoublyRobust(DoublyRobust):
 
         """
         n = action.shape[0]
-        iw = action_dist[np.arange(n), action, position] / pscore
-        q_hat_at_position = estimated_rewards_by_reg_model[np.arange(n), :, position]
+        iw = take_factual_action_dist(action_dist, action, position) / pscore
         q_hat_factual = estimated_rewards_by_reg_model[np.arange(n), action, position]
-        pi_e_at_position = action_dist[np.arange(n), :, position]
-        estimated_rewards = np.average(
-            q_hat_at_position,
-            weights=pi_e_at_position,
-            axis=1,
+        estimated_rewards = average_over_action_dist(
+            values=estimated_rewards_by_reg_model,
+            action_dist=action_dist,
+            position=position,
         )
         estimated_rewards += iw * (reward - q_hat_factual) / iw.mean()
 
         return estimated_rewards
 
+    def _estimate_round_reward_components(
+        self,
+        reward: np.ndarray,
+        action: np.ndarray,
+        pscore: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
+        estimated_rewards_by_reg_model: np.ndarray,
+        position: np.ndarray,
+        **kwargs,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Decompose the round-wise rewards whose correction term is normalized by the mean of the importance weights."""
+        n = action.shape[0]
+        iw = take_factual_action_dist(action_dist, action, position) / pscore
+        q_hat_factual = estimated_rewards_by_reg_model[np.arange(n), action, position]
+        q_hat_pi_e = average_over_action_dist(
+            values=estimated_rewards_by_reg_model,
+            action_dist=action_dist,
+            position=position,
+        )
+        return q_hat_pi_e, iw * (reward - q_hat_factual), iw
+
 
 @dataclass
 class SwitchDoublyRobust(DoublyRobust):
@@ -1425,7 +1836,7 @@ class SwitchDoublyRobust(DoublyRobust):
         reward: np.ndarray,
         action: np.ndarray,
         pscore: np.ndarray,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         estimated_rewards_by_reg_model: np.ndarray,
         position: Optional[np.ndarray] = None,
         **kwargs,
@@ -1443,7 +1854,7 @@ class SwitchDoublyRobust(DoublyRobust):
         pscore: array-like, shape (n_rounds,)
             Action choice probabilities of the logging/behavior policy (propensity scores), i.e., :math:`\\pi_b(a_i|x_i)`.
 
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         estimated_rewards_by_reg_model: array-like, shape (n_rounds, n_actions, len_list)
@@ -1461,15 +1872,13 @@ class SwitchDoublyRobust(DoublyRobust):
 
         """
         n = action.shape[0]
-        iw = action_dist[np.arange(n), action, position] / pscore
+        iw = take_factual_action_dist(action_dist, action, position) / pscore
         switch_indicator = np.array(iw <= self.lambda_, dtype=int)
-        q_hat_at_position = estimated_rewards_by_reg_model[np.arange(n), :, position]
         q_hat_factual = estimated_rewards_by_reg_model[np.arange(n), action, position]
-        pi_e_at_position = action_dist[np.arange(n), :, position]
-        estimated_rewards = np.average(
-            q_hat_at_position,
-            weights=pi_e_at_position,
-            axis=1,
+        estimated_rewards = average_over_action_dist(
+            values=estimated_rewards_by_reg_model,
+            action_dist=action_dist,
+            position=position,
         )
         estimated_rewards += switch_indicator * iw * (reward - q_hat_factual)
 
@@ -1480,7 +1889,7 @@ class SwitchDoublyRobust(DoublyRobust):
         reward: np.ndarray,
         action: np.ndarray,
         pscore: np.ndarray,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         estimated_rewards_by_reg_model: np.ndarray,
         position: Optional[np.ndarray] = None,
         use_bias_upper_bound: bool = False,
@@ -1499,7 +1908,7 @@ class SwitchDoublyRobust(DoublyRobust):
         pscore: array-like, shape (n_rounds,)
             Action choice probabilities of the logging/behavior policy (propensity scores), i.e., :math:`\\pi_b(a_i|x_i)`.
 
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         estimated_rewards_by_reg_model: array-like, shape (n_rounds, n_actions, len_list)
@@ -1541,7 +1950,7 @@ class SwitchDoublyRobust(DoublyRobust):
         sample_variance /= n
 
         # estimate the (high probability) upper bound of the bias of Switch-DR
-        iw = action_dist[np.arange(n), action, position] / pscore
+        iw = take_factual_action_dist(action_dist, action, position) / pscore
         if use_bias_upper_bound:
             bias_term = estimate_high_probability_upper_bound_bias(
                 reward=reward,
@@ -1630,7 +2039,7 @@ class DoublyRobustWithShrinkage(DoublyRobust):
         reward: np.ndarray,
         action: np.ndarray,
         pscore: np.ndarray,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         estimated_rewards_by_reg_model: np.ndarray,
         position: Optional[np.ndarray] = None,
         **kwargs,
@@ -1648,7 +2057,7 @@ class DoublyRobustWithShrinkage(DoublyRobust):
         pscore: array-like, shape (n_rounds,)
             Action choice probabilities of the logging/behavior policy (propensity scores), i.e., :math:`\\pi_b(a_i|x_i)`.
 
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         estimated_rewards_by_reg_model: array-like, shape (n_rounds, n_actions, len_list)
@@ -1666,19 +2075,17 @@ class DoublyRobustWithShrinkage(DoublyRobust):
 
         """
         n = action.shape[0]
-        iw = action_dist[np.arange(n), action, position] / pscore
+        iw = take_factual_action_dist(action_dist, action, position) / pscore
         if self.lambda_ < np.inf:
             iw_hat = (self.lambda_ * iw) / (iw**2 + self.lambda_)
         else:
             iw_hat = iw
 
-        q_hat_at_position = estimated_rewards_by_reg_model[np.arange(n), :, position]
         q_hat_factual = estimated_rewards_by_reg_model[np.arange(n), action, position]
-        pi_e_at_position = action_dist[np.arange(n), :, position]
-        estimated_rewards = np.average(
-            q_hat_at_position,
-            weights=pi_e_at_position,
-            axis=1,
+        estimated_rewards = average_over_action_dist(
+            values=estimated_rewards_by_reg_model,
+            action_dist=action_dist,
+            position=position,
         )
         estimated_rewards += iw_hat * (reward - q_hat_factual)
 
@@ -1689,7 +2096,7 @@ class DoublyRobustWithShrinkage(DoublyRobust):
         reward: np.ndarray,
         action: np.ndarray,
         pscore: np.ndarray,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         estimated_rewards_by_reg_model: np.ndarray,
         position: Optional[np.ndarray] = None,
         use_bias_upper_bound: bool = False,
@@ -1709,7 +2116,7 @@ class DoublyRobustWithShrinkage(DoublyRobust):
         pscore: array-like, shape (n_rounds,)
             Action choice probabilities of the logging/behavior policy (propensity scores), i.e., :math:`\\pi_b(a_i|x_i)`.
 
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         estimated_rewards_by_reg_model: array-like, shape (n_rounds, n_actions, len_list)
@@ -1749,7 +2156,7 @@ class DoublyRobustWithShrinkage(DoublyRobust):
         sample_variance /= n
 
         # estimate the (high probability) upper bound of the bias of DRos
-        iw = action_dist[np.arange(n), action, position] / pscore
+        iw = take_factual_action_dist(action_dist, action, position) / pscore
         if self.lambda_ < np.inf:
             iw_hat = (self.lambda_ * iw) / (iw**2 + self.lambda_)
         else:
@@ -1836,7 +2243,7 @@ class SubGaussianInverseProbabilityWeighting(InverseProbabilityWeighting):
         reward: np.ndarray,
         action: np.ndarray,
         pscore: np.ndarray,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         position: Optional[np.ndarray] = None,
         **kwargs,
     ) -> np.ndarray:
@@ -1867,7 +2274,7 @@ class SubGaussianInverseProbabilityWeighting(InverseProbabilityWeighting):
             Estimated rewards for each observation.
 
         """
-        iw = action_dist[np.arange(action.shape[0]), action, position] / pscore
+        iw = take_factual_action_dist(action_dist, action, position) / pscore
         iw_hat = iw / (1 - self.lambda_ + self.lambda_ * iw)
         estimated_rewards = iw_hat * reward
 
@@ -1878,7 +2285,7 @@ class SubGaussianInverseProbabilityWeighting(InverseProbabilityWeighting):
         reward: np.ndarray,
         action: np.ndarray,
         pscore: np.ndarray,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         position: Optional[np.ndarray] = None,
         use_bias_upper_bound: bool = False,
         delta: float = 0.05,
@@ -1897,7 +2304,7 @@ class SubGaussianInverseProbabilityWeighting(InverseProbabilityWeighting):
         pscore: array-like, shape (n_rounds,)
             Action choice probabilities of the logging/behavior policy (propensity scores), i.e., :math:`\\pi_b(a_i|x_i)`.
 
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         estimated_rewards_by_reg_model: array-like, shape (n_rounds, n_actions, len_list)
@@ -1936,7 +2343,7 @@ class SubGaussianInverseProbabilityWeighting(InverseProbabilityWeighting):
         sample_variance /= n
 
         # estimate the (high probability) upper bound of the bias of SGIPW
-        iw = action_dist[np.arange(n), action, position] / pscore
+        iw = take_factual_action_dist(action_dist, action, position) / pscore
         iw_hat = iw / (1 - self.lambda_ + self.lambda_ * iw)
         if use_bias_upper_bound:
             bias_term = estimate_high_probability_upper_bound_bias(
@@ -2020,7 +2427,7 @@ class SubGaussianDoublyRobust(DoublyRobust):
         reward: np.ndarray,
         action: np.ndarray,
         pscore: np.ndarray,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         estimated_rewards_by_reg_model: np.ndarray,
         position: Optional[np.ndarray] = None,
         **kwargs,
@@ -2056,16 +2463,14 @@ class SubGaussianDoublyRobust(DoublyRobust):
 
         """
         n = action.shape[0]
-        iw = action_dist[np.arange(n), action, position] / pscore
+        iw = take_factual_action_dist(action_dist, action, position) / pscore
         iw_hat = iw / (1 - self.lambda_ + self.lambda_ * iw)
 
-        q_hat_at_position = estimated_rewards_by_reg_model[np.arange(n), :, position]
         q_hat_factual = estimated_rewards_by_reg_model[np.arange(n), action, position]
-        pi_e_at_position = action_dist[np.arange(n), :, position]
-        estimated_rewards = np.average(
-            q_hat_at_position,
-            weights=pi_e_at_position,
-            axis=1,
+        estimated_rewards = average_over_action_dist(
+            values=estimated_rewards_by_reg_model,
+            action_dist=action_dist,
+            position=position,
         )
         estimated_rewards += iw_hat * (reward - q_hat_factual)
 
@@ -2076,7 +2481,7 @@ class SubGaussianDoublyRobust(DoublyRobust):
         reward: np.ndarray,
         action: np.ndarray,
         pscore: np.ndarray,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         estimated_rewards_by_reg_model: np.ndarray,
         position: Optional[np.ndarray] = None,
         use_bias_upper_bound: bool = False,
@@ -2096,7 +2501,7 @@ class SubGaussianDoublyRobust(DoublyRobust):
         pscore: array-like, shape (n_rounds,)
             Action choice probabilities of the logging/behavior policy (propensity scores), i.e., :math:`\\pi_b(a_i|x_i)`.
 
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         estimated_rewards_by_reg_model: array-like, shape (n_rounds, n_actions, len_list)
@@ -2136,7 +2541,7 @@ class SubGaussianDoublyRobust(DoublyRobust):
         sample_variance /= n
 
         # estimate the (high probability) upper bound of the bias of SGDR
-        iw = action_dist[np.arange(n), action, position] / pscore
+        iw = take_factual_action_dist(action_dist, action, position) / pscore
         iw_hat = iw / (1 - self.lambda_ + self.lambda_ * iw)
         if use_bias_upper_bound:
             bias_term = estimate_high_probability_upper_bound_bias(
@@ -2223,7 +2628,7 @@ class BalancedInverseProbabilityWeighting(BaseOffPolicyEstimator):
         reward: np.ndarray,
         action: np.ndarray,
         estimated_importance_weights: np.ndarray,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         position: Optional[np.ndarray] = None,
         **kwargs,
     ) -> np.ndarray:
@@ -2240,7 +2645,7 @@ class BalancedInverseProbabilityWeighting(BaseOffPolicyEstimator):
         estimated_importance_weights: array-like, shape (n_rounds,)
             Importance weights estimated via supervised classification using `obp.ope.ImportanceWeightEstimator`.
 
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         position: array-like, shape (n_rounds,), default=None
@@ -2267,7 +2672,7 @@ class BalancedInverseProbabilityWeighting(BaseOffPolicyEstimator):
         self,
         reward: np.ndarray,
         action: np.ndarray,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         estimated_importance_weights: np.ndarray,
         position: Optional[np.ndarray] = None,
         **kwargs,
@@ -2285,7 +2690,7 @@ class BalancedInverseProbabilityWeighting(BaseOffPolicyEstimator):
         estimated_importance_weights: array-like, shape (n_rounds,)
             Importance weights estimated via supervised classification using `obp.ope.ImportanceWeightEstimator`.
 
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         position: array-like, shape (n_rounds,), default=None
@@ -2328,14 +2733,15 @@ class BalancedInverseProbabilityWeighting(BaseOffPolicyEstimator):
         reward: np.ndarray,
         action: np.ndarray,
         estimated_importance_weights: np.ndarray,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         position: Optional[np.ndarray] = None,
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -2348,7 +2754,7 @@ class BalancedInverseProbabilityWeighting(BaseOffPolicyEstimator):
         estimated_importance_weights: array-like, shape (n_rounds,)
             Importance weights estimated via supervised classification using `obp.ope.ImportanceWeightEstimator`.
 
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         position: array-like, shape (n_rounds,), default=None
@@ -2365,6 +2771,11 @@ class BalancedInverseProbabilityWeighting(BaseOffPolicyEstimator):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
@@ -2395,9 +2806,10 @@ class BalancedInverseProbabilityWeighting(BaseOffPolicyEstimator):
             estimated_importance_weights=estimated_importance_weights,
             action_dist=action_dist,
         )
-        return estimate_confidence_interval_by_bootstrap(
+        return estimate_confidence_interval(
             samples=estimated_round_rewards,
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
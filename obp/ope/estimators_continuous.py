@@ -13,7 +13,7 @@ from sklearn.utils import check_scalar
 
 from ..utils import check_array
 from ..utils import check_continuous_ope_inputs
-from ..utils import estimate_confidence_interval_by_bootstrap
+from .helper import estimate_confidence_interval
 
 
 # kernel functions, reference: https://en.wikipedia.org/wiki/Kernel_(statistics)
@@ -66,7 +66,7 @@ class BaseContinuousOffPolicyEstimator(metaclass=ABCMeta):
 
     @abstractmethod
     def estimate_interval(self) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap."""
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method."""
         raise NotImplementedError
 
 
@@ -223,9 +223,10 @@ class KernelizedInverseProbabilityWeighting(BaseContinuousOffPolicyEstimator):
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -251,6 +252,11 @@ class KernelizedInverseProbabilityWeighting(BaseContinuousOffPolicyEstimator):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
@@ -278,11 +284,12 @@ class KernelizedInverseProbabilityWeighting(BaseContinuousOffPolicyEstimator):
             action_by_evaluation_policy=action_by_evaluation_policy,
         )
 
-        return estimate_confidence_interval_by_bootstrap(
+        return estimate_confidence_interval(
             samples=estimated_round_rewards,
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
 
 
@@ -449,9 +456,10 @@ class KernelizedSelfNormalizedInverseProbabilityWeighting(
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -477,6 +485,11 @@ class KernelizedSelfNormalizedInverseProbabilityWeighting(
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
@@ -504,11 +517,12 @@ class KernelizedSelfNormalizedInverseProbabilityWeighting(
             action_by_evaluation_policy=action_by_evaluation_policy,
         )
 
-        return estimate_confidence_interval_by_bootstrap(
+        return estimate_confidence_interval(
             samples=estimated_round_rewards,
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
 
 
@@ -685,9 +699,10 @@ class KernelizedDoublyRobust(BaseContinuousOffPolicyEstimator):
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -716,6 +731,11 @@ class KernelizedDoublyRobust(BaseContinuousOffPolicyEstimator):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
@@ -750,9 +770,10 @@ class KernelizedDoublyRobust(BaseContinuousOffPolicyEstimator):
             estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
         )
 
-        return estimate_confidence_interval_by_bootstrap(
+        return estimate_confidence_interval(
             samples=estimated_round_rewards,
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
@@ -14,8 +14,8 @@ from sklearn.utils import check_scalar
 from obp.utils import check_array
 from obp.utils import check_ope_inputs
 
-from ..utils import estimate_confidence_interval_by_bootstrap
 from .estimators import BaseOffPolicyEstimator
+from .helper import estimate_confidence_interval
 
 
 @dataclass
@@ -488,9 +488,10 @@ class MarginalizedInverseProbabilityWeighting(BaseOffPolicyEstimator):
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using nonparametric bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -535,6 +536,11 @@ class MarginalizedInverseProbabilityWeighting(BaseOffPolicyEstimator):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
@@ -574,11 +580,12 @@ class MarginalizedInverseProbabilityWeighting(BaseOffPolicyEstimator):
             action_dist=action_dist,
             p_e_a=p_e_a,
         )
-        return estimate_confidence_interval_by_bootstrap(
+        return estimate_confidence_interval(
             samples=estimated_round_rewards,
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
 
 
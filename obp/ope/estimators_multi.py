@@ -13,7 +13,7 @@ from sklearn.utils import check_scalar
 
 from ..utils import check_array
 from ..utils import check_multi_loggers_ope_inputs
-from ..utils import estimate_confidence_interval_by_bootstrap
+from .helper import estimate_confidence_interval
 
 
 @dataclass
@@ -32,7 +32,7 @@ class BaseMultiLoggersOffPolicyEstimator(metaclass=ABCMeta):
 
     @abstractmethod
     def estimate_interval(self) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap."""
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method."""
         raise NotImplementedError
 
 
@@ -227,9 +227,10 @@ class MultiLoggersNaiveInverseProbabilityWeighting(BaseMultiLoggersOffPolicyEsti
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -264,6 +265,11 @@ class MultiLoggersNaiveInverseProbabilityWeighting(BaseMultiLoggersOffPolicyEsti
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
@@ -296,11 +302,12 @@ class MultiLoggersNaiveInverseProbabilityWeighting(BaseMultiLoggersOffPolicyEsti
             pscore=pscore_,
             action_dist=action_dist,
         )
-        return estimate_confidence_interval_by_bootstrap(
+        return estimate_confidence_interval(
             samples=estimated_round_rewards,
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
 
 
@@ -501,9 +508,10 @@ class MultiLoggersBalancedInverseProbabilityWeighting(
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -538,6 +546,11 @@ class MultiLoggersBalancedInverseProbabilityWeighting(
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
@@ -572,11 +585,12 @@ class MultiLoggersBalancedInverseProbabilityWeighting(
             pscore=pscore_,
             action_dist=action_dist,
         )
-        return estimate_confidence_interval_by_bootstrap(
+        return estimate_confidence_interval(
             samples=estimated_round_rewards,
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
 
 
@@ -780,9 +794,10 @@ class MultiLoggersWeightedInverseProbabilityWeighting(
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -820,6 +835,11 @@ class MultiLoggersWeightedInverseProbabilityWeighting(
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
@@ -855,11 +875,12 @@ class MultiLoggersWeightedInverseProbabilityWeighting(
             pscore=pscore_,
             action_dist=action_dist,
         )
-        return estimate_confidence_interval_by_bootstrap(
+        return estimate_confidence_interval(
             samples=estimated_round_rewards,
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
 
 
@@ -1085,9 +1106,10 @@ class MultiLoggersNaiveDoublyRobust(BaseMultiLoggersOffPolicyEstimator):
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -1125,6 +1147,11 @@ class MultiLoggersNaiveDoublyRobust(BaseMultiLoggersOffPolicyEstimator):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
@@ -1164,11 +1191,12 @@ class MultiLoggersNaiveDoublyRobust(BaseMultiLoggersOffPolicyEstimator):
             action_dist=action_dist,
             estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
         )
-        return estimate_confidence_interval_by_bootstrap(
+        return estimate_confidence_interval(
             samples=estimated_round_rewards,
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
 
 
@@ -1396,9 +1424,10 @@ class MultiLoggersBalancedDoublyRobust(BaseMultiLoggersOffPolicyEstimator):
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -1436,6 +1465,11 @@ class MultiLoggersBalancedDoublyRobust(BaseMultiLoggersOffPolicyEstimator):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
@@ -1477,11 +1511,12 @@ class MultiLoggersBalancedDoublyRobust(BaseMultiLoggersOffPolicyEstimator):
             estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
             action_dist=action_dist,
         )
-        return estimate_confidence_interval_by_bootstrap(
+        return estimate_confidence_interval(
             samples=estimated_round_rewards,
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
 
 
@@ -1713,9 +1748,10 @@ class MultiLoggersWeightedDoublyRobust(MultiLoggersNaiveDoublyRobust):
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -1756,6 +1792,11 @@ class MultiLoggersWeightedDoublyRobust(MultiLoggersNaiveDoublyRobust):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
@@ -1798,9 +1839,10 @@ class MultiLoggersWeightedDoublyRobust(MultiLoggersNaiveDoublyRobust):
             action_dist=action_dist,
             estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
         )
-        return estimate_confidence_interval_by_bootstrap(
+        return estimate_confidence_interval(
             samples=estimated_round_rewards,
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
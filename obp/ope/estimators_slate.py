@@ -15,7 +15,7 @@ from ..utils import check_cascade_dr_inputs
 from ..utils import check_iips_inputs
 from ..utils import check_rips_inputs
 from ..utils import check_sips_inputs
-from ..utils import estimate_confidence_interval_by_bootstrap
+from .helper import estimate_confidence_interval
 
 
 @dataclass
@@ -34,7 +34,7 @@ class BaseSlateOffPolicyEstimator(metaclass=ABCMeta):
 
     @abstractmethod
     def estimate_interval(self) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap."""
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method."""
         raise NotImplementedError
 
 
@@ -93,8 +93,9 @@ class BaseSlateInverseProbabilityWeighting(BaseSlateOffPolicyEstimator):
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -113,23 +114,26 @@ class BaseSlateInverseProbabilityWeighting(BaseSlateOffPolicyEstimator):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
             Dictionary storing the estimated mean and upper-lower confidence bounds.
 
         """
-        unique_slate = np.unique(slate_id)
         # sum estimated_rewards in each slate
-        estimated_round_rewards = list()
-        for slate in unique_slate:
-            estimated_round_rewards.append(estimated_rewards[slate_id == slate].sum())
-        estimated_round_rewards = np.array(estimated_round_rewards)
-        return estimate_confidence_interval_by_bootstrap(
+        slate_idx = np.unique(slate_id, return_inverse=True)[1]
+        estimated_round_rewards = np.bincount(slate_idx, weights=estimated_rewards)
+        return estimate_confidence_interval(
             samples=estimated_round_rewards,
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
 
 
@@ -220,9 +224,10 @@ class SlateStandardIPS(BaseSlateInverseProbabilityWeighting):
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -252,6 +257,11 @@ class SlateStandardIPS(BaseSlateInverseProbabilityWeighting):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
@@ -277,6 +287,7 @@ class SlateStandardIPS(BaseSlateInverseProbabilityWeighting):
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
 
 
@@ -370,9 +381,10 @@ class SlateIndependentIPS(BaseSlateInverseProbabilityWeighting):
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -402,6 +414,11 @@ class SlateIndependentIPS(BaseSlateInverseProbabilityWeighting):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
@@ -427,6 +444,7 @@ class SlateIndependentIPS(BaseSlateInverseProbabilityWeighting):
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
 
 
@@ -516,9 +534,10 @@ class SlateRewardInteractionIPS(BaseSlateInverseProbabilityWeighting):
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -546,6 +565,11 @@ class SlateRewardInteractionIPS(BaseSlateInverseProbabilityWeighting):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
@@ -571,6 +595,7 @@ class SlateRewardInteractionIPS(BaseSlateInverseProbabilityWeighting):
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
 
 
@@ -778,9 +803,10 @@ class SlateCascadeDoublyRobust(BaseSlateOffPolicyEstimator):
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -822,6 +848,11 @@ class SlateCascadeDoublyRobust(BaseSlateOffPolicyEstimator):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
@@ -855,6 +886,7 @@ class SlateCascadeDoublyRobust(BaseSlateOffPolicyEstimator):
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
 
     def _estimate_slate_confidence_interval_by_bootstrap(
@@ -864,8 +896,9 @@ class SlateCascadeDoublyRobust(BaseSlateOffPolicyEstimator):
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -884,23 +917,26 @@ class SlateCascadeDoublyRobust(BaseSlateOffPolicyEstimator):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
             Dictionary storing the estimated mean and upper-lower confidence bounds.
 
         """
-        unique_slate = np.unique(slate_id)
         # sum estimated_rewards in each slate
-        estimated_round_rewards = list()
-        for slate in unique_slate:
-            estimated_round_rewards.append(estimated_rewards[slate_id == slate].sum())
-        estimated_round_rewards = np.array(estimated_round_rewards)
-        return estimate_confidence_interval_by_bootstrap(
+        slate_idx = np.unique(slate_id, return_inverse=True)[1]
+        estimated_round_rewards = np.bincount(slate_idx, weights=estimated_rewards)
+        return estimate_confidence_interval(
             samples=estimated_round_rewards,
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
 
 
@@ -7,12 +7,16 @@ from dataclasses import field
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 import numpy as np
 from sklearn.utils import check_scalar
 
+from ..utils import average_over_action_dist
 from ..utils import check_array
+from ..utils import check_estimated_rewards_by_reg_model
 from ..utils import check_ope_inputs
+from ..utils import take_factual_action_dist
 from .estimators import BaseOffPolicyEstimator
 from .estimators import DoublyRobust
 from .estimators import DoublyRobustWithShrinkage
@@ -20,9 +24,106 @@ from .estimators import InverseProbabilityWeighting
 from .estimators import SubGaussianDoublyRobust
 from .estimators import SubGaussianInverseProbabilityWeighting
 from .estimators import SwitchDoublyRobust
+from .helper import _estimate_confidence_width
 from .helper import estimate_student_t_lower_bound
 
 
+# how each base estimator modifies the importance weights with its hyperparameter
+_WEIGHT_MODIFICATIONS = {
+    InverseProbabilityWeighting: "clipping",
+    DoublyRobust: "clipping",
+    SwitchDoublyRobust: "switching",
+    DoublyRobustWithShrinkage: "shrinkage",
+    SubGaussianInverseProbabilityWeighting: "sub_gaussian",
+    SubGaussianDoublyRobust: "sub_gaussian",
+}
+# maximum number of elements of the (n_lambdas, n_rounds) matrices materialized at once in the sweep
+_MAX_SWEEP_ELEMENTS = 2**22
+
+
+def _estimate_moments_with_thresholded_weights(
+    iw: np.ndarray,
+    residual: np.ndarray,
+    q_hat_pi: np.ndarray,
+    lambdas: np.ndarray,
+    weight_modification: str,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Estimate the policy values, variances, and biases for all the clipping or switching thresholds at once.
+
+    Note
+    -------
+    The importance weights not larger than a threshold :math:`\\lambda` are kept as they are,
+    and the others are replaced with :math:`\\lambda` (clipping) or zero (switching).
+    Thus, after sorting the rounds by their importance weights, the sums needed to estimate the moments of
+    the round-wise rewards for each threshold are obtained from the cumulative sums in :math:`O(n \\log n + |\\Lambda| \\log n)`.
+
+    """
+    n = iw.shape[0]
+    sorted_idx = np.argsort(iw, kind="stable")
+    iw, residual = iw[sorted_idx], residual[sorted_idx]
+    offset = q_hat_pi.mean()
+    q_hat_pi = q_hat_pi[sorted_idx] - offset
+
+    def _cumsum(x: np.ndarray) -> np.ndarray:
+        return np.r_[0.0, np.cumsum(x)]
+
+    weighted_residual = iw * residual
+    cumsum_wr = _cumsum(weighted_residual)
+    cumsum_wr_sq = _cumsum(weighted_residual**2)
+    cumsum_qwr = _cumsum(q_hat_pi * weighted_residual)
+    # number of rounds whose importance weights are kept as they are
+    n_kept = np.searchsorted(iw, lambdas, side="right")
+    sum_wr = cumsum_wr[n_kept]
+    sum_wr_sq = cumsum_wr_sq[n_kept]
+    sum_qwr = cumsum_qwr[n_kept]
+    sum_bias = cumsum_wr[-1] - cumsum_wr[n_kept]
+    if weight_modification == "clipping":
+        cumsum_r = _cumsum(residual)
+        cumsum_r_sq = _cumsum(residual**2)
+        cumsum_qr = _cumsum(q_hat_pi * residual)
+        # avoid `inf * 0` when no weight is clipped
+        clipped_lambdas = np.where(n_kept < n, lambdas, 0.0)
+        sum_wr += clipped_lambdas * (cumsum_r[-1] - cumsum_r[n_kept])
+        sum_wr_sq += clipped_lambdas**2 * (cumsum_r_sq[-1] - cumsum_r_sq[n_kept])
+        sum_qwr += clipped_lambdas * (cumsum_qr[-1] - cumsum_qr[n_kept])
+        sum_bias -= clipped_lambdas * (cumsum_r[-1] - cumsum_r[n_kept])
+
+    policy_value = offset + sum_wr / n
+    second_moment = ((q_hat_pi**2).sum() + 2 * sum_qwr + sum_wr_sq) / n
+    variance = np.maximum(second_moment - (sum_wr / n) ** 2, 0.0)
+    bias = np.abs(sum_bias / n)
+    return policy_value, variance, bias
+
+
+def _estimate_moments_with_transformed_weights(
+    iw: np.ndarray,
+    residual: np.ndarray,
+    q_hat_pi: np.ndarray,
+    lambdas: np.ndarray,
+    weight_modification: str,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Estimate the policy values, variances, and biases for all the shrinkage or sub-gaussian hyperparameters at once."""
+    n, n_lambdas = iw.shape[0], lambdas.shape[0]
+    policy_value = np.zeros(n_lambdas)
+    variance = np.zeros(n_lambdas)
+    bias = np.zeros(n_lambdas)
+    block_size = max(_MAX_SWEEP_ELEMENTS // n, 1)
+    for start in range(0, n_lambdas, block_size):
+        block = slice(start, start + block_size)
+        lambdas_ = lambdas[block, np.newaxis]
+        if weight_modification == "shrinkage":
+            is_finite = np.isfinite(lambdas_)
+            lambdas_ = np.where(is_finite, lambdas_, 1.0)
+            iw_hat = np.where(is_finite, (lambdas_ * iw) / (iw**2 + lambdas_), iw)
+        else:
+            iw_hat = iw / (1 - lambdas_ + lambdas_ * iw)
+        estimated_round_rewards = q_hat_pi + iw_hat * residual
+        policy_value[block] = estimated_round_rewards.mean(axis=1)
+        variance[block] = estimated_round_rewards.var(axis=1)
+        bias[block] = np.abs(((iw - iw_hat) * residual).mean(axis=1))
+    return policy_value, variance, bias
+
+
 @dataclass
 class BaseOffPolicyEstimatorTuning:
     """Base Class for Off-Policy Estimator with built-in hyperparameter tuning
@@ -113,6 +214,59 @@ class BaseOffPolicyEstimatorTuning:
                 f"`use_estimated_pscore` must be a bool, but {type(self.use_estimated_pscore)} is given"
             )
 
+    def _sweep_lambdas(
+        self,
+        reward: np.ndarray,
+        action: np.ndarray,
+        pscore: np.ndarray,
+        action_dist: np.ndarray,
+        estimated_rewards_by_reg_model: Optional[np.ndarray] = None,
+        position: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Estimate the policy values, sample variances of the round-wise rewards, and biases for all the candidate hyperparameter values at once.
+
+        Note
+        -------
+        The importance weights and the estimated rewards shared by the candidates are computed only once.
+        The round-wise rewards of all the supported base estimators are written as
+        :math:`\\hat{q}(x_i,\\pi_e) + \\hat{w}_{\\lambda}(x_i,a_i) (r_i - \\hat{q}(x_i,a_i))`
+        (with :math:`\\hat{q}=0` for the IPW-type estimators), and thus only the modified importance weights depend on :math:`\\lambda`.
+
+        """
+        n = reward.shape[0]
+        iw = take_factual_action_dist(action_dist, action, position) / pscore
+        if issubclass(self.base_ope_estimator, DoublyRobust):
+            q_hat_factual = estimated_rewards_by_reg_model[
+                np.arange(n), action, position
+            ]
+            q_hat_pi = average_over_action_dist(
+                values=estimated_rewards_by_reg_model,
+                action_dist=action_dist,
+                position=position,
+            )
+            residual = reward - q_hat_factual
+        else:
+            q_hat_pi = np.zeros(n)
+            residual = reward
+
+        weight_modification = _WEIGHT_MODIFICATIONS[self.base_ope_estimator]
+        lambdas = np.array(self.lambdas, dtype=float)
+        if weight_modification in ["clipping", "switching"]:
+            return _estimate_moments_with_thresholded_weights(
+                iw=iw,
+                residual=residual,
+                q_hat_pi=q_hat_pi,
+                lambdas=lambdas,
+                weight_modification=weight_modification,
+            )
+        return _estimate_moments_with_transformed_weights(
+            iw=iw,
+            residual=residual,
+            q_hat_pi=q_hat_pi,
+            lambdas=lambdas,
+            weight_modification=weight_modification,
+        )
+
     def _tune_hyperparam_with_mse(
         self,
         reward: np.ndarray,
@@ -124,20 +278,43 @@ class BaseOffPolicyEstimatorTuning:
     ) -> float:
         """Find the best hyperparameter value from the candidate set by estimating the mse."""
         self.estimated_mse_score_dict = dict()
-        for hyperparam_ in self.lambdas:
-            estimated_mse_score = self.base_ope_estimator(
-                lambda_=hyperparam_, use_estimated_pscore=self.use_estimated_pscore
-            )._estimate_mse_score(
+        if self.base_ope_estimator in _WEIGHT_MODIFICATIONS:
+            _, sample_variance, bias_term = self._sweep_lambdas(
                 reward=reward,
                 action=action,
                 pscore=pscore,
                 action_dist=action_dist,
                 estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
                 position=position,
-                use_bias_upper_bound=self.use_bias_upper_bound,
-                delta=self.delta,
             )
-            self.estimated_mse_score_dict[hyperparam_] = estimated_mse_score
+            n = reward.shape[0]
+            sample_variance /= n
+            if self.use_bias_upper_bound:
+                iw = take_factual_action_dist(action_dist, action, position) / pscore
+                bias_term += np.sqrt(
+                    (2 * (iw**2).mean() * np.log(2 / self.delta)) / n
+                )
+                bias_term += (2 * iw.max() * np.log(2 / self.delta)) / (3 * n)
+            estimated_mse_scores = sample_variance + (bias_term**2)
+            for hyperparam_, estimated_mse_score in zip(
+                self.lambdas, estimated_mse_scores
+            ):
+                self.estimated_mse_score_dict[hyperparam_] = estimated_mse_score
+        else:
+            for hyperparam_ in self.lambdas:
+                estimated_mse_score = self.base_ope_estimator(
+                    lambda_=hyperparam_, use_estimated_pscore=self.use_estimated_pscore
+                )._estimate_mse_score(
+                    reward=reward,
+                    action=action,
+                    pscore=pscore,
+                    action_dist=action_dist,
+                    estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
+                    position=position,
+                    use_bias_upper_bound=self.use_bias_upper_bound,
+                    delta=self.delta,
+                )
+                self.estimated_mse_score_dict[hyperparam_] = estimated_mse_score
         return min(self.estimated_mse_score_dict.items(), key=lambda x: x[1])[0]
 
     def _tune_hyperparam_with_slope(
@@ -151,11 +328,8 @@ class BaseOffPolicyEstimatorTuning:
     ) -> float:
         """Find the best hyperparameter value from the candidate set by SLOPE."""
         C = np.sqrt(6) - 1
-        theta_list_for_sort, cnf_list_for_sort = [], []
-        for hyperparam_ in self.lambdas:
-            estimated_round_rewards = self.base_ope_estimator(
-                hyperparam_
-            )._estimate_round_rewards(
+        if self.base_ope_estimator in _WEIGHT_MODIFICATIONS:
+            theta_list_for_sort, sample_variance, _ = self._sweep_lambdas(
                 reward=reward,
                 action=action,
                 pscore=pscore,
@@ -163,13 +337,33 @@ class BaseOffPolicyEstimatorTuning:
                 estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
                 position=position,
             )
-            theta_list_for_sort.append(estimated_round_rewards.mean())
-            cnf = estimated_round_rewards.mean()
-            cnf -= estimate_student_t_lower_bound(
-                x=estimated_round_rewards,
+            # widths of the student-t lower bounds, see `estimate_student_t_lower_bound`
+            cnf_list_for_sort = _estimate_confidence_width(
+                n=reward.shape[0],
+                variance=sample_variance,
                 delta=self.delta,
+                ci_method="student_t",
             )
-            cnf_list_for_sort.append(cnf)
+        else:
+            theta_list_for_sort, cnf_list_for_sort = [], []
+            for hyperparam_ in self.lambdas:
+                estimated_round_rewards = self.base_ope_estimator(
+                    hyperparam_
+                )._estimate_round_rewards(
+                    reward=reward,
+                    action=action,
+                    pscore=pscore,
+                    action_dist=action_dist,
+                    estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
+                    position=position,
+                )
+                theta_list_for_sort.append(estimated_round_rewards.mean())
+                cnf = estimated_round_rewards.mean()
+                cnf -= estimate_student_t_lower_bound(
+                    x=estimated_round_rewards,
+                    delta=self.delta,
+                )
+                cnf_list_for_sort.append(cnf)
 
         theta_list, cnf_list = [], []
         sorted_idx_list = np.argsort(cnf_list_for_sort)[::-1]
@@ -284,9 +478,10 @@ class BaseOffPolicyEstimatorTuning:
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -324,6 +519,11 @@ class BaseOffPolicyEstimatorTuning:
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
@@ -368,6 +568,7 @@ class BaseOffPolicyEstimatorTuning:
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
 
 
@@ -501,9 +702,10 @@ class InverseProbabilityWeightingTuning(BaseOffPolicyEstimatorTuning):
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -539,6 +741,11 @@ class InverseProbabilityWeightingTuning(BaseOffPolicyEstimatorTuning):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
@@ -573,6 +780,7 @@ class InverseProbabilityWeightingTuning(BaseOffPolicyEstimatorTuning):
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
 
 
@@ -667,11 +875,7 @@ class DoublyRobustTuning(BaseOffPolicyEstimatorTuning):
             Estimated policy value of evaluation policy.
 
         """
-        check_array(
-            array=estimated_rewards_by_reg_model,
-            name="estimated_rewards_by_reg_model",
-            expected_dim=3,
-        )
+        check_estimated_rewards_by_reg_model(estimated_rewards_by_reg_model)
         check_array(array=reward, name="reward", expected_dim=1)
         check_array(array=action, name="action", expected_dim=1)
         if self.use_estimated_pscore:
@@ -713,9 +917,10 @@ class DoublyRobustTuning(BaseOffPolicyEstimatorTuning):
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -753,17 +958,18 @@ class DoublyRobustTuning(BaseOffPolicyEstimatorTuning):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
             Dictionary storing the estimated mean and upper-lower confidence bounds.
 
         """
-        check_array(
-            array=estimated_rewards_by_reg_model,
-            name="estimated_rewards_by_reg_model",
-            expected_dim=3,
-        )
+        check_estimated_rewards_by_reg_model(estimated_rewards_by_reg_model)
         check_array(array=reward, name="reward", expected_dim=1)
         check_array(array=action, name="action", expected_dim=1)
         if self.use_estimated_pscore:
@@ -794,6 +1000,7 @@ class DoublyRobustTuning(BaseOffPolicyEstimatorTuning):
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
 
 
@@ -887,11 +1094,7 @@ class SwitchDoublyRobustTuning(BaseOffPolicyEstimatorTuning):
             Estimated policy value of evaluation policy.
 
         """
-        check_array(
-            array=estimated_rewards_by_reg_model,
-            name="estimated_rewards_by_reg_model",
-            expected_dim=3,
-        )
+        check_estimated_rewards_by_reg_model(estimated_rewards_by_reg_model)
         check_array(array=reward, name="reward", expected_dim=1)
         check_array(array=action, name="action", expected_dim=1)
         if self.use_estimated_pscore:
@@ -933,9 +1136,10 @@ class SwitchDoublyRobustTuning(BaseOffPolicyEstimatorTuning):
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -973,17 +1177,18 @@ class SwitchDoublyRobustTuning(BaseOffPolicyEstimatorTuning):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
             Dictionary storing the estimated mean and upper-lower confidence bounds.
 
         """
-        check_array(
-            array=estimated_rewards_by_reg_model,
-            name="estimated_rewards_by_reg_model",
-            expected_dim=3,
-        )
+        check_estimated_rewards_by_reg_model(estimated_rewards_by_reg_model)
         check_array(array=reward, name="reward", expected_dim=1)
         check_array(array=action, name="action", expected_dim=1)
         if self.use_estimated_pscore:
@@ -1014,6 +1219,7 @@ class SwitchDoublyRobustTuning(BaseOffPolicyEstimatorTuning):
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
 
 
@@ -1107,11 +1313,7 @@ class DoublyRobustWithShrinkageTuning(BaseOffPolicyEstimatorTuning):
             Estimated policy value of evaluation policy.
 
         """
-        check_array(
-            array=estimated_rewards_by_reg_model,
-            name="estimated_rewards_by_reg_model",
-            expected_dim=3,
-        )
+        check_estimated_rewards_by_reg_model(estimated_rewards_by_reg_model)
         check_array(array=reward, name="reward", expected_dim=1)
         check_array(array=action, name="action", expected_dim=1)
         if self.use_estimated_pscore:
@@ -1153,9 +1355,10 @@ class DoublyRobustWithShrinkageTuning(BaseOffPolicyEstimatorTuning):
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -1193,17 +1396,18 @@ class DoublyRobustWithShrinkageTuning(BaseOffPolicyEstimatorTuning):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
             Dictionary storing the estimated mean and upper-lower confidence bounds.
 
         """
-        check_array(
-            array=estimated_rewards_by_reg_model,
-            name="estimated_rewards_by_reg_model",
-            expected_dim=3,
-        )
+        check_estimated_rewards_by_reg_model(estimated_rewards_by_reg_model)
         check_array(array=reward, name="reward", expected_dim=1)
         check_array(array=action, name="action", expected_dim=1)
         if self.use_estimated_pscore:
@@ -1234,6 +1438,7 @@ class DoublyRobustWithShrinkageTuning(BaseOffPolicyEstimatorTuning):
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
 
 
@@ -1369,9 +1574,10 @@ class SubGaussianInverseProbabilityWeightingTuning(BaseOffPolicyEstimatorTuning)
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -1406,6 +1612,11 @@ class SubGaussianInverseProbabilityWeightingTuning(BaseOffPolicyEstimatorTuning)
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
@@ -1439,6 +1650,7 @@ class SubGaussianInverseProbabilityWeightingTuning(BaseOffPolicyEstimatorTuning)
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
 
 
@@ -1535,11 +1747,7 @@ class SubGaussianDoublyRobustTuning(BaseOffPolicyEstimatorTuning):
             Estimated policy value of evaluation policy.
 
         """
-        check_array(
-            array=estimated_rewards_by_reg_model,
-            name="estimated_rewards_by_reg_model",
-            expected_dim=3,
-        )
+        check_estimated_rewards_by_reg_model(estimated_rewards_by_reg_model)
         check_array(array=reward, name="reward", expected_dim=1)
         check_array(array=action, name="action", expected_dim=1)
         if self.use_estimated_pscore:
@@ -1580,9 +1788,10 @@ class SubGaussianDoublyRobustTuning(BaseOffPolicyEstimatorTuning):
         alpha: float = 0.05,
         n_bootstrap_samples: int = 10000,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         **kwargs,
     ) -> Dict[str, float]:
-        """Estimate the confidence interval of the policy value using bootstrap.
+        """Estimate the confidence interval of the policy value using bootstrap or an analytic method.
 
         Parameters
         ----------
@@ -1620,17 +1829,18 @@ class SubGaussianDoublyRobustTuning(BaseOffPolicyEstimatorTuning):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence interval, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         estimated_confidence_interval: Dict[str, float]
             Dictionary storing the estimated mean and upper-lower confidence bounds.
 
         """
-        check_array(
-            array=estimated_rewards_by_reg_model,
-            name="estimated_rewards_by_reg_model",
-            expected_dim=3,
-        )
+        check_estimated_rewards_by_reg_model(estimated_rewards_by_reg_model)
         check_array(array=reward, name="reward", expected_dim=1)
         check_array(array=action, name="action", expected_dim=1)
         if self.use_estimated_pscore:
@@ -1660,4 +1870,5 @@ class SubGaussianDoublyRobustTuning(BaseOffPolicyEstimatorTuning):
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
@@ -1,14 +1,42 @@
 # Copyright (c) Yuta Saito, Yusuke Narita, and ZOZO Technologies, Inc. All rights reserved.
 # Licensed under the Apache 2.0 License.
 
+from dataclasses import dataclass
+from typing import Dict
+from typing import Iterable
+from typing import List
 from typing import Optional
-
+from typing import Tuple
+from typing import Union
+
+from joblib import cpu_count
+from joblib import delayed
+from joblib import effective_n_jobs
+from joblib import Parallel
+from joblib import parallel_backend
 import numpy as np
 from numpy import log
 from numpy import sqrt
 from numpy import var
 from scipy import stats
+from sklearn.base import BaseEstimator
 from sklearn.utils import check_scalar
+from threadpoolctl import threadpool_limits
+
+from ..utils import estimate_confidence_interval_by_blb
+from ..utils import estimate_confidence_interval_by_bootstrap
+from ..utils import estimate_confidence_interval_by_m_out_of_n_bootstrap
+
+
+CI_METHODS = [
+    "bootstrap",
+    "blb",
+    "m_out_of_n",
+    "normal",
+    "hoeffding",
+    "bernstein",
+    "student_t",
+]
 
 
 def estimate_bias_in_ope(
@@ -116,6 +144,56 @@ def estimate_high_probability_upper_bound_bias(
     return bias_upper_bound
 
 
+def _estimate_confidence_width(
+    n: int,
+    variance: Union[float, np.ndarray] = 0.0,
+    x_range: Optional[float] = None,
+    delta: float = 0.05,
+    ci_method: str = "student_t",
+) -> Union[float, np.ndarray]:
+    """Compute the width of a one-sided high probability bound of mean of random variables.
+
+    Note
+    -------
+    The high probability lower bound is given by the sample mean minus this width.
+    This is shared by the lower bound helpers below, which assume the random variables lie in :math:`[0, x_{\max}]`
+    (i.e., `x_range=x_max`), and the two-sided analytic confidence intervals, which use `x_range=x_max - x_min`
+    and :math:`\delta = \alpha / 2` for each side.
+
+    Parameters
+    ----------
+    n: int
+        Number of samples.
+
+    variance: float or array-like, default=0.0
+        Sample variance (with `ddof=0`). An array gives the widths of several sets of samples at once.
+
+    x_range: float, default=None
+        Range of the random variables, which is required by 'hoeffding' and 'bernstein'.
+
+    delta: float, default=0.05
+        A confidence delta to construct a high probability bound.
+
+    ci_method: str, default='student_t'
+        Must be one of 'normal', 'hoeffding', 'bernstein', and 'student_t'.
+
+    """
+    if ci_method == "normal":
+        return sqrt(variance / (n - 1)) * stats.norm.ppf(1.0 - delta)
+    elif ci_method == "student_t":
+        return sqrt(variance / (n - 1)) * stats.t(n - 1).ppf(1.0 - delta)
+    elif ci_method == "hoeffding":
+        return x_range * sqrt(log(1.0 / delta) / (2 * n))
+    elif ci_method == "bernstein":
+        width = 7 * x_range * log(2.0 / delta) / (3 * (n - 1))
+        width += sqrt(2 * log(2.0 / delta) * variance / (n - 1))
+        return width
+    raise ValueError(
+        "`ci_method` must be one of 'normal', 'hoeffding', 'bernstein', and 'student_t'"
+        f", but {ci_method} is given"
+    )
+
+
 def estimate_hoeffding_lower_bound(
     x: np.ndarray, x_max: Optional[float] = None, delta: float = 0.05
 ) -> float:
@@ -151,8 +229,9 @@ def estimate_hoeffding_lower_bound(
         check_scalar(x_max, "x_max", (int, float), min_val=x.max())
     check_scalar(delta, "delta", (int, float), min_val=0.0, max_val=1.0)
 
-    n = x.shape[0]
-    ci = x_max * sqrt(log(1.0 / delta) / (2 * n))
+    ci = _estimate_confidence_width(
+        n=x.shape[0], x_range=x_max, delta=delta, ci_method="hoeffding"
+    )
     lower_bound_estimate = x.mean() - ci
 
     return lower_bound_estimate
@@ -193,10 +272,14 @@ def estimate_bernstein_lower_bound(
         check_scalar(x_max, "x_max", (int, float), min_val=x.max())
     check_scalar(delta, "delta", (int, float), min_val=0.0, max_val=1.0)
 
-    n = x.shape[0]
-    ci1 = 7 * x_max * log(2.0 / delta) / (3 * (n - 1))
-    ci2 = sqrt(2 * log(2.0 / delta) * var(x) / (n - 1))
-    lower_bound_estimate = x.mean() - ci1 - ci2
+    ci = _estimate_confidence_width(
+        n=x.shape[0],
+        variance=var(x),
+        x_range=x_max,
+        delta=delta,
+        ci_method="bernstein",
+    )
+    lower_bound_estimate = x.mean() - ci
 
     return lower_bound_estimate
 
@@ -226,9 +309,413 @@ def estimate_student_t_lower_bound(x: np.ndarray, delta: float = 0.05) -> float:
     """
     check_scalar(delta, "delta", (int, float), min_val=0.0, max_val=1.0)
 
-    n = x.shape[0]
-    ci = sqrt(var(x) / (n - 1))
-    ci *= stats.t(n - 1).ppf(1.0 - delta)
+    ci = _estimate_confidence_width(
+        n=x.shape[0], variance=var(x), delta=delta, ci_method="student_t"
+    )
     lower_bound_estimate = x.mean() - ci
 
     return lower_bound_estimate
+
+
+def estimate_confidence_interval(
+    samples: np.ndarray,
+    alpha: float = 0.05,
+    n_bootstrap_samples: int = 10000,
+    random_state: Optional[int] = None,
+    ci_method: str = "bootstrap",
+) -> Dict[str, float]:
+    """Estimate confidence interval of the mean of given samples.
+
+    Parameters
+    ----------
+    samples: array-like
+        Empirical observed samples such as the round-wise rewards estimated by an OPE estimator.
+
+    alpha: float, default=0.05
+        Significance level.
+
+    n_bootstrap_samples: int, default=10000
+        Number of resampling performed in bootstrap sampling.
+        When `ci_method='blb'`, this is the number of resampling performed for each subsample.
+
+    random_state: int, default=None
+        Controls the random seed in bootstrap sampling.
+
+    ci_method: str, default='bootstrap'
+        Method to estimate the confidence interval. Must be one of the following.
+            - bootstrap: the (vectorized) nonparametric bootstrap. See :func:`obp.utils.estimate_confidence_interval_by_bootstrap`.
+            - blb: the bag of little bootstraps. See :func:`obp.utils.estimate_confidence_interval_by_blb`.
+            - m_out_of_n: the m-out-of-n bootstrap. See :func:`obp.utils.estimate_confidence_interval_by_m_out_of_n_bootstrap`.
+            - normal, hoeffding, bernstein, student_t: the analytic interval. See :func:`estimate_analytic_confidence_interval`.
+        `blb` and `m_out_of_n` compute the interval from small subsamples, and thus their costs are nearly independent of the number of samples.
+        The analytic intervals are computed in :math:`O(n)` without resampling.
+
+    Returns
+    ----------
+    estimated_confidence_interval: Dict[str, float]
+        Dictionary storing the estimated mean and upper-lower confidence bounds.
+
+    """
+    if ci_method not in CI_METHODS:
+        raise ValueError(
+            f"`ci_method` must be one of {CI_METHODS}, but {ci_method} is given"
+        )
+
+    if ci_method == "bootstrap":
+        return estimate_confidence_interval_by_bootstrap(
+            samples=samples,
+            alpha=alpha,
+            n_bootstrap_samples=n_bootstrap_samples,
+            random_state=random_state,
+        )
+    elif ci_method == "blb":
+        return estimate_confidence_interval_by_blb(
+            samples=samples,
+            alpha=alpha,
+            n_bootstrap_samples=n_bootstrap_samples,
+            random_state=random_state,
+        )
+    elif ci_method == "m_out_of_n":
+        return estimate_confidence_interval_by_m_out_of_n_bootstrap(
+            samples=samples,
+            alpha=alpha,
+            n_bootstrap_samples=n_bootstrap_samples,
+            random_state=random_state,
+        )
+    else:
+        return estimate_analytic_confidence_interval(
+            x=samples, alpha=alpha, ci_method=ci_method
+        )
+
+
+def estimate_analytic_confidence_interval(
+    x: np.ndarray, alpha: float = 0.05, ci_method: str = "normal"
+) -> Dict[str, float]:
+    """Estimate a two-sided confidence interval of mean of random variables analytically.
+
+    Note
+    -------
+    The lower and upper bounds are obtained from the high probability lower bounds with :math:`\\delta = \\alpha / 2`.
+    For the concentration inequalities (hoeffding and bernstein), the bounds are computed on
+    :math:`x - \\min x` and :math:`\\max x - x` so that the range of the random variables is used as `x_max`.
+
+    Parameters
+    ----------
+    x: array-like, shape (n,)
+        Size n of independent real-valued bounded random variables of interest.
+
+    alpha: float, default=0.05
+        Significance level.
+
+    ci_method: str, default='normal'
+        Method to estimate the confidence interval. Must be one of the following.
+            - normal: normal approximation of the sample mean.
+            - hoeffding: Hoeffding Inequality. See :func:`estimate_hoeffding_lower_bound`.
+            - bernstein: empirical Bernstein Inequality. See :func:`estimate_bernstein_lower_bound`.
+            - student_t: Student t distribution. See :func:`estimate_student_t_lower_bound`.
+
+    Returns
+    ----------
+    estimated_confidence_interval: Dict[str, float]
+        Dictionary storing the estimated mean and upper-lower confidence bounds.
+
+    """
+    x = np.asarray(x, dtype=float)
+    return estimate_analytic_confidence_interval_from_moments(
+        n=x.shape[0],
+        mean=x.mean(),
+        variance=var(x),
+        x_min=x.min(),
+        x_max=x.max(),
+        alpha=alpha,
+        ci_method=ci_method,
+    )
+
+
+def estimate_analytic_confidence_interval_from_moments(
+    n: int,
+    mean: float,
+    variance: float,
+    x_min: float,
+    x_max: float,
+    alpha: float = 0.05,
+    ci_method: str = "normal",
+) -> Dict[str, float]:
+    """Estimate a two-sided confidence interval of mean of random variables from their moments and range.
+
+    Note
+    -------
+    The analytic confidence intervals depend on the samples only through the sample size, mean, variance, and range.
+    Thus, they can be computed from the sufficient statistics accumulated over chunks of data,
+    without keeping the samples themselves. See :func:`estimate_analytic_confidence_interval` for details.
+
+    Parameters
+    ----------
+    n: int
+        Number of samples.
+
+    mean: float
+        Sample mean.
+
+    variance: float
+        Sample variance (with `ddof=0`).
+
+    x_min: float
+        Minimum value of the samples (or its lower bound).
+
+    x_max: float
+        Maximum value of the samples (or its upper bound).
+
+    alpha: float, default=0.05
+        Significance level.
+
+    ci_method: str, default='normal'
+        Method to estimate the confidence interval, which must be one of 'normal', 'hoeffding', 'bernstein', and 'student_t'.
+
+    Returns
+    ----------
+    estimated_confidence_interval: Dict[str, float]
+        Dictionary storing the estimated mean and upper-lower confidence bounds.
+
+    """
+    check_scalar(alpha, "alpha", float, min_val=0.0, max_val=1.0)
+    ci = _estimate_confidence_width(
+        n=n,
+        variance=variance,
+        x_range=x_max - x_min,
+        delta=alpha / 2,
+        ci_method=ci_method,
+    )
+
+    return {
+        "mean": mean,
+        f"{100 * (1. - alpha)}% CI (lower)": mean - ci,
+        f"{100 * (1. - alpha)}% CI (upper)": mean + ci,
+    }
+
+
+@dataclass
+class RoundRewardStatistics:
+    """Mergeable sufficient statistics of the round-wise rewards estimated by an OPE estimator.
+
+    Note
+    -------
+    The round-wise rewards of the IPW, DM, and DR families can be written as
+
+    .. math::
+
+        \\hat{r}_i = a_i + s \\cdot b_i,
+
+    where :math:`s = 1` for the estimators without self-normalization and
+    :math:`s = 1 / \\mathbb{E}_{n}[c_i]` for the self-normalized ones (e.g., :math:`c_i = w(x_i,a_i)` for SNIPW).
+    The estimated policy value and its analytic confidence intervals depend on the data only through
+    the sums of :math:`a_i, b_i, c_i` and their (cross) squares, which are accumulated here.
+    Thus, the statistics computed on different chunks of logged bandit data (e.g., by different worker processes)
+    can be combined by `merge` in constant memory.
+
+    For self-normalized estimators, the range of the round-wise rewards used by the concentration inequalities
+    is bounded by those of :math:`a_i` and :math:`s \\cdot b_i`, which is exact when :math:`a_i = 0`
+    (SNIPW and RM) and conservative otherwise (SNDR).
+
+    Parameters
+    -----------
+    self_normalized: bool, default=False
+        Whether the round-wise rewards are normalized by :math:`\\mathbb{E}_{n}[c_i]`.
+
+    n_rounds: int, default=0
+        Number of rounds accumulated so far.
+
+    sum_a, sum_b, sum_c, sum_aa, sum_ab, sum_bb: float, default=0.0
+        Sums of the components of the round-wise rewards and their products.
+
+    min_a, max_a, min_b, max_b: float
+        Ranges of the components of the round-wise rewards.
+
+    """
+
+    self_normalized: bool = False
+    n_rounds: int = 0
+    sum_a: float = 0.0
+    sum_b: float = 0.0
+    sum_c: float = 0.0
+    sum_aa: float = 0.0
+    sum_ab: float = 0.0
+    sum_bb: float = 0.0
+    min_a: float = np.inf
+    max_a: float = -np.inf
+    min_b: float = np.inf
+    max_b: float = -np.inf
+
+    @classmethod
+    def from_components(
+        cls,
+        a: np.ndarray,
+        b: Optional[np.ndarray] = None,
+        c: Optional[np.ndarray] = None,
+    ) -> "RoundRewardStatistics":
+        """Compute the statistics of the round-wise rewards given as :math:`a_i + s \\cdot b_i`."""
+        a = np.asarray(a, dtype=float)
+        if c is None and b is not None:
+            # without self-normalization, the round-wise rewards are simply a + b
+            a, b = a + b, None
+        b = np.zeros_like(a) if b is None else np.asarray(b, dtype=float)
+        n_rounds = a.shape[0]
+        return cls(
+            self_normalized=c is not None,
+            n_rounds=n_rounds,
+            sum_a=a.sum(),
+            sum_b=b.sum(),
+            sum_c=0.0 if c is None else np.asarray(c, dtype=float).sum(),
+            sum_aa=a @ a,
+            sum_ab=a @ b,
+            sum_bb=b @ b,
+            min_a=a.min() if n_rounds > 0 else np.inf,
+            max_a=a.max() if n_rounds > 0 else -np.inf,
+            min_b=b.min() if n_rounds > 0 else np.inf,
+            max_b=b.max() if n_rounds > 0 else -np.inf,
+        )
+
+    def merge(self, other: "RoundRewardStatistics") -> "RoundRewardStatistics":
+        """Combine the statistics computed on two disjoint chunks of logged bandit data."""
+        if self.self_normalized != other.self_normalized:
+            raise ValueError(
+                "statistics of self-normalized and non-normalized round-wise rewards cannot be merged"
+            )
+        return RoundRewardStatistics(
+            self_normalized=self.self_normalized,
+            n_rounds=self.n_rounds + other.n_rounds,
+            sum_a=self.sum_a + other.sum_a,
+            sum_b=self.sum_b + other.sum_b,
+            sum_c=self.sum_c + other.sum_c,
+            sum_aa=self.sum_aa + other.sum_aa,
+            sum_ab=self.sum_ab + other.sum_ab,
+            sum_bb=self.sum_bb + other.sum_bb,
+            min_a=min(self.min_a, other.min_a),
+            max_a=max(self.max_a, other.max_a),
+            min_b=min(self.min_b, other.min_b),
+            max_b=max(self.max_b, other.max_b),
+        )
+
+    @property
+    def scale(self) -> float:
+        """Scale :math:`s` multiplied to :math:`b_i`."""
+        if not self.self_normalized:
+            return 1.0
+        return self.n_rounds / self.sum_c if self.sum_c > 0 else 0.0
+
+    def estimate_mean(self) -> float:
+        """Estimate the mean of the round-wise rewards, i.e., the policy value."""
+        if self.n_rounds == 0:
+            raise ValueError("no round has been accumulated yet")
+        return (self.sum_a + self.scale * self.sum_b) / self.n_rounds
+
+    def estimate_variance(self) -> float:
+        """Estimate the variance (with `ddof=0`) of the round-wise rewards."""
+        s = self.scale
+        second_moment = (
+            self.sum_aa + 2 * s * self.sum_ab + (s**2) * self.sum_bb
+        ) / self.n_rounds
+        return max(second_moment - self.estimate_mean() ** 2, 0.0)
+
+    def estimate_interval(
+        self, alpha: float = 0.05, ci_method: str = "normal"
+    ) -> Dict[str, float]:
+        """Estimate the analytic confidence interval of the policy value.
+
+        Parameters
+        ----------
+        alpha: float, default=0.05
+            Significance level.
+
+        ci_method: str, default='normal'
+            Method to estimate the confidence interval, which must be one of 'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`estimate_analytic_confidence_interval` for details.
+
+        Returns
+        ----------
+        estimated_confidence_interval: Dict[str, float]
+            Dictionary storing the estimated mean and upper-lower confidence bounds.
+
+        """
+        s = self.scale
+        if self.self_normalized:
+            x_min, x_max = self.min_a + s * self.min_b, self.max_a + s * self.max_b
+        else:
+            x_min, x_max = self.min_a, self.max_a
+        return estimate_analytic_confidence_interval_from_moments(
+            n=self.n_rounds,
+            mean=self.estimate_mean(),
+            variance=self.estimate_variance(),
+            x_min=x_min,
+            x_max=x_max,
+            alpha=alpha,
+            ci_method=ci_method,
+        )
+
+
+def _fit_base_model(
+    base_model: BaseEstimator,
+    X: np.ndarray,
+    y: np.ndarray,
+    sample_weight: Optional[np.ndarray] = None,
+) -> BaseEstimator:
+    """Fit a base model, which is run by each worker of `fit_base_models`."""
+    if sample_weight is None:
+        return base_model.fit(X, y)
+    return base_model.fit(X, y, sample_weight=sample_weight)
+
+
+def fit_base_models(
+    base_model_list: List[BaseEstimator],
+    training_data: Iterable[Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]],
+    n_jobs: int = 1,
+    prefer: str = "processes",
+) -> List[BaseEstimator]:
+    """Fit each unfitted base model on the corresponding training data with `n_jobs` workers.
+
+    Note
+    -------
+    This is shared by `RegressionModel` and the classification models for OPE.
+    The training data can be a generator so that only the data being fitted
+    (or waiting to be dispatched to the workers) is kept in memory.
+    The threads of BLAS and OpenMP in each worker are limited to `cpu_count // n_workers` to avoid oversubscription.
+
+    Parameters
+    ----------
+    base_model_list: list of BaseEstimator
+        Unfitted base models.
+
+    training_data: iterable of tuple (X, y, sample_weight)
+        Training data of each base model, where `sample_weight` can be None.
+
+    n_jobs: int, default=1
+        Number of workers fitting the base models. `-1` means using all the processors.
+
+    prefer: str, default="processes"
+        Whether the workers are processes or threads, which must be either 'processes' or 'threads'.
+
+    Returns
+    ----------
+    fitted_base_model_list: list of BaseEstimator
+        Fitted base models.
+
+    """
+    n_models = len(base_model_list)
+    if n_jobs == 1:
+        return [
+            _fit_base_model(base_model, X, y, sample_weight)
+            for base_model, (X, y, sample_weight) in zip(base_model_list, training_data)
+        ]
+    # limit the threads of BLAS and OpenMP to avoid oversubscription
+    n_workers = min(effective_n_jobs(n_jobs), n_models)
+    inner_max_num_threads = max(cpu_count() // n_workers, 1)
+    parallel = Parallel(n_jobs=n_workers, prefer=prefer)
+    tasks = (
+        delayed(_fit_base_model)(base_model, X, y, sample_weight)
+        for base_model, (X, y, sample_weight) in zip(base_model_list, training_data)
+    )
+    if prefer == "threads":
+        with threadpool_limits(limits=inner_max_num_threads):
+            return parallel(tasks)
+    with parallel_backend("loky", inner_max_num_threads=inner_max_num_threads):
+        return parallel(tasks)
@@ -2,6 +2,7 @@
 # Licensed under the Apache 2.0 License.
 
 """Off-Policy Evaluation Class to Streamline OPE."""
+from copy import deepcopy
 from dataclasses import dataclass
 from logging import getLogger
 from pathlib import Path
@@ -18,11 +19,25 @@ import seaborn as sns
 from sklearn.utils import check_scalar
 
 from ..types import BanditFeedback
+from ..types import CachedActionDist
+from ..types import DeduplicatedEstimatedRewards
+from ..types import LazyActionDist
+from ..types import SparseActionDist
 from ..utils import check_array
 from ..utils import check_confidence_interval_arguments
+from ..utils import check_estimated_rewards_by_reg_model
+from ..utils import check_ope_inputs
+from ..utils import get_validation_level
+from ..utils import load_memmap_if_path
+from ..utils import validation_level
+from .estimators import BalancedInverseProbabilityWeighting as BalancedIPW
 from .estimators import BaseOffPolicyEstimator
 from .estimators import DirectMethod as DM
 from .estimators import DoublyRobust as DR
+from .estimators import InverseProbabilityWeighting as IPW
+from .estimators import ReplayMethod as RM
+from .estimators_tuning import BaseOffPolicyEstimatorTuning
+from .helper import CI_METHODS
 
 
 logger = getLogger(__name__)
@@ -41,6 +56,21 @@ class OffPolicyEvaluation:
         List of OPE estimators used to evaluate the policy value of evaluation policy.
         Estimators must follow the interface of `obp.ope.BaseOffPolicyEstimator`.
 
+    fused: bool, default=True
+        Whether to share the intermediates computed from `action_dist` across the OPE estimators.
+        When True, the action choice probabilities at the logged actions, the expected rewards over the evaluation policy,
+        and the validation of `action_dist` are computed only once per call and reused by all the built-in estimators.
+        The estimated policy values are identical to those given by `fused=False`.
+
+    chunk_size: int, default=None
+        Number of rounds processed at once.
+        When given, the inputs are sliced into chunks of rows and the OPE estimators accumulate
+        the sufficient statistics of the round-wise rewards via `partial_fit`.
+        Combined with the arrays given as `np.memmap` or paths to `.npy` files (in both `bandit_feedback` and the inputs
+        of `estimate_policy_values` and `estimate_intervals`), OPE is conducted without loading the whole arrays into memory.
+        In this case, only the estimators implementing `partial_fit` and
+        the analytic confidence intervals ('normal', 'hoeffding', 'bernstein', and 'student_t') are available.
+
     Examples
     ----------
 
@@ -86,6 +116,8 @@ class OffPolicyEvaluation:
 
     bandit_feedback: BanditFeedback
     ope_estimators: List[BaseOffPolicyEstimator]
+    fused: bool = True
+    chunk_size: Optional[int] = None
 
     def __post_init__(self) -> None:
         """Initialize class."""
@@ -98,10 +130,23 @@ class OffPolicyEvaluation:
             self.ope_estimators_[estimator.estimator_name] = estimator
             if isinstance(estimator, DM) or isinstance(estimator, DR):
                 self.is_model_dependent = True
+        check_scalar(self.fused, name="fused", target_type=bool)
+        self.bandit_feedback = {
+            key_: load_memmap_if_path(value)
+            for key_, value in self.bandit_feedback.items()
+        }
+        if self.chunk_size is not None:
+            check_scalar(self.chunk_size, name="chunk_size", target_type=int, min_val=1)
+            for estimator in self.ope_estimators:
+                if not hasattr(estimator, "partial_fit"):
+                    raise ValueError(
+                        f"{estimator.estimator_name} does not implement `partial_fit`, "
+                        "and thus it cannot be used when `chunk_size` is given"
+                    )
 
     def _create_estimator_inputs(
         self,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         estimated_rewards_by_reg_model: Optional[
             Union[np.ndarray, Dict[str, np.ndarray]]
         ] = None,
@@ -114,26 +159,71 @@ class OffPolicyEvaluation:
         p_e_a: Optional[Union[np.ndarray, Dict[str, np.ndarray]]] = None,
     ) -> Dict[str, Dict[str, np.ndarray]]:
         """Create input dictionary to estimate policy value using subclasses of `BaseOffPolicyEstimator`"""
-        check_array(array=action_dist, name="action_dist", expected_dim=3)
+        action_dist = self._load_action_dist(action_dist)
+        model_based_input = {
+            "estimated_rewards_by_reg_model": self._load_model_based_input(
+                estimated_rewards_by_reg_model
+            ),
+            "estimated_pscore": self._load_model_based_input(estimated_pscore),
+            "estimated_importance_weights": self._load_model_based_input(
+                estimated_importance_weights
+            ),
+            "action_embed": self._load_model_based_input(action_embed),
+            "pi_b": self._load_model_based_input(pi_b),
+            "p_e_a": p_e_a,
+        }
+        self._check_model_based_input(action_dist=action_dist, **model_based_input)
+        return self._assemble_estimator_inputs(
+            action_dist=action_dist, model_based_input=model_based_input
+        )
+
+    def _load_action_dist(
+        self, action_dist: Union[np.ndarray, SparseActionDist]
+    ) -> Union[np.ndarray, SparseActionDist, LazyActionDist]:
+        """Load `action_dist` given as a path or an evaluation policy and check its shape."""
+        action_dist = load_memmap_if_path(action_dist)
+        if callable(getattr(action_dist, "predict_proba", None)):
+            action_dist = LazyActionDist(
+                policy=action_dist, context=self.bandit_feedback["context"]
+            )
+        if isinstance(action_dist, LazyActionDist) and self.chunk_size is None:
+            action_dist = action_dist.toarray()
+        if self.chunk_size is not None and isinstance(action_dist, SparseActionDist):
+            raise ValueError(
+                "`action_dist` must be array-like (or a path to `.npy` file) when `chunk_size` is given"
+            )
+        if not isinstance(action_dist, (SparseActionDist, LazyActionDist)):
+            check_array(array=action_dist, name="action_dist", expected_dim=3)
+        return action_dist
+
+    def _check_model_based_input(
+        self,
+        action_dist: Union[np.ndarray, SparseActionDist, LazyActionDist],
+        estimated_rewards_by_reg_model: Optional[
+            Union[np.ndarray, Dict[str, np.ndarray]]
+        ] = None,
+        estimated_pscore: Optional[Union[np.ndarray, Dict[str, np.ndarray]]] = None,
+        estimated_importance_weights: Optional[
+            Union[np.ndarray, Dict[str, np.ndarray]]
+        ] = None,
+        action_embed: Optional[Union[np.ndarray, Dict[str, np.ndarray]]] = None,
+        pi_b: Optional[Union[np.ndarray, Dict[str, np.ndarray]]] = None,
+        p_e_a: Optional[Union[np.ndarray, Dict[str, np.ndarray]]] = None,
+    ) -> None:
+        """Check the shapes of the model-based inputs against `action_dist`."""
         if estimated_rewards_by_reg_model is None:
             pass
         elif isinstance(estimated_rewards_by_reg_model, dict):
             for estimator_name, value in estimated_rewards_by_reg_model.items():
-                check_array(
-                    array=value,
-                    name=f"estimated_rewards_by_reg_model[{estimator_name}]",
-                    expected_dim=3,
+                check_estimated_rewards_by_reg_model(
+                    value, name=f"estimated_rewards_by_reg_model[{estimator_name}]"
                 )
                 if value.shape != action_dist.shape:
                     raise ValueError(
                         f"Expected `estimated_rewards_by_reg_model[{estimator_name}].shape == action_dist.shape`, but found it False."
                     )
         else:
-            check_array(
-                array=estimated_rewards_by_reg_model,
-                name="estimated_rewards_by_reg_model",
-                expected_dim=3,
-            )
+            check_estimated_rewards_by_reg_model(estimated_rewards_by_reg_model)
             if estimated_rewards_by_reg_model.shape != action_dist.shape:
                 raise ValueError(
                     "Expected `estimated_rewards_by_reg_model.shape == action_dist.shape`, but found it False"
@@ -189,6 +279,14 @@ class OffPolicyEvaluation:
                             f"Expected `{var_name}[{estimator_name}].shape[0] == action_dist.shape[1]`, but found it False"
                         )
 
+    def _assemble_estimator_inputs(
+        self,
+        action_dist: Union[np.ndarray, SparseActionDist, LazyActionDist],
+        model_based_input: Dict[
+            str, Optional[Union[np.ndarray, Dict[str, np.ndarray]]]
+        ],
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        """Assemble the input dictionary of each estimator from the checked inputs."""
         estimator_inputs = {
             estimator_name: {
                 input_: self.bandit_feedback[input_]
@@ -197,28 +295,94 @@ class OffPolicyEvaluation:
             for estimator_name in self.ope_estimators_
         }
 
-        for estimator_name in self.ope_estimators_:
+        # the built-in estimators below access `action_dist` only through the helpers in `obp.utils`,
+        # and thus they can share the intermediates cached by `CachedActionDist`
+        fusable_estimators = (
+            RM,
+            IPW,
+            DM,
+            DR,
+            BalancedIPW,
+            BaseOffPolicyEstimatorTuning,
+        )
+        if self.fused:
+            cached_action_dist = CachedActionDist(action_dist=action_dist)
+            shared_position = self.bandit_feedback["position"]
+            if shared_position is None:
+                shared_position = np.zeros(action_dist.shape[0], dtype=int)
+
+        for estimator_name, estimator in self.ope_estimators_.items():
+            if self.fused and isinstance(estimator, fusable_estimators):
+                estimator_inputs[estimator_name]["action_dist"] = cached_action_dist
+                estimator_inputs[estimator_name]["position"] = shared_position
+            else:
+                estimator_inputs[estimator_name]["action_dist"] = action_dist
             if "pscore" in self.bandit_feedback:
                 estimator_inputs[estimator_name]["pscore"] = self.bandit_feedback[
                     "pscore"
                 ]
             else:
                 estimator_inputs[estimator_name]["pscore"] = None
-            estimator_inputs[estimator_name]["action_dist"] = action_dist
             estimator_inputs = self._preprocess_model_based_input(
                 estimator_inputs=estimator_inputs,
                 estimator_name=estimator_name,
-                model_based_input={
-                    "estimated_rewards_by_reg_model": estimated_rewards_by_reg_model,
-                    "estimated_pscore": estimated_pscore,
-                    "estimated_importance_weights": estimated_importance_weights,
-                    "action_embed": action_embed,
-                    "pi_b": pi_b,
-                    "p_e_a": p_e_a,
-                },
+                model_based_input=model_based_input,
             )
         return estimator_inputs
 
+    def _load_model_based_input(
+        self,
+        value_or_dict: Optional[Union[np.ndarray, str, Dict[str, np.ndarray]]],
+    ) -> Optional[Union[np.ndarray, Dict[str, np.ndarray]]]:
+        """Memory-map the model-based input (or the values of its dict) given as paths to `.npy` files."""
+        if isinstance(value_or_dict, dict):
+            return {
+                estimator_name: load_memmap_if_path(value)
+                for estimator_name, value in value_or_dict.items()
+            }
+        return load_memmap_if_path(value_or_dict)
+
+    def _partial_fit_estimators_by_chunk(
+        self, estimator_inputs: Dict[str, Dict[str, np.ndarray]]
+    ) -> Dict[str, BaseOffPolicyEstimator]:
+        """Accumulate the sufficient statistics of the OPE estimators over the chunks of rounds."""
+        n_rounds = self.bandit_feedback["reward"].shape[0]
+        estimators = {
+            estimator_name: deepcopy(estimator)
+            for estimator_name, estimator in self.ope_estimators_.items()
+        }
+        for start in range(0, n_rounds, self.chunk_size):
+            stop = start + self.chunk_size
+            # slice each (possibly memory-mapped) input only once per chunk and share it among the estimators
+            chunks = dict()
+            for estimator_name, estimator in estimators.items():
+                chunk_inputs = dict()
+                for input_, value in estimator_inputs[estimator_name].items():
+                    if input_ == "p_e_a" or not isinstance(
+                        value,
+                        (
+                            np.ndarray,
+                            CachedActionDist,
+                            LazyActionDist,
+                            DeduplicatedEstimatedRewards,
+                        ),
+                    ):
+                        chunk_inputs[input_] = value
+                        continue
+                    if id(value) not in chunks:
+                        if isinstance(value, CachedActionDist):
+                            chunks[id(value)] = CachedActionDist(
+                                action_dist=np.asarray(value.action_dist[start:stop])
+                            )
+                        elif isinstance(value, DeduplicatedEstimatedRewards):
+                            # share the unique table among the chunks
+                            chunks[id(value)] = value[start:stop]
+                        else:
+                            chunks[id(value)] = np.asarray(value[start:stop])
+                    chunk_inputs[input_] = chunks[id(value)]
+                estimator.partial_fit(**chunk_inputs)
+        return estimators
+
     def _preprocess_model_based_input(
         self,
         estimator_inputs: Dict[str, Optional[np.ndarray]],
@@ -241,7 +405,7 @@ class OffPolicyEvaluation:
 
     def estimate_policy_values(
         self,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         estimated_rewards_by_reg_model: Optional[
             Union[np.ndarray, Dict[str, np.ndarray]]
         ] = None,
@@ -257,8 +421,11 @@ class OffPolicyEvaluation:
 
         Parameters
         ------------
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list), SparseActionDist, or evaluation policy
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
+            An evaluation policy having the `predict_proba(context)` method (e.g., `obp.policy.IPWLearner`) can also be given.
+            Then, its action choice probabilities are computed from `bandit_feedback["context"]`,
+            chunk by chunk without materializing the whole `action_dist` when `chunk_size` is given.
 
         estimated_rewards_by_reg_model: array-like, shape (n_rounds, n_actions, len_list) or Dict[str, array-like], default=None
             Expected rewards given each round, action, and position estimated by regression model, i.e., :math:`\\hat{q}(x_i,a_i)`.
@@ -303,7 +470,6 @@ class OffPolicyEvaluation:
                     "When model dependent estimators such as DM or DR are used, `estimated_rewards_by_reg_model` must be given"
                 )
 
-        policy_value_dict = dict()
         estimator_inputs = self._create_estimator_inputs(
             action_dist=action_dist,
             estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
@@ -313,6 +479,24 @@ class OffPolicyEvaluation:
             pi_b=pi_b,
             p_e_a=p_e_a,
         )
+        return self._estimate_policy_values_given_inputs(
+            estimator_inputs=estimator_inputs
+        )
+
+    def _estimate_policy_values_given_inputs(
+        self, estimator_inputs: Dict[str, Dict[str, np.ndarray]]
+    ) -> Dict[str, float]:
+        """Estimate the policy value of evaluation policy given the input dictionary of the estimators."""
+        policy_value_dict = dict()
+        if self.chunk_size is not None:
+            for estimator_name, estimator in self._partial_fit_estimators_by_chunk(
+                estimator_inputs=estimator_inputs
+            ).items():
+                policy_value_dict[
+                    estimator_name
+                ] = estimator.estimate_policy_value_from_statistics()
+            return policy_value_dict
+
         for estimator_name, estimator in self.ope_estimators_.items():
             policy_value_dict[estimator_name] = estimator.estimate_policy_value(
                 **estimator_inputs[estimator_name]
@@ -321,7 +505,7 @@ class OffPolicyEvaluation:
 
     def estimate_intervals(
         self,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         estimated_rewards_by_reg_model: Optional[
             Union[np.ndarray, Dict[str, np.ndarray]]
         ] = None,
@@ -335,13 +519,17 @@ class OffPolicyEvaluation:
         alpha: float = 0.05,
         n_bootstrap_samples: int = 100,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
     ) -> Dict[str, Dict[str, float]]:
-        """Estimate confidence intervals of policy values using bootstrap.
+        """Estimate confidence intervals of policy values using bootstrap or an analytic method.
 
         Parameters
         ------------
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list), SparseActionDist, or evaluation policy
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
+            An evaluation policy having the `predict_proba(context)` method (e.g., `obp.policy.IPWLearner`) can also be given.
+            Then, its action choice probabilities are computed from `bandit_feedback["context"]`,
+            chunk by chunk without materializing the whole `action_dist` when `chunk_size` is given.
 
         estimated_rewards_by_reg_model: array-like, shape (n_rounds, n_actions, len_list) or Dict[str, array-like], default=None
             Estimated expected rewards given context, action, and position, i.e., :math:`\\hat{q}(x_i,a_i)`.
@@ -383,6 +571,11 @@ class OffPolicyEvaluation:
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence intervals, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         policy_value_interval_dict: Dict[str, Dict[str, float]]
@@ -395,12 +588,12 @@ class OffPolicyEvaluation:
                     "When model dependent estimators such as DM or DR are used, `estimated_rewards_by_reg_model` must be given"
                 )
 
-        check_confidence_interval_arguments(
+        self._check_interval_arguments(
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
-        policy_value_interval_dict = dict()
         estimator_inputs = self._create_estimator_inputs(
             action_dist=action_dist,
             estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
@@ -410,19 +603,76 @@ class OffPolicyEvaluation:
             pi_b=pi_b,
             p_e_a=p_e_a,
         )
+        return self._estimate_intervals_given_inputs(
+            estimator_inputs=estimator_inputs,
+            alpha=alpha,
+            n_bootstrap_samples=n_bootstrap_samples,
+            random_state=random_state,
+            ci_method=ci_method,
+        )
+
+    def _check_interval_arguments(
+        self,
+        alpha: float,
+        n_bootstrap_samples: int,
+        random_state: Optional[int],
+        ci_method: str,
+    ) -> None:
+        """Check the arguments used to estimate the confidence intervals."""
+        check_confidence_interval_arguments(
+            alpha=alpha,
+            n_bootstrap_samples=n_bootstrap_samples,
+            random_state=random_state,
+        )
+        if ci_method not in CI_METHODS:
+            raise ValueError(
+                f"`ci_method` must be one of {CI_METHODS}, but {ci_method} is given"
+            )
+        if self.chunk_size is not None and ci_method in [
+            "bootstrap",
+            "blb",
+            "m_out_of_n",
+        ]:
+            raise ValueError(
+                "When `chunk_size` is given, `ci_method` must be one of 'normal', 'hoeffding', 'bernstein', and 'student_t'"
+                f", but {ci_method} is given"
+            )
+
+    def _estimate_intervals_given_inputs(
+        self,
+        estimator_inputs: Dict[str, Dict[str, np.ndarray]],
+        alpha: float,
+        n_bootstrap_samples: int,
+        random_state: Optional[int],
+        ci_method: str,
+    ) -> Dict[str, Dict[str, float]]:
+        """Estimate confidence intervals of policy values given the input dictionary of the estimators."""
+        policy_value_interval_dict = dict()
+        if self.chunk_size is not None:
+            for estimator_name, estimator in self._partial_fit_estimators_by_chunk(
+                estimator_inputs=estimator_inputs
+            ).items():
+                policy_value_interval_dict[
+                    estimator_name
+                ] = estimator.estimate_interval_from_statistics(
+                    alpha=alpha, ci_method=ci_method
+                )
+            return policy_value_interval_dict
+
         for estimator_name, estimator in self.ope_estimators_.items():
             policy_value_interval_dict[estimator_name] = estimator.estimate_interval(
                 **estimator_inputs[estimator_name],
                 alpha=alpha,
                 n_bootstrap_samples=n_bootstrap_samples,
                 random_state=random_state,
+                ci_method=ci_method,
             )
 
         return policy_value_interval_dict
 
     def summarize_off_policy_estimates(
         self,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         estimated_rewards_by_reg_model: Optional[
             Union[np.ndarray, Dict[str, np.ndarray]]
         ] = None,
@@ -436,13 +686,17 @@ class OffPolicyEvaluation:
         alpha: float = 0.05,
         n_bootstrap_samples: int = 100,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
     ) -> Tuple[DataFrame, DataFrame]:
         """Summarize policy values and their confidence intervals estimated by OPE estimators.
 
         Parameters
         ------------
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list), SparseActionDist, or evaluation policy
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
+            An evaluation policy having the `predict_proba(context)` method (e.g., `obp.policy.IPWLearner`) can also be given.
+            Then, its action choice probabilities are computed from `bandit_feedback["context"]`,
+            chunk by chunk without materializing the whole `action_dist` when `chunk_size` is given.
 
         estimated_rewards_by_reg_model: array-like, shape (n_rounds, n_actions, len_list) or Dict[str, array-like], default=None
             Expected rewards given each round, action, and position estimated by regression model, i.e., :math:`\\hat{q}(x_i,a_i)`.
@@ -484,6 +738,11 @@ class OffPolicyEvaluation:
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence intervals, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         (policy_value_df, policy_value_interval_df): Tuple[DataFrame, DataFrame]
@@ -514,6 +773,7 @@ class OffPolicyEvaluation:
                 alpha=alpha,
                 n_bootstrap_samples=n_bootstrap_samples,
                 random_state=random_state,
+                ci_method=ci_method,
             )
         )
         policy_value_of_behavior_policy = self.bandit_feedback["reward"].mean()
@@ -531,7 +791,7 @@ class OffPolicyEvaluation:
 
     def visualize_off_policy_estimates(
         self,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         estimated_rewards_by_reg_model: Optional[
             Union[np.ndarray, Dict[str, np.ndarray]]
         ] = None,
@@ -553,8 +813,11 @@ class OffPolicyEvaluation:
 
         Parameters
         ----------
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list), SparseActionDist, or evaluation policy
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
+            An evaluation policy having the `predict_proba(context)` method (e.g., `obp.policy.IPWLearner`) can also be given.
+            Then, its action choice probabilities are computed from `bandit_feedback["context"]`,
+            chunk by chunk without materializing the whole `action_dist` when `chunk_size` is given.
 
         estimated_rewards_by_reg_model: array-like, shape (n_rounds, n_actions, len_list) or Dict[str, array-like], default=None
             Estimated expected rewards given context, action, and position, i.e., :math:`\\hat{q}(x_i,a_i)`.
@@ -657,7 +920,7 @@ class OffPolicyEvaluation:
     def evaluate_performance_of_estimators(
         self,
         ground_truth_policy_value: float,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         estimated_rewards_by_reg_model: Optional[
             Union[np.ndarray, Dict[str, np.ndarray]]
         ] = None,
@@ -693,8 +956,11 @@ class OffPolicyEvaluation:
             Ground_truth policy value of evaluation policy, i.e., :math:`V(\\pi_e)`.
             With Open Bandit Dataset, we use an on-policy estimate of the policy value as its ground-truth.
 
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list), SparseActionDist, or evaluation policy
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
+            An evaluation policy having the `predict_proba(context)` method (e.g., `obp.policy.IPWLearner`) can also be given.
+            Then, its action choice probabilities are computed from `bandit_feedback["context"]`,
+            chunk by chunk without materializing the whole `action_dist` when `chunk_size` is given.
 
         estimated_rewards_by_reg_model: array-like, shape (n_rounds, n_actions, len_list) or Dict[str, array-like], default=None
             Estimated expected rewards given context, action, and position, i.e., :math:`\\hat{q}(x_i,a_i)`.
@@ -777,7 +1043,7 @@ class OffPolicyEvaluation:
     def summarize_estimators_comparison(
         self,
         ground_truth_policy_value: float,
-        action_dist: np.ndarray,
+        action_dist: Union[np.ndarray, SparseActionDist],
         estimated_rewards_by_reg_model: Optional[
             Union[np.ndarray, Dict[str, np.ndarray]]
         ] = None,
@@ -798,8 +1064,11 @@ class OffPolicyEvaluation:
             Ground_truth policy value of evaluation policy, i.e., :math:`V(\\pi_e)`.
             With Open Bandit Dataset, we use an on-policy estimate of the policy value as ground-truth.
 
-        action_dist: array-like, shape (n_rounds, n_actions, len_list)
+        action_dist: array-like, shape (n_rounds, n_actions, len_list), SparseActionDist, or evaluation policy
             Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
+            An evaluation policy having the `predict_proba(context)` method (e.g., `obp.policy.IPWLearner`) can also be given.
+            Then, its action choice probabilities are computed from `bandit_feedback["context"]`,
+            chunk by chunk without materializing the whole `action_dist` when `chunk_size` is given.
 
         estimated_rewards_by_reg_model: array-like, shape (n_rounds, n_actions, len_list), default=None
             Estimated expected rewards given context, action, and position, i.e., :math:`\\hat{q}(x_i,a_i)`.
@@ -859,7 +1128,7 @@ class OffPolicyEvaluation:
     def visualize_off_policy_estimates_of_multiple_policies(
         self,
         policy_name_list: List[str],
-        action_dist_list: List[np.ndarray],
+        action_dist_list: Union[np.ndarray, List[np.ndarray]],
         estimated_rewards_by_reg_model: Optional[
             Union[np.ndarray, Dict[str, np.ndarray]]
         ] = None,
@@ -884,8 +1153,8 @@ class OffPolicyEvaluation:
         policy_name_list: List[str]
             List of the names of evaluation policies.
 
-        action_dist_list: List[array-like, shape (n_rounds, n_actions, len_list)]
-            List of action choice probabilities of the evaluation policies (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
+        action_dist_list: array-like, shape (n_policies, n_rounds, n_actions, len_list) or List[array-like]
+            Action choice probabilities of the evaluation policies (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
         estimated_rewards_by_reg_model: array-like, shape (n_rounds, n_actions, len_list) or Dict[str, array-like], default=None
             Estimated expected rewards given context, action, and position, i.e., :math:`\\hat{q}(x_i,a_i)`.
@@ -939,10 +1208,6 @@ class OffPolicyEvaluation:
             Name of the bar figure.
 
         """
-        if len(policy_name_list) != len(action_dist_list):
-            raise ValueError(
-                "the length of `policy_name_list` must be the same as `action_dist_list`"
-            )
         if fig_dir is not None:
             assert isinstance(fig_dir, Path), "`fig_dir` must be a Path"
         if fig_name is not None:
@@ -952,16 +1217,17 @@ class OffPolicyEvaluation:
             estimator_name: {} for estimator_name in self.ope_estimators_
         }
 
-        for policy_name, action_dist in zip(policy_name_list, action_dist_list):
-            estimator_inputs = self._create_estimator_inputs(
-                action_dist=action_dist,
-                estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
-                estimated_pscore=estimated_pscore,
-                estimated_importance_weights=estimated_importance_weights,
-                action_embed=action_embed,
-                pi_b=pi_b,
-                p_e_a=p_e_a,
-            )
+        estimator_inputs_dict = self._create_estimator_inputs_of_multiple_policies(
+            policy_name_list=policy_name_list,
+            action_dist_list=action_dist_list,
+            estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
+            estimated_pscore=estimated_pscore,
+            estimated_importance_weights=estimated_importance_weights,
+            action_embed=action_embed,
+            pi_b=pi_b,
+            p_e_a=p_e_a,
+        )
+        for policy_name, estimator_inputs in estimator_inputs_dict.items():
             for estimator_name, estimator in self.ope_estimators_.items():
                 estimated_round_rewards_dict[estimator_name][
                     policy_name
@@ -997,3 +1263,428 @@ class OffPolicyEvaluation:
 
         if fig_dir:
             fig.savefig(str(fig_dir / fig_name))
+
+    def _create_estimator_inputs_of_multiple_policies(
+        self,
+        policy_name_list: List[str],
+        action_dist_list: Union[np.ndarray, List[Union[np.ndarray, SparseActionDist]]],
+        estimated_rewards_by_reg_model: Optional[
+            Union[np.ndarray, Dict[str, np.ndarray]]
+        ] = None,
+        estimated_pscore: Optional[Union[np.ndarray, Dict[str, np.ndarray]]] = None,
+        estimated_importance_weights: Optional[
+            Union[np.ndarray, Dict[str, np.ndarray]]
+        ] = None,
+        action_embed: Optional[Union[np.ndarray, Dict[str, np.ndarray]]] = None,
+        pi_b: Optional[Union[np.ndarray, Dict[str, np.ndarray]]] = None,
+        p_e_a: Optional[Union[np.ndarray, Dict[str, np.ndarray]]] = None,
+    ) -> Dict[str, Dict[str, Dict[str, np.ndarray]]]:
+        """Create input dictionaries of multiple evaluation policies sharing the validation and the intermediates.
+
+        Note
+        ------
+        The logged bandit data and the model-based inputs do not depend on the evaluation policy.
+        Thus, they are checked only with the first policy, and the action distributions of all the policies are validated here at once.
+        The estimators then skip their input checks for the other policies (see `_get_validation_level_of_policy`).
+        When `fused=True`, the intermediates shared by the estimators are computed for all the policies at once
+        if the action distributions are stacked in an array, given as `SparseActionDist`, or given as evaluation policies having `predict_proba`.
+
+        """
+        if isinstance(action_dist_list, np.ndarray):
+            check_array(array=action_dist_list, name="action_dist_list", expected_dim=4)
+        if len(policy_name_list) != len(action_dist_list):
+            raise ValueError(
+                "the length of `policy_name_list` must be the same as `action_dist_list`"
+            )
+        action_dist_list = self._load_action_dist_list(action_dist_list)
+        model_based_input = {
+            "estimated_rewards_by_reg_model": self._load_model_based_input(
+                estimated_rewards_by_reg_model
+            ),
+            "estimated_pscore": self._load_model_based_input(estimated_pscore),
+            "estimated_importance_weights": self._load_model_based_input(
+                estimated_importance_weights
+            ),
+            "action_embed": self._load_model_based_input(action_embed),
+            "pi_b": self._load_model_based_input(pi_b),
+            "p_e_a": p_e_a,
+        }
+        self._check_model_based_input(
+            action_dist=action_dist_list[0], **model_based_input
+        )
+        estimator_inputs_dict = {
+            policy_name: self._assemble_estimator_inputs(
+                action_dist=action_dist, model_based_input=model_based_input
+            )
+            for policy_name, action_dist in zip(policy_name_list, action_dist_list)
+        }
+        if self.chunk_size is not None:
+            # the action distributions are validated chunk by chunk by the estimators
+            return estimator_inputs_dict
+
+        # validate the action distributions of all the policies at once
+        position = self.bandit_feedback["position"]
+        if position is None:
+            position = np.zeros(action_dist_list[0].shape[0], dtype=int)
+        n_policies = len(action_dist_list)
+        stacked_action_dist = None
+        if isinstance(action_dist_list, np.ndarray):
+            stacked_action_dist = action_dist_list
+            if get_validation_level() == "strict":
+                if not np.allclose(action_dist_list.sum(axis=2), 1):
+                    raise ValueError("`action_dist` must be a probability distribution")
+        elif all(
+            isinstance(action_dist, SparseActionDist)
+            for action_dist in action_dist_list
+        ) and (
+            all(action_dist.factual is not None for action_dist in action_dist_list)
+            or all(action_dist.has_support for action_dist in action_dist_list)
+        ):
+            # the policies are concatenated along the rounds
+            stacked_action_dist = SparseActionDist.concatenate(action_dist_list)
+            check_ope_inputs(
+                action_dist=stacked_action_dist, position=np.tile(position, n_policies)
+            )
+        else:
+            for action_dist in action_dist_list:
+                check_ope_inputs(action_dist=action_dist, position=position)
+
+        # fill the caches of the fused estimators with the intermediates computed for all the policies at once
+        fused_inputs_list = [
+            [
+                estimator_inputs
+                for estimator_inputs in estimator_inputs_dict[policy_name].values()
+                if isinstance(estimator_inputs["action_dist"], CachedActionDist)
+            ]
+            for policy_name in policy_name_list
+        ]
+        if len(fused_inputs_list[0]) == 0 or stacked_action_dist is None:
+            return estimator_inputs_dict
+        action = self.bandit_feedback["action"]
+        position = fused_inputs_list[0][0]["position"]
+        n_rounds = action.shape[0]
+        rounds = np.arange(n_rounds)
+        q_hat_pi_e_dict = dict()
+        if isinstance(stacked_action_dist, np.ndarray):
+            factual_action_dist = stacked_action_dist[:, rounds, action, position]
+            action_dist_at_position = stacked_action_dist.transpose(0, 1, 3, 2)[
+                :, rounds, position
+            ]
+            for estimator_inputs in fused_inputs_list[0]:
+                q_hat = estimator_inputs["estimated_rewards_by_reg_model"]
+                if q_hat is not None and id(q_hat) not in q_hat_pi_e_dict:
+                    q_hat_pi_e_dict[id(q_hat)] = np.einsum(
+                        "kna,na->kn",
+                        action_dist_at_position,
+                        q_hat[rounds, :, position],
+                    ) / action_dist_at_position.sum(axis=2)
+        else:
+            stacked_position = np.tile(position, n_policies)
+            factual_action_dist = stacked_action_dist.take_factual(
+                action=np.tile(action, n_policies), position=stacked_position
+            ).reshape((n_policies, n_rounds))
+            for estimator_inputs in fused_inputs_list[0]:
+                q_hat = estimator_inputs["estimated_rewards_by_reg_model"]
+                if (
+                    q_hat is not None
+                    and id(q_hat) not in q_hat_pi_e_dict
+                    and stacked_action_dist.has_support
+                ):
+                    # index the estimated rewards of the concatenated rounds without copying them
+                    if isinstance(q_hat, DeduplicatedEstimatedRewards):
+                        stacked_q_hat = DeduplicatedEstimatedRewards(
+                            unique_estimated_rewards=q_hat.unique_estimated_rewards,
+                            inverse_index=np.tile(q_hat.inverse_index, n_policies),
+                        )
+                    else:
+                        stacked_q_hat = DeduplicatedEstimatedRewards(
+                            unique_estimated_rewards=np.asarray(q_hat),
+                            inverse_index=np.tile(rounds, n_policies),
+                        )
+                    q_hat_pi_e_dict[
+                        id(q_hat)
+                    ] = stacked_action_dist.average_at_position(
+                        values=stacked_q_hat, position=stacked_position
+                    ).reshape(
+                        (n_policies, n_rounds)
+                    )
+
+        for k, fused_inputs in enumerate(fused_inputs_list):
+            cached_action_dist = fused_inputs[0]["action_dist"]
+            position_ = fused_inputs[0]["position"]
+            cached_action_dist.get_or_compute(
+                name="check", arrays=(), compute=lambda: None
+            )
+            cached_action_dist.get_or_compute(
+                name="factual",
+                arrays=(action, position_),
+                compute=lambda: factual_action_dist[k],
+            )
+            for estimator_inputs in fused_inputs:
+                q_hat = estimator_inputs["estimated_rewards_by_reg_model"]
+                if q_hat is not None and id(q_hat) in q_hat_pi_e_dict:
+                    cached_action_dist.get_or_compute(
+                        name="average",
+                        arrays=(q_hat, position_),
+                        compute=lambda: q_hat_pi_e_dict[id(q_hat)][k],
+                    )
+        return estimator_inputs_dict
+
+    def _load_action_dist_list(
+        self,
+        action_dist_list: Union[np.ndarray, List[Union[np.ndarray, SparseActionDist]]],
+    ) -> Union[np.ndarray, List[Union[np.ndarray, SparseActionDist, LazyActionDist]]]:
+        """Load the action distributions of multiple evaluation policies, which must share the same shape."""
+        if isinstance(action_dist_list, np.ndarray):
+            return action_dist_list
+        if self.chunk_size is None and all(
+            callable(getattr(action_dist, "predict_proba", None))
+            for action_dist in action_dist_list
+        ):
+            # compute the action distributions of the evaluation policies directly into a stacked array
+            action_dist = self._load_action_dist(action_dist_list[0])
+            stacked_action_dist = np.empty(
+                (len(action_dist_list),) + action_dist.shape, dtype=action_dist.dtype
+            )
+            stacked_action_dist[0] = action_dist
+            for k, policy in enumerate(action_dist_list[1:], 1):
+                action_dist = self._load_action_dist(policy)
+                if action_dist.shape != stacked_action_dist.shape[1:]:
+                    raise ValueError(
+                        "the action distributions of all the evaluation policies must have the same shape"
+                    )
+                stacked_action_dist[k] = action_dist
+            return stacked_action_dist
+        action_dist_list = [
+            self._load_action_dist(action_dist) for action_dist in action_dist_list
+        ]
+        for action_dist in action_dist_list[1:]:
+            if action_dist.shape != action_dist_list[0].shape:
+                raise ValueError(
+                    "the action distributions of all the evaluation policies must have the same shape"
+                )
+        return action_dist_list
+
+    def _get_validation_level_of_policy(self, k: int) -> str:
+        """Obtain the validation level used by the estimators for the `k`-th evaluation policy.
+
+        The inputs of the other policies than the first one have been validated by
+        `_create_estimator_inputs_of_multiple_policies`, and thus the estimators skip their input checks.
+        The level is set by `obp.utils.validation_level`, which affects only the current thread.
+
+        """
+        if k == 0 or self.chunk_size is not None:
+            return get_validation_level()
+        return "off"
+
+    def estimate_policy_values_of_multiple_policies(
+        self,
+        policy_name_list: List[str],
+        action_dist_list: Union[np.ndarray, List[Union[np.ndarray, SparseActionDist]]],
+        estimated_rewards_by_reg_model: Optional[
+            Union[np.ndarray, Dict[str, np.ndarray]]
+        ] = None,
+        estimated_pscore: Optional[Union[np.ndarray, Dict[str, np.ndarray]]] = None,
+        estimated_importance_weights: Optional[
+            Union[np.ndarray, Dict[str, np.ndarray]]
+        ] = None,
+        action_embed: Optional[Union[np.ndarray, Dict[str, np.ndarray]]] = None,
+        pi_b: Optional[Union[np.ndarray, Dict[str, np.ndarray]]] = None,
+        p_e_a: Optional[Union[np.ndarray, Dict[str, np.ndarray]]] = None,
+    ) -> Dict[str, Dict[str, float]]:
+        """Estimate the policy values of multiple evaluation policies.
+
+        Parameters
+        ------------
+        policy_name_list: List[str]
+            List of the names of evaluation policies.
+
+        action_dist_list: array-like, shape (n_policies, n_rounds, n_actions, len_list) or List[array-like or SparseActionDist]
+            Action choice probabilities of the evaluation policies (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
+            When they are stacked in an array, the intermediates shared by the estimators
+            (such as :math:`\\pi_e(a_i|x_i)` and :math:`\\hat{q}(x_i,\\pi_e)`) are computed for all the policies at once.
+
+        estimated_rewards_by_reg_model: array-like, shape (n_rounds, n_actions, len_list) or Dict[str, array-like], default=None
+            Estimated expected rewards given context, action, and position, i.e., :math:`\\hat{q}(x_i,a_i)`.
+            When an array-like is given, all OPE estimators use it.
+            When a dict with an estimator's name as its key is given, the corresponding value is used for the estimator.
+            If None, model-dependent estimators such as DM and DR cannot be used.
+
+        estimated_pscore: array-like, shape (n_rounds,), default=None
+            Estimated behavior policy (propensity scores), i.e., :math:`\\hat{\\pi}_b(a_i|x_i)`.
+            When an array-like is given, all OPE estimators use it.
+            When a dict with an estimator's name as its key is given, the corresponding value is used for the estimator.
+
+        estimated_importance_weights: array-like, shape (n_rounds,)  or Dict[str, array-like], default=None
+            Importance weights estimated via supervised classification implemented by `obp.ope.ImportanceWeightEstimator`.
+            When an array-like is given, all OPE estimators use it.
+            When a dict with an estimator's name as its key is given, the corresponding value is used for the estimator.
+
+        action_embed: array-like, shape (n_rounds, dim_action_embed)
+            Context vectors characterizing actions or action embeddings such as item category information.
+            This is used to estimate the marginal importance weights.
+
+        pi_b: array-like, shape (n_rounds, n_actions, len_list)
+            Action choice probabilities of the logging/behavior policy, i.e., :math:`\\pi_b(a_i|x_i)`.
+
+        p_e_a: array-like, shape (n_actions, n_cat_per_dim, n_cat_dim), default=None
+            Conditional distribution of action embeddings given each action.
+            This distribution is available only when we use synthetic bandit data, i.e.,
+            `obp.dataset.SyntheticBanditDatasetWithActionEmbeds`.
+            See the output of the `obtain_batch_bandit_feedback` argument of this class.
+            If `p_e_a` is given, MIPW uses the true marginal importance weights based on this distribution.
+            The performance of MIPW with the true weights is useful in synthetic experiments of research papers.
+
+        Returns
+        ----------
+        policy_value_dict: Dict[str, Dict[str, float]]
+            Dictionary containing the policy values of each evaluation policy estimated by OPE estimators.
+
+        """
+        if self.is_model_dependent:
+            if estimated_rewards_by_reg_model is None:
+                raise ValueError(
+                    "When model dependent estimators such as DM or DR are used, `estimated_rewards_by_reg_model` must be given"
+                )
+
+        estimator_inputs_dict = self._create_estimator_inputs_of_multiple_policies(
+            policy_name_list=policy_name_list,
+            action_dist_list=action_dist_list,
+            estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
+            estimated_pscore=estimated_pscore,
+            estimated_importance_weights=estimated_importance_weights,
+            action_embed=action_embed,
+            pi_b=pi_b,
+            p_e_a=p_e_a,
+        )
+        policy_value_dict = dict()
+        for k, (policy_name, estimator_inputs) in enumerate(
+            estimator_inputs_dict.items()
+        ):
+            with validation_level(self._get_validation_level_of_policy(k)):
+                policy_value_dict[
+                    policy_name
+                ] = self._estimate_policy_values_given_inputs(
+                    estimator_inputs=estimator_inputs
+                )
+        return policy_value_dict
+
+    def estimate_intervals_of_multiple_policies(
+        self,
+        policy_name_list: List[str],
+        action_dist_list: Union[np.ndarray, List[Union[np.ndarray, SparseActionDist]]],
+        estimated_rewards_by_reg_model: Optional[
+            Union[np.ndarray, Dict[str, np.ndarray]]
+        ] = None,
+        estimated_pscore: Optional[Union[np.ndarray, Dict[str, np.ndarray]]] = None,
+        estimated_importance_weights: Optional[
+            Union[np.ndarray, Dict[str, np.ndarray]]
+        ] = None,
+        action_embed: Optional[Union[np.ndarray, Dict[str, np.ndarray]]] = None,
+        pi_b: Optional[Union[np.ndarray, Dict[str, np.ndarray]]] = None,
+        p_e_a: Optional[Union[np.ndarray, Dict[str, np.ndarray]]] = None,
+        alpha: float = 0.05,
+        n_bootstrap_samples: int = 100,
+        random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
+    ) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Estimate confidence intervals of the policy values of multiple evaluation policies.
+
+        Parameters
+        ------------
+        policy_name_list: List[str]
+            List of the names of evaluation policies.
+
+        action_dist_list: array-like, shape (n_policies, n_rounds, n_actions, len_list) or List[array-like or SparseActionDist]
+            Action choice probabilities of the evaluation policies (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
+            When they are stacked in an array, the intermediates shared by the estimators
+            (such as :math:`\\pi_e(a_i|x_i)` and :math:`\\hat{q}(x_i,\\pi_e)`) are computed for all the policies at once.
+
+        estimated_rewards_by_reg_model: array-like, shape (n_rounds, n_actions, len_list) or Dict[str, array-like], default=None
+            Estimated expected rewards given context, action, and position, i.e., :math:`\\hat{q}(x_i,a_i)`.
+            When an array-like is given, all OPE estimators use it.
+            When a dict with an estimator's name as its key is given, the corresponding value is used for the estimator.
+            If None, model-dependent estimators such as DM and DR cannot be used.
+
+        estimated_pscore: array-like, shape (n_rounds,), default=None
+            Estimated behavior policy (propensity scores), i.e., :math:`\\hat{\\pi}_b(a_i|x_i)`.
+            When an array-like is given, all OPE estimators use it.
+            When a dict with an estimator's name as its key is given, the corresponding value is used for the estimator.
+
+        estimated_importance_weights: array-like, shape (n_rounds,)  or Dict[str, array-like], default=None
+            Importance weights estimated via supervised classification implemented by `obp.ope.ImportanceWeightEstimator`.
+            When an array-like is given, all OPE estimators use it.
+            When a dict with an estimator's name as its key is given, the corresponding value is used for the estimator.
+
+        action_embed: array-like, shape (n_rounds, dim_action_embed)
+            Context vectors characterizing actions or action embeddings such as item category information.
+            This is used to estimate the marginal importance weights.
+
+        pi_b: array-like, shape (n_rounds, n_actions, len_list)
+            Action choice probabilities of the logging/behavior policy, i.e., :math:`\\pi_b(a_i|x_i)`.
+
+        p_e_a: array-like, shape (n_actions, n_cat_per_dim, n_cat_dim), default=None
+            Conditional distribution of action embeddings given each action.
+            This distribution is available only when we use synthetic bandit data, i.e.,
+            `obp.dataset.SyntheticBanditDatasetWithActionEmbeds`.
+            See the output of the `obtain_batch_bandit_feedback` argument of this class.
+            If `p_e_a` is given, MIPW uses the true marginal importance weights based on this distribution.
+            The performance of MIPW with the true weights is useful in synthetic experiments of research papers.
+
+        alpha: float, default=0.05
+            Significance level.
+
+        n_bootstrap_samples: int, default=100
+            Number of resampling performed in bootstrap sampling.
+
+        random_state: int, default=None
+            Controls the random seed in bootstrap sampling.
+
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence intervals, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
+        Returns
+        ----------
+        policy_value_interval_dict: Dict[str, Dict[str, Dict[str, float]]]
+            Dictionary containing confidence intervals of the policy values of each evaluation policy.
+
+        """
+        if self.is_model_dependent:
+            if estimated_rewards_by_reg_model is None:
+                raise ValueError(
+                    "When model dependent estimators such as DM or DR are used, `estimated_rewards_by_reg_model` must be given"
+                )
+
+        self._check_interval_arguments(
+            alpha=alpha,
+            n_bootstrap_samples=n_bootstrap_samples,
+            random_state=random_state,
+            ci_method=ci_method,
+        )
+        estimator_inputs_dict = self._create_estimator_inputs_of_multiple_policies(
+            policy_name_list=policy_name_list,
+            action_dist_list=action_dist_list,
+            estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
+            estimated_pscore=estimated_pscore,
+            estimated_importance_weights=estimated_importance_weights,
+            action_embed=action_embed,
+            pi_b=pi_b,
+            p_e_a=p_e_a,
+        )
+        policy_value_interval_dict = dict()
+        for k, (policy_name, estimator_inputs) in enumerate(
+            estimator_inputs_dict.items()
+        ):
+            with validation_level(self._get_validation_level_of_policy(k)):
+                policy_value_interval_dict[
+                    policy_name
+                ] = self._estimate_intervals_given_inputs(
+                    estimator_inputs=estimator_inputs,
+                    alpha=alpha,
+                    n_bootstrap_samples=n_bootstrap_samples,
+                    random_state=random_state,
+                    ci_method=ci_method,
+                )
+        return policy_value_interval_dict
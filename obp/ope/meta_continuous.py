@@ -22,6 +22,7 @@ from ..utils import check_array
 from ..utils import check_confidence_interval_arguments
 from .estimators_continuous import BaseContinuousOffPolicyEstimator
 from .estimators_continuous import KernelizedDoublyRobust as KDR
+from .helper import CI_METHODS
 
 
 logger = getLogger(__name__)
@@ -230,8 +231,9 @@ class ContinuousOffPolicyEvaluation:
         alpha: float = 0.05,
         n_bootstrap_samples: int = 100,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
     ) -> Dict[str, Dict[str, float]]:
-        """Estimate confidence intervals of policy values using bootstrap.
+        """Estimate confidence intervals of policy values using bootstrap or an analytic method.
 
         Parameters
         ------------
@@ -253,6 +255,11 @@ class ContinuousOffPolicyEvaluation:
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence intervals, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         policy_value_interval_dict: Dict[str, Dict[str, float]]
@@ -270,6 +277,10 @@ class ContinuousOffPolicyEvaluation:
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
         )
+        if ci_method not in CI_METHODS:
+            raise ValueError(
+                f"`ci_method` must be one of {CI_METHODS}, but {ci_method} is given"
+            )
         policy_value_interval_dict = dict()
         estimator_inputs = self._create_estimator_inputs(
             action_by_evaluation_policy=action_by_evaluation_policy,
@@ -281,6 +292,7 @@ class ContinuousOffPolicyEvaluation:
                 alpha=alpha,
                 n_bootstrap_samples=n_bootstrap_samples,
                 random_state=random_state,
+                ci_method=ci_method,
             )
 
         return policy_value_interval_dict
@@ -294,6 +306,7 @@ class ContinuousOffPolicyEvaluation:
         alpha: float = 0.05,
         n_bootstrap_samples: int = 100,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
     ) -> Tuple[DataFrame, DataFrame]:
         """Summarize policy values and their confidence intervals estimated by OPE estimators.
 
@@ -317,6 +330,11 @@ class ContinuousOffPolicyEvaluation:
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence intervals, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         (policy_value_df, policy_value_interval_df): Tuple[DataFrame, DataFrame]
@@ -337,6 +355,7 @@ class ContinuousOffPolicyEvaluation:
                 alpha=alpha,
                 n_bootstrap_samples=n_bootstrap_samples,
                 random_state=random_state,
+                ci_method=ci_method,
             )
         )
         policy_value_of_behavior_policy = self.bandit_feedback["reward"].mean()
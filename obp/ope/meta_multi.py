@@ -23,6 +23,7 @@ from .estimators import DirectMethod as DM
 from .estimators_multi import MultiLoggersBalancedDoublyRobust as BalDR
 from .estimators_multi import MultiLoggersNaiveDoublyRobust as NaiveDR
 from .estimators_multi import MultiLoggersWeightedDoublyRobust as WeightedDR
+from .helper import CI_METHODS
 from .meta import OffPolicyEvaluation
 
 
@@ -266,8 +267,9 @@ class MultiLoggersOffPolicyEvaluation(OffPolicyEvaluation):
         alpha: float = 0.05,
         n_bootstrap_samples: int = 100,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
     ) -> Dict[str, Dict[str, float]]:
-        """Estimate confidence intervals of policy values using bootstrap.
+        """Estimate confidence intervals of policy values using bootstrap or an analytic method.
 
         Parameters
         ------------
@@ -299,6 +301,11 @@ class MultiLoggersOffPolicyEvaluation(OffPolicyEvaluation):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence intervals, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         policy_value_interval_dict: Dict[str, Dict[str, float]]
@@ -316,6 +323,10 @@ class MultiLoggersOffPolicyEvaluation(OffPolicyEvaluation):
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
         )
+        if ci_method not in CI_METHODS:
+            raise ValueError(
+                f"`ci_method` must be one of {CI_METHODS}, but {ci_method} is given"
+            )
         policy_value_interval_dict = dict()
         estimator_inputs = self._create_estimator_inputs(
             action_dist=action_dist,
@@ -329,6 +340,7 @@ class MultiLoggersOffPolicyEvaluation(OffPolicyEvaluation):
                 alpha=alpha,
                 n_bootstrap_samples=n_bootstrap_samples,
                 random_state=random_state,
+                ci_method=ci_method,
             )
 
         return policy_value_interval_dict
@@ -344,6 +356,7 @@ class MultiLoggersOffPolicyEvaluation(OffPolicyEvaluation):
         alpha: float = 0.05,
         n_bootstrap_samples: int = 100,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
     ) -> Tuple[DataFrame, DataFrame]:
         """Summarize policy values and their confidence intervals estimated by OPE estimators.
 
@@ -377,6 +390,11 @@ class MultiLoggersOffPolicyEvaluation(OffPolicyEvaluation):
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence intervals, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         (policy_value_df, policy_value_interval_df): Tuple[DataFrame, DataFrame]
@@ -401,6 +419,7 @@ class MultiLoggersOffPolicyEvaluation(OffPolicyEvaluation):
                 alpha=alpha,
                 n_bootstrap_samples=n_bootstrap_samples,
                 random_state=random_state,
+                ci_method=ci_method,
             )
         )
         policy_value_of_behavior_policy = self.bandit_feedback["reward"].mean()
@@ -20,6 +20,7 @@ from ..types import BanditFeedback
 from ..utils import check_confidence_interval_arguments
 from .estimators_slate import BaseSlateOffPolicyEstimator
 from .estimators_slate import SlateCascadeDoublyRobust as CascadeDR
+from .helper import CI_METHODS
 
 
 logger = getLogger(__name__)
@@ -251,8 +252,9 @@ class SlateOffPolicyEvaluation:
         alpha: float = 0.05,
         n_bootstrap_samples: int = 100,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
     ) -> Dict[str, Dict[str, float]]:
-        """Estimate the confidence intervals of the policy values using bootstrap.
+        """Estimate the confidence intervals of the policy values using bootstrap or an analytic method.
 
         Parameters
         ------------
@@ -286,6 +288,11 @@ class SlateOffPolicyEvaluation:
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence intervals, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         policy_value_interval_dict: Dict[str, Dict[str, float]]
@@ -297,6 +304,10 @@ class SlateOffPolicyEvaluation:
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
         )
+        if ci_method not in CI_METHODS:
+            raise ValueError(
+                f"`ci_method` must be one of {CI_METHODS}, but {ci_method} is given"
+            )
         policy_value_interval_dict = dict()
         estimator_inputs = self._create_estimator_inputs(
             evaluation_policy_pscore=evaluation_policy_pscore,
@@ -311,6 +322,7 @@ class SlateOffPolicyEvaluation:
                 alpha=alpha,
                 n_bootstrap_samples=n_bootstrap_samples,
                 random_state=random_state,
+                ci_method=ci_method,
             )
 
         return policy_value_interval_dict
@@ -325,8 +337,9 @@ class SlateOffPolicyEvaluation:
         alpha: float = 0.05,
         n_bootstrap_samples: int = 100,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
     ) -> Tuple[DataFrame, DataFrame]:
-        """Summarize the estimated policy values and their confidence intervals estimated by bootstrap.
+        """Summarize the estimated policy values and their confidence intervals estimated by bootstrap or an analytic method.
 
         Parameters
         ------------
@@ -361,6 +374,11 @@ class SlateOffPolicyEvaluation:
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence intervals, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         Returns
         ----------
         (policy_value_df, policy_value_interval_df): Tuple[DataFrame, DataFrame]
@@ -387,6 +405,7 @@ class SlateOffPolicyEvaluation:
                 alpha=alpha,
                 n_bootstrap_samples=n_bootstrap_samples,
                 random_state=random_state,
+                ci_method=ci_method,
             )
         )
         policy_value_of_behavior_policy = (
@@ -416,6 +435,7 @@ class SlateOffPolicyEvaluation:
         is_relative: bool = False,
         n_bootstrap_samples: int = 100,
         random_state: Optional[int] = None,
+        ci_method: str = "bootstrap",
         fig_dir: Optional[Path] = None,
         fig_name: str = "estimated_policy_value.png",
     ) -> None:
@@ -453,6 +473,11 @@ class SlateOffPolicyEvaluation:
         random_state: int, default=None
             Controls the random seed in bootstrap sampling.
 
+        ci_method: str, default='bootstrap'
+            Method to estimate the confidence intervals, which must be one of 'bootstrap', 'blb', 'm_out_of_n',
+            'normal', 'hoeffding', 'bernstein', and 'student_t'.
+            See :func:`obp.ope.helper.estimate_confidence_interval` for details.
+
         is_relative: bool, default=False,
             If True, the method visualizes the estimated policy values of evaluation policy
             relative to the ground-truth policy value of behavior policy.
@@ -479,6 +504,7 @@ class SlateOffPolicyEvaluation:
             alpha=alpha,
             n_bootstrap_samples=n_bootstrap_samples,
             random_state=random_state,
+            ci_method=ci_method,
         )
         estimated_interval_a["errbar_length"] = (
             estimated_interval_a.drop("mean", axis=1).diff(axis=1).iloc[:, -1].abs()
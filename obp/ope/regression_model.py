@@ -3,17 +3,39 @@
 
 """Regression Model Class for Estimating Mean Reward Functions."""
 from dataclasses import dataclass
+import hashlib
+import inspect
+import os
+from pathlib import Path
+import pickle
+import shutil
+import tempfile
+from typing import Any
+from typing import Iterable
+from typing import List
 from typing import Optional
+from typing import Tuple
+from typing import Union
 
 import numpy as np
+from scipy import sparse
+import sklearn
 from sklearn.base import BaseEstimator
 from sklearn.base import clone
 from sklearn.base import is_classifier
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.ensemble import HistGradientBoostingRegressor
+from sklearn.exceptions import NotFittedError
 from sklearn.model_selection import KFold
 from sklearn.utils import check_random_state
 from sklearn.utils import check_scalar
+from sklearn.utils.validation import check_is_fitted
 
+from ..types import DeduplicatedEstimatedRewards
 from ..utils import check_bandit_feedback_inputs
+from ..utils import concatenate_features
+from ..utils import deduplicate_rows
+from .helper import fit_base_models
 
 
 @dataclass
@@ -23,6 +45,9 @@ class RegressionModel(BaseEstimator):
     Note
     -------
     Reward :math:`r` must be either binary or continuous.
+    `context` can be a scipy sparse matrix (e.g., one-hot categorical features).
+    Then, the design matrix is built as a CSR matrix without densifying `context`,
+    and `base_model` must accept sparse inputs.
 
     Parameters
     ------------
@@ -45,6 +70,44 @@ class RegressionModel(BaseEstimator):
         Must be one of ['normal', 'iw', 'mrdr'] where 'iw' stands for importance weighting and
         'mrdr' stands for more robust doubly robust.
 
+    predict_batch_size: int, default=100000
+        Maximum number of rows of the design matrix passed to a single prediction call of the base model.
+        `predict` stacks the design matrices of all the actions for a chunk of rounds,
+        and thus the base model is called once per position for every `predict_batch_size // n_actions` rounds.
+
+    dtype: type, default=np.float64
+        Data type of the estimated rewards returned by `predict` and `fit_predict`. Must be either np.float64 or np.float32.
+        np.float32 halves the memory consumption of the estimated rewards of shape (n_rounds, n_actions, len_list).
+
+    n_jobs: int, default=1
+        Number of workers fitting the base models of the positions (and of the folds in the cross-fitting procedure) in parallel.
+        `-1` means using all the available processors.
+        The number of threads of the BLAS and OpenMP libraries in each worker is limited to
+        `cpu_count // n_workers` to avoid oversubscription.
+
+    prefer: str, default='processes'
+        Whether the workers are processes or threads. Must be either 'processes' or 'threads'.
+        Threads avoid copying the training data to the workers and are efficient with base models
+        that release the GIL during fitting (e.g., HistGradientBoosting and LightGBM).
+
+    cache_dir: str or Path, default=None
+        Directory where the fitted base models and the estimated rewards of `fit_predict` are cached.
+        When given, `fit_predict` skips training and loads the estimated rewards as read-only memory-mapped arrays
+        when it is called again with the same logged bandit data and configurations.
+        The cache is keyed on `context`, `action`, `reward`, `pscore`, `position`, `action_context`, the parameters of `base_model`,
+        `n_folds`, and `random_state` (and `action_dist` when `fitting_method` is either 'iw' or 'mrdr').
+        With 'normal', the estimated rewards do not depend on the evaluation policy,
+        and thus they are reused across evaluation policies.
+        Note that the cache is not used when `n_folds` > 1 and `random_state` is not an integer, as the folds are random.
+
+    max_cache_mb: float, default=None
+        Maximum total size (in MB) of the cached entries in `cache_dir`.
+        When exceeded, the least recently used entries are removed. If None, the entries are never removed.
+
+    max_windows: int, default=None
+        Number of the latest windows of logged bandit data given to `partial_fit` whose estimators are kept
+        in the bagging-type ensembles (e.g., RandomForest). If None, the estimators are never removed.
+
     References
     -----------
     Mehrdad Farajtabar, Yinlam Chow, and Mohammad Ghavamzadeh.
@@ -63,11 +126,34 @@ class RegressionModel(BaseEstimator):
     len_list: int = 1
     action_context: Optional[np.ndarray] = None
     fitting_method: str = "normal"
+    predict_batch_size: int = 100000
+    dtype: type = np.float64
+    n_jobs: int = 1
+    prefer: str = "processes"
+    cache_dir: Optional[Union[str, Path]] = None
+    max_cache_mb: Optional[float] = None
+    max_windows: Optional[int] = None
 
     def __post_init__(self) -> None:
         """Initialize Class."""
         check_scalar(self.n_actions, "n_actions", int, min_val=2)
         check_scalar(self.len_list, "len_list", int, min_val=1)
+        check_scalar(self.predict_batch_size, "predict_batch_size", int, min_val=1)
+        if self.dtype not in [np.float64, np.float32]:
+            raise ValueError(
+                f"`dtype` must be either np.float64 or np.float32, but {self.dtype} is given"
+            )
+        check_scalar(self.n_jobs, "n_jobs", int)
+        if self.prefer not in ["processes", "threads"]:
+            raise ValueError(
+                f"`prefer` must be either 'processes' or 'threads', but {self.prefer} is given"
+            )
+        if self.cache_dir is not None and not isinstance(self.cache_dir, (str, Path)):
+            raise ValueError("`cache_dir` must be a string or Path")
+        if self.max_cache_mb is not None:
+            check_scalar(self.max_cache_mb, "max_cache_mb", (int, float), min_val=0.0)
+        if self.max_windows is not None:
+            check_scalar(self.max_windows, "max_windows", int, min_val=1)
         if not (
             isinstance(self.fitting_method, str)
             and self.fitting_method in ["normal", "iw", "mrdr"]
@@ -122,6 +208,164 @@ class RegressionModel(BaseEstimator):
             When either 'iw' or 'mrdr' is set to `fitting_method`, `action_dist` must be given.
 
         """
+        pscore, position = self._check_fit_inputs(
+            context=context,
+            action=action,
+            reward=reward,
+            pscore=pscore,
+            position=position,
+            action_dist=action_dist,
+        )
+        self.base_model_list = self._fit_base_models(
+            self._iter_training_data(
+                context=context,
+                action=action,
+                reward=reward,
+                pscore=pscore,
+                position=position,
+                action_dist=action_dist,
+            ),
+            n_models=self.len_list,
+        )
+
+    def partial_fit(
+        self,
+        context: np.ndarray,
+        action: np.ndarray,
+        reward: np.ndarray,
+        pscore: Optional[np.ndarray] = None,
+        position: Optional[np.ndarray] = None,
+        action_dist: Optional[np.ndarray] = None,
+    ) -> None:
+        """Update the regression model with a new window of logged bandit data.
+
+        Note
+        -------
+        This method updates the base model of each position with only the given (new) data
+        instead of refitting it on the whole data, and thus the cost of updating scales with the size of the new data.
+        The first call trains the base models from scratch unless they have been fitted by `fit`.
+
+        - When `base_model` implements `partial_fit` (e.g., SGDClassifier, SGDRegressor, and MLPClassifier), it is called with the new data.
+        - When `base_model` is an ensemble supporting `warm_start` (e.g., RandomForest, ExtraTrees, Bagging, GradientBoosting, and HistGradientBoosting),
+          as many estimators (boosting iterations) as `base_model` has are added to the ensemble and fitted on the new data.
+
+        When `max_windows` is given, the estimators fitted on the windows older than the last `max_windows` windows
+        are removed from the bagging-type ensembles (RandomForest, ExtraTrees, and Bagging), whose estimators are independent of each other.
+        The influence of the expired data cannot be removed from the other base models.
+
+        Parameters
+        ----------
+        context: array-like, shape (n_rounds_of_new_data, dim_context)
+            Context vectors observed for each data in the new logged bandit data, i.e., :math:`x_i`.
+
+        action: array-like, shape (n_rounds_of_new_data,)
+            Actions sampled by the logging/behavior policy for each data in the new logged bandit data, i.e., :math:`a_i`.
+
+        reward: array-like, shape (n_rounds_of_new_data,)
+            Rewards observed for each data in the new logged bandit data, i.e., :math:`r_i`.
+
+        pscore: array-like, shape (n_rounds_of_new_data,)
+            Action choice probabilities of the logging/behavior policy (propensity scores), i.e., :math:`\\pi_b(a_i|x_i)`.
+            If None, behavior policy is assumed to be uniform.
+
+        position: array-like, shape (n_rounds_of_new_data,), default=None
+            Indices to differentiate positions in a recommendation interface where the actions are presented.
+            If None, a regression model assumes that only a single action is chosen for each data.
+            When `len_list` > 1, an array must be given as `position`.
+
+        action_dist: array-like, shape (n_rounds_of_new_data, n_actions, len_list), default=None
+            Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
+            When either 'iw' or 'mrdr' is set to `fitting_method`, `action_dist` must be given.
+
+        """
+        if not (
+            hasattr(self.base_model, "partial_fit")
+            or _get_warm_start_param(self.base_model) is not None
+        ):
+            raise ValueError(
+                "`base_model` must implement `partial_fit` or be an ensemble supporting `warm_start` to be updated incrementally"
+            )
+        pscore, position = self._check_fit_inputs(
+            context=context,
+            action=action,
+            reward=reward,
+            pscore=pscore,
+            position=position,
+            action_dist=action_dist,
+        )
+        if not hasattr(self, "n_estimators_per_window_"):
+            self.n_estimators_per_window_ = [[] for _ in np.arange(self.len_list)]
+        for pos_, (X, y, sample_weight) in enumerate(
+            self._iter_training_data(
+                context=context,
+                action=action,
+                reward=reward,
+                pscore=pscore,
+                position=position,
+                action_dist=action_dist,
+            )
+        ):
+            self._update_base_model(pos_, X, y, sample_weight)
+
+    def _update_base_model(
+        self,
+        pos_: int,
+        X: np.ndarray,
+        y: np.ndarray,
+        sample_weight: Optional[np.ndarray] = None,
+    ) -> None:
+        """Update the base model of a position with new training data, and remove the estimators of the expired windows."""
+        base_model = self.base_model_list[pos_]
+        kwargs = dict() if sample_weight is None else dict(sample_weight=sample_weight)
+        if hasattr(base_model, "partial_fit"):
+            if is_classifier(base_model):
+                kwargs["classes"] = np.array([0, 1])
+            base_model.partial_fit(X, y, **kwargs)
+            return
+        # add the estimators of `base_model` to the ensemble and fit them on the new data
+        param = _get_warm_start_param(base_model)
+        n_estimators_per_window = self.n_estimators_per_window_[pos_]
+        if _is_fitted(base_model):
+            if isinstance(getattr(base_model, "estimators_", None), list) and not (
+                n_estimators_per_window
+            ):
+                # the estimators fitted by `fit` form the first window
+                n_estimators_per_window.append(len(base_model.estimators_))
+            base_model.set_params(
+                warm_start=True,
+                **{
+                    param: base_model.get_params()[param]
+                    + self.base_model.get_params()[param]
+                },
+            )
+        else:
+            base_model.set_params(warm_start=True)
+        base_model.fit(X, y, **kwargs)
+
+        estimators = getattr(base_model, "estimators_", None)
+        if not isinstance(estimators, list):
+            # the stages of boosting depend on each other and cannot be removed
+            return
+        n_estimators_per_window.append(len(estimators) - sum(n_estimators_per_window))
+        if self.max_windows is None:
+            return
+        while len(n_estimators_per_window) > self.max_windows:
+            n_expired = n_estimators_per_window.pop(0)
+            for attr in ["estimators_", "estimators_features_", "_seeds"]:
+                if hasattr(base_model, attr):
+                    setattr(base_model, attr, getattr(base_model, attr)[n_expired:])
+            base_model.set_params(n_estimators=len(base_model.estimators_))
+
+    def _check_fit_inputs(
+        self,
+        context: np.ndarray,
+        action: np.ndarray,
+        reward: np.ndarray,
+        pscore: Optional[np.ndarray] = None,
+        position: Optional[np.ndarray] = None,
+        action_dist: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Check the inputs of `fit` and `partial_fit`, and fill the default `pscore` and `position`."""
         check_bandit_feedback_inputs(
             context=context,
             action=action,
@@ -129,6 +373,7 @@ class RegressionModel(BaseEstimator):
             pscore=pscore,
             position=position,
             action_context=self.action_context,
+            accept_sparse=True,
         )
         n = context.shape[0]
 
@@ -153,6 +398,19 @@ class RegressionModel(BaseEstimator):
         if pscore is None:
             pscore = np.ones_like(action) / self.n_actions
 
+        return pscore, position
+
+    def _iter_training_data(
+        self,
+        context: np.ndarray,
+        action: np.ndarray,
+        reward: np.ndarray,
+        pscore: np.ndarray,
+        position: np.ndarray,
+        action_dist: Optional[np.ndarray] = None,
+    ) -> Iterable[Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]]:
+        """Yield the design matrix, the rewards, and the sample weights to train the base model of each position."""
+        n = context.shape[0]
         for pos_ in np.arange(self.len_list):
             idx = position == pos_
             X = self._pre_process_for_reg_model(
@@ -162,25 +420,38 @@ class RegressionModel(BaseEstimator):
             )
             if X.shape[0] == 0:
                 raise ValueError(f"No training data at position {pos_}")
-            # train the base model according to the given `fitting method`
+            # weight the samples according to the given `fitting method`
             if self.fitting_method == "normal":
-                self.base_model_list[pos_].fit(X, reward[idx])
+                sample_weight = None
             else:
                 action_dist_at_pos = action_dist[np.arange(n), action, pos_][idx]
                 if self.fitting_method == "iw":
                     sample_weight = action_dist_at_pos / pscore[idx]
-                    self.base_model_list[pos_].fit(
-                        X, reward[idx], sample_weight=sample_weight
-                    )
                 elif self.fitting_method == "mrdr":
                     sample_weight = action_dist_at_pos
                     sample_weight *= 1.0 - pscore[idx]
                     sample_weight /= pscore[idx] ** 2
-                    self.base_model_list[pos_].fit(
-                        X, reward[idx], sample_weight=sample_weight
-                    )
+            yield X, reward[idx], sample_weight
 
-    def predict(self, context: np.ndarray) -> np.ndarray:
+    def _fit_base_models(
+        self,
+        training_data: Iterable[Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]],
+        n_models: int,
+    ) -> List[BaseEstimator]:
+        """Fit a clone of the base model on each training data with `n_jobs` workers."""
+        # the estimators added by `partial_fit` are counted from scratch
+        self.n_estimators_per_window_ = [[] for _ in np.arange(self.len_list)]
+        base_model_list = [clone(self.base_model) for _ in np.arange(n_models)]
+        return fit_base_models(
+            base_model_list=base_model_list,
+            training_data=training_data,
+            n_jobs=self.n_jobs,
+            prefer=self.prefer,
+        )
+
+    def predict(
+        self, context: np.ndarray, deduplicate_context: bool = False
+    ) -> Union[np.ndarray, DeduplicatedEstimatedRewards]:
         """Predict the reward function.
 
         Parameters
@@ -188,27 +459,45 @@ class RegressionModel(BaseEstimator):
         context: array-like, shape (n_rounds_of_new_data, dim_context)
             Context vectors of new data.
 
+        deduplicate_context: bool, default=False
+            Whether to predict the expected rewards only for the unique context vectors.
+            When True, the rows of `context` are hashed once and the expected rewards are returned as
+            `DeduplicatedEstimatedRewards` (the unique table and the inverse index), which OPE estimators consume directly.
+            This is much faster when many rounds share the same context vector, e.g., with categorical contexts.
+
         Returns
         -----------
-        q_hat: array-like, shape (n_rounds_of_new_data, n_actions, len_list)
+        q_hat: array-like, shape (n_rounds_of_new_data, n_actions, len_list) or DeduplicatedEstimatedRewards
             Expected rewards of new data estimated by the regression model.
 
         """
+        if deduplicate_context:
+            unique_index, inverse_index = deduplicate_rows(context)
+            return DeduplicatedEstimatedRewards(
+                unique_estimated_rewards=self.predict(context=context[unique_index]),
+                inverse_index=inverse_index,
+            )
         n = context.shape[0]
-        q_hat = np.zeros((n, self.n_actions, self.len_list))
-        for action_ in np.arange(self.n_actions):
+        q_hat = np.empty((n, self.n_actions, self.len_list), dtype=self.dtype)
+        # the design matrices of all the actions are stacked for a chunk of rounds
+        # so that the base model of each position is called once per chunk
+        n_rounds_per_batch = max(self.predict_batch_size // self.n_actions, 1)
+        for start in np.arange(0, n, n_rounds_per_batch):
+            stop = min(start + n_rounds_per_batch, n)
+            X = self._pre_process_for_reg_model(
+                context=context[np.repeat(np.arange(start, stop), self.n_actions)],
+                action=np.tile(np.arange(self.n_actions), stop - start),
+                action_context=self.action_context,
+            )
             for pos_ in np.arange(self.len_list):
-                X = self._pre_process_for_reg_model(
-                    context=context,
-                    action=action_ * np.ones(n, int),
-                    action_context=self.action_context,
-                )
                 q_hat_ = (
                     self.base_model_list[pos_].predict_proba(X)[:, 1]
                     if is_classifier(self.base_model_list[pos_])
                     else self.base_model_list[pos_].predict(X)
                 )
-                q_hat[np.arange(n), action_, pos_] = q_hat_
+                q_hat[start:stop, :, pos_] = q_hat_.reshape(
+                    stop - start, self.n_actions
+                )
         return q_hat
 
     def fit_predict(
@@ -221,13 +510,16 @@ class RegressionModel(BaseEstimator):
         action_dist: Optional[np.ndarray] = None,
         n_folds: int = 1,
         random_state: Optional[int] = None,
-    ) -> np.ndarray:
+        deduplicate_context: bool = False,
+    ) -> Union[np.ndarray, DeduplicatedEstimatedRewards]:
         """Fit the regression model on given logged bandit data and estimate the expected rewards on the same data.
 
         Note
         ------
         When `n_folds` is larger than 1, the cross-fitting procedure is applied.
         See the reference for the details about the cross-fitting technique.
+        When `cache_dir` is given, the estimated rewards are loaded from the cache without training
+        if this method has been called with the same logged bandit data and configurations.
 
         Parameters
         ----------
@@ -263,9 +555,14 @@ class RegressionModel(BaseEstimator):
             `random_state` affects the ordering of the indices, which controls the randomness of each fold.
             See https://scikit-learn.org/stable/modules/generated/sklearn.model_selection.KFold.html for the details.
 
+        deduplicate_context: bool, default=False
+            Whether to predict the expected rewards only for the unique context vectors (see `predict`).
+            With cross-fitting, the rows of `context` are hashed only once, and the expected rewards are predicted
+            for the unique context vectors of each fold.
+
         Returns
         -----------
-        q_hat: array-like, shape (n_rounds, n_actions, len_list)
+        q_hat: array-like, shape (n_rounds, n_actions, len_list) or DeduplicatedEstimatedRewards
             Expected rewards of new data estimated by the regression model.
 
         """
@@ -276,6 +573,7 @@ class RegressionModel(BaseEstimator):
             pscore=pscore,
             position=position,
             action_context=self.action_context,
+            accept_sparse=True,
         )
         n_rounds = context.shape[0]
 
@@ -298,9 +596,51 @@ class RegressionModel(BaseEstimator):
                 raise ValueError(
                     f"shape of `action_dist` must be (n_rounds, n_actions, len_list)=({n_rounds, self.n_actions, self.len_list}), but is {action_dist.shape}"
                 )
+            if not np.allclose(action_dist.sum(axis=1), 1):
+                raise ValueError("`action_dist` must be a probability distribution")
         if pscore is None:
             pscore = np.ones_like(action) / self.n_actions
 
+        kwargs = dict(
+            context=context,
+            action=action,
+            reward=reward,
+            pscore=pscore,
+            position=position,
+            action_dist=action_dist,
+            n_folds=n_folds,
+            random_state=random_state,
+            deduplicate_context=deduplicate_context,
+        )
+        if self.cache_dir is None or (
+            n_folds > 1 and not isinstance(random_state, (int, np.integer))
+        ):
+            return self._cross_fit_predict(**kwargs)
+        cache_path = self._obtain_cache_path(**kwargs)
+        if cache_path.exists():
+            try:
+                return self._load_cache(cache_path)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                # the entry has been removed by another process
+                pass
+        q_hat = self._cross_fit_predict(**kwargs)
+        self._save_cache(cache_path, q_hat)
+        return q_hat
+
+    def _cross_fit_predict(
+        self,
+        context: np.ndarray,
+        action: np.ndarray,
+        reward: np.ndarray,
+        pscore: np.ndarray,
+        position: np.ndarray,
+        action_dist: Optional[np.ndarray],
+        n_folds: int,
+        random_state: Optional[int],
+        deduplicate_context: bool,
+    ) -> Union[np.ndarray, DeduplicatedEstimatedRewards]:
+        """Fit the regression model and estimate the expected rewards with the cross-fitting procedure."""
+        n_rounds = context.shape[0]
         if n_folds == 1:
             self.fit(
                 context=context,
@@ -310,26 +650,163 @@ class RegressionModel(BaseEstimator):
                 position=position,
                 action_dist=action_dist,
             )
-            return self.predict(context=context)
+            return self.predict(
+                context=context, deduplicate_context=deduplicate_context
+            )
+        elif deduplicate_context:
+            unique_index, inverse_index = deduplicate_rows(context)
+            unique_q_hat_list = []
+            n_unique_contexts = 0
+            q_hat_inverse_index = np.zeros(n_rounds, dtype=int)
         else:
-            q_hat = np.zeros((n_rounds, self.n_actions, self.len_list))
+            q_hat = np.zeros(
+                (n_rounds, self.n_actions, self.len_list), dtype=self.dtype
+            )
         kf = KFold(n_splits=n_folds, shuffle=True, random_state=random_state)
         kf.get_n_splits(context)
-        for train_idx, test_idx in kf.split(context):
-            action_dist_tr = (
-                action_dist[train_idx] if action_dist is not None else action_dist
+        folds = list(kf.split(context))
+        # the base models of all the folds and positions are fitted at once so that they can be fitted in parallel
+        fold_base_model_list = self._fit_base_models(
+            (
+                training_data
+                for train_idx, _ in folds
+                for training_data in self._iter_training_data(
+                    context=context[train_idx],
+                    action=action[train_idx],
+                    reward=reward[train_idx],
+                    pscore=pscore[train_idx],
+                    position=position[train_idx],
+                    action_dist=(
+                        action_dist[train_idx]
+                        if action_dist is not None
+                        else action_dist
+                    ),
+                )
+            ),
+            n_models=n_folds * self.len_list,
+        )
+        for k, (_, test_idx) in enumerate(folds):
+            self.base_model_list = fold_base_model_list[
+                k * self.len_list : (k + 1) * self.len_list
+            ]
+            if deduplicate_context:
+                # a context in several folds has different estimates in each of them
+                fold_unique, fold_inverse = np.unique(
+                    inverse_index[test_idx], return_inverse=True
+                )
+                unique_q_hat_list.append(
+                    self.predict(context=context[unique_index[fold_unique]])
+                )
+                q_hat_inverse_index[test_idx] = n_unique_contexts + fold_inverse
+                n_unique_contexts += fold_unique.shape[0]
+            else:
+                q_hat[test_idx, :, :] = self.predict(context=context[test_idx])
+        if deduplicate_context:
+            return DeduplicatedEstimatedRewards(
+                unique_estimated_rewards=np.concatenate(unique_q_hat_list),
+                inverse_index=q_hat_inverse_index,
             )
-            self.fit(
-                context=context[train_idx],
-                action=action[train_idx],
-                reward=reward[train_idx],
-                pscore=pscore[train_idx],
-                position=position[train_idx],
-                action_dist=action_dist_tr,
+        return q_hat
+
+    def _obtain_cache_path(
+        self,
+        context: np.ndarray,
+        action: np.ndarray,
+        reward: np.ndarray,
+        pscore: np.ndarray,
+        position: np.ndarray,
+        action_dist: Optional[np.ndarray],
+        n_folds: int,
+        random_state: Optional[int],
+        deduplicate_context: bool,
+    ) -> Path:
+        """Obtain the path of the cache keyed on the logged bandit data and the configurations of the model and the cross-fitting."""
+        key = hashlib.sha256()
+        arrays = [context, action, reward, pscore, position, self.action_context]
+        if self.fitting_method in ["iw", "mrdr"]:
+            arrays.append(action_dist)
+        for array in arrays:
+            _update_hash_by_array(key, array)
+        base_model_params = sorted(self.base_model.get_params(deep=True).items())
+        key.update(
+            f"{type(self.base_model).__module__}.{type(self.base_model).__qualname__}:{base_model_params!r}".encode()
+        )
+        try:
+            source = inspect.getsource(type(self)._pre_process_for_reg_model)
+        except (OSError, TypeError):
+            source = type(self)._pre_process_for_reg_model.__qualname__
+        key.update(source.encode())
+        key.update(
+            f"{sklearn.__version__}:{self.n_actions}:{self.len_list}:{self.fitting_method}:{np.dtype(self.dtype)}:"
+            f"{n_folds}:{random_state}:{deduplicate_context}".encode()
+        )
+        return Path(self.cache_dir) / f"regression_model_{key.hexdigest()[:32]}"
+
+    def _save_cache(
+        self,
+        cache_path: Path,
+        q_hat: Union[np.ndarray, DeduplicatedEstimatedRewards],
+    ) -> None:
+        """Save the fitted base models and the estimated rewards, and remove the least recently used entries."""
+        Path(self.cache_dir).mkdir(parents=True, exist_ok=True)
+        # write to a temporary directory first so that readers never see a partially written cache
+        tmp_path = Path(tempfile.mkdtemp(dir=self.cache_dir))
+        if isinstance(q_hat, DeduplicatedEstimatedRewards):
+            np.save(
+                tmp_path / "unique_estimated_rewards.npy",
+                q_hat.unique_estimated_rewards,
             )
-            q_hat[test_idx, :, :] = self.predict(context=context[test_idx])
+            np.save(tmp_path / "inverse_index.npy", q_hat.inverse_index)
+        else:
+            np.save(tmp_path / "q_hat.npy", q_hat)
+        with open(tmp_path / "base_model_list.pkl", "wb") as f:
+            pickle.dump(self.base_model_list, f, protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # another process has created the same cache
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        if self.max_cache_mb is not None:
+            self._evict_cache()
+
+    def _load_cache(
+        self, cache_path: Path
+    ) -> Union[np.ndarray, DeduplicatedEstimatedRewards]:
+        """Load the fitted base models and the estimated rewards as read-only memory-mapped arrays."""
+        with open(cache_path / "base_model_list.pkl", "rb") as f:
+            base_model_list = pickle.load(f)
+        if (cache_path / "q_hat.npy").exists():
+            q_hat = np.load(cache_path / "q_hat.npy", mmap_mode="r")
+        else:
+            q_hat = DeduplicatedEstimatedRewards(
+                unique_estimated_rewards=np.load(
+                    cache_path / "unique_estimated_rewards.npy", mmap_mode="r"
+                ),
+                inverse_index=np.load(cache_path / "inverse_index.npy", mmap_mode="r"),
+            )
+        self.base_model_list = base_model_list
+        self.n_estimators_per_window_ = [[] for _ in np.arange(self.len_list)]
+        # the modification time of the entry is its last access time in the LRU eviction
+        os.utime(cache_path)
         return q_hat
 
+    def _evict_cache(self) -> None:
+        """Remove the least recently used entries until their total size fits in `max_cache_mb`."""
+        entries = []
+        for path in Path(self.cache_dir).glob("regression_model_*"):
+            try:
+                size = sum(file_.stat().st_size for file_ in path.iterdir())
+                entries.append((path.stat().st_mtime_ns, size, path))
+            except OSError:
+                # the entry has been removed by another process
+                continue
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_cache_mb * 2**20:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total_size -= size
+
     def _pre_process_for_reg_model(
         self,
         context: np.ndarray,
@@ -355,4 +832,40 @@ class RegressionModel(BaseEstimator):
             Context vectors characterizing actions (i.e., a vector representation or an embedding of each action).
 
         """
-        return np.c_[context, action_context[action]]
+        return concatenate_features([context, action_context[action]])
+
+
+def _update_hash_by_array(key: Any, array: Union[np.ndarray, sparse.spmatrix]) -> None:
+    """Update a hash object by the dtype, shape, and contents of an array (or a sparse matrix)."""
+    if sparse.issparse(array):
+        array = sparse.csr_matrix(array)
+        key.update(f"csr:{array.dtype}:{array.shape}".encode())
+        for component in [array.data, array.indices, array.indptr]:
+            key.update(np.ascontiguousarray(component))
+    else:
+        array = np.ascontiguousarray(array)
+        key.update(f"{array.dtype}:{array.shape}".encode())
+        key.update(array)
+
+
+def _get_warm_start_param(base_model: BaseEstimator) -> Optional[str]:
+    """Obtain the parameter of the number of estimators increased to add estimators with `warm_start`."""
+    params = base_model.get_params()
+    if "warm_start" not in params:
+        return None
+    if "n_estimators" in params:
+        return "n_estimators"
+    if isinstance(
+        base_model, (HistGradientBoostingClassifier, HistGradientBoostingRegressor)
+    ):
+        return "max_iter"
+    return None
+
+
+def _is_fitted(base_model: BaseEstimator) -> bool:
+    """Whether a base model has been fitted."""
+    try:
+        check_is_fitted(base_model)
+    except NotFittedError:
+        return False
+    return True
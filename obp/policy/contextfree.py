@@ -6,7 +6,10 @@ from dataclasses import dataclass
 import os
 from typing import Optional
 
+from joblib import delayed
+from joblib import Parallel
 import numpy as np
+from sklearn.utils import check_random_state
 from sklearn.utils import check_scalar
 
 # import pkg_resources
@@ -138,10 +141,14 @@ class Random(EpsilonGreedy):
         ----------
         action_dist: array-like, shape (n_rounds, n_actions, len_list)
             Probability estimates of each arm being the best one for each sample, action, and position.
+            Since the distribution does not depend on the round, it is returned as a read-only view
+            broadcast over rounds, which does not copy the distribution `n_rounds` times.
+            Use `np.array(action_dist)` to obtain a writable copy.
 
         """
-        action_dist = np.ones((n_rounds, self.n_actions, self.len_list)) * (
-            1 / self.n_actions
+        action_dist = np.broadcast_to(
+            np.full((self.n_actions, self.len_list), 1 / self.n_actions),
+            (n_rounds, self.n_actions, self.len_list),
         )
         return action_dist
 
@@ -241,9 +248,18 @@ class BernoulliTS(BaseContextFreePolicy):
         self,
         n_rounds: int = 1,
         n_sim: int = 100000,
+        max_memory_mb: float = 256.0,
+        n_jobs: int = 1,
     ) -> np.ndarray:
         """Compute the distribution over actions by Monte Carlo simulation.
 
+        Note
+        -------
+        The simulations are split into chunks so that the Beta samples of each chunk fit in `max_memory_mb`.
+        Each chunk draws all of its samples at once, selects the top-`len_list` actions with `np.argpartition`,
+        and counts them with `np.bincount`. The seed of each chunk is drawn from `random_state`
+        in advance, so the result does not depend on `n_jobs`.
+
         Parameters
         ----------
         n_rounds: int, default=1
@@ -253,19 +269,99 @@ class BernoulliTS(BaseContextFreePolicy):
         n_sim: int, default=100000
             Number of simulations in the Monte Carlo simulation to compute the distribution over actions.
 
+        max_memory_mb: float, default=256.0
+            Memory budget (in MB) for the samples simulated at once in each chunk.
+
+        n_jobs: int, default=1
+            Number of processes used to run the chunks in parallel.
+            `-1` means using all the available processors.
+
         Returns
         ----------
         action_dist: array-like, shape (n_rounds, n_actions, len_list)
             Probability estimates of each arm being the best one for each sample, action, and position.
+            Since the distribution does not depend on the round, it is returned as a read-only view
+            broadcast over rounds, which does not copy the distribution `n_rounds` times.
+            Use `np.array(action_dist)` to obtain a writable copy.
 
         """
-        action_count = np.zeros((self.n_actions, self.len_list))
-        for _ in np.arange(n_sim):
-            selected_actions = self.select_action()
-            for pos in np.arange(self.len_list):
-                action_count[selected_actions[pos], pos] += 1
-        action_dist = np.tile(
+        check_scalar(n_sim, name="n_sim", target_type=int, min_val=1)
+        check_scalar(
+            max_memory_mb, name="max_memory_mb", target_type=(int, float), min_val=0.0
+        )
+        check_scalar(n_jobs, name="n_jobs", target_type=int)
+        # samples and their sorting indices are float64 and int64, respectively
+        chunk_size = max(int(max_memory_mb * 2**20) // (16 * self.n_actions), 1)
+        n_chunks = -(-n_sim // chunk_size)
+        chunk_sizes = np.full(n_chunks, chunk_size)
+        chunk_sizes[-1] = n_sim - chunk_size * (n_chunks - 1)
+        seeds = self.random_.randint(np.iinfo(np.int32).max, size=n_chunks)
+        action_counts = Parallel(n_jobs=n_jobs)(
+            delayed(_count_top_actions_by_thompson_sampling)(
+                alpha=self.reward_counts + self.alpha,
+                beta=(self.action_counts - self.reward_counts) + self.beta,
+                len_list=self.len_list,
+                n_sim=n_sim_,
+                random_state=seed_,
+            )
+            for n_sim_, seed_ in zip(chunk_sizes, seeds)
+        )
+        action_count = np.sum(action_counts, axis=0)
+        action_dist = np.broadcast_to(
             action_count / n_sim,
-            (n_rounds, 1, 1),
+            (n_rounds, self.n_actions, self.len_list),
         )
         return action_dist
+
+
+def _count_top_actions_by_thompson_sampling(
+    alpha: np.ndarray,
+    beta: np.ndarray,
+    len_list: int,
+    n_sim: int,
+    random_state: int,
+) -> np.ndarray:
+    """Count how many times each action is selected at each position by Thompson Sampling.
+
+    Parameters
+    ----------
+    alpha: array-like, shape (n_actions, )
+        Parameter vector of the posterior Beta distributions.
+
+    beta: array-like, shape (n_actions, )
+        Parameter vector of the posterior Beta distributions.
+
+    len_list: int
+        Length of a list of actions in a recommendation/ranking inferface, slate size.
+
+    n_sim: int
+        Number of simulations.
+
+    random_state: int
+        Controls the random seed in sampling rewards.
+
+    Returns
+    ----------
+    action_count: array-like, shape (n_actions, len_list)
+        Number of times each action is selected at each position.
+
+    """
+    n_actions = len(alpha)
+    random_ = check_random_state(random_state)
+    predicted_rewards = random_.beta(a=alpha, b=beta, size=(n_sim, n_actions))
+    predicted_rewards *= -1
+    if len_list < n_actions:
+        top_actions = np.argpartition(predicted_rewards, len_list - 1, axis=1)
+        top_actions = top_actions[:, :len_list]
+    else:
+        top_actions = np.tile(np.arange(n_actions), (n_sim, 1))
+    # sort the top actions so that the action with the highest reward comes first
+    sorted_idx = np.argsort(
+        np.take_along_axis(predicted_rewards, top_actions, axis=1), axis=1
+    )
+    top_actions = np.take_along_axis(top_actions, sorted_idx, axis=1)
+    action_count = np.bincount(
+        (top_actions * len_list + np.arange(len_list)).ravel(),
+        minlength=n_actions * len_list,
+    )
+    return action_count.reshape((n_actions, len_list))
@@ -37,6 +37,10 @@ from .base import BaseOfflinePolicyLearner
 class IPWLearner(BaseOfflinePolicyLearner):
     """Off-policy learner based on Inverse Probability Weighting and Supervised Classification.
 
+    Note
+    -------
+    `context` can be a scipy sparse matrix, which is passed to `base_classifier` as it is.
+
     Parameters
     -----------
     n_actions: int
@@ -156,6 +160,7 @@ class IPWLearner(BaseOfflinePolicyLearner):
             reward=reward,
             pscore=pscore,
             position=position,
+            accept_sparse=True,
         )
         if (reward < 0).any():
             raise ValueError(
@@ -164,7 +169,7 @@ class IPWLearner(BaseOfflinePolicyLearner):
                 "and please use `obp.policy.NNPolicyLearner` instead."
             )
         if pscore is None:
-            n_actions = np.int32(action.max() + 1)
+            n_actions = np.int32(int(action.max()) + 1)
             pscore = np.ones_like(action) / n_actions
         if self.len_list == 1:
             position = np.zeros_like(action, dtype=int)
@@ -201,7 +206,7 @@ class IPWLearner(BaseOfflinePolicyLearner):
             If a non-repetitive action set is needed, please use the `sample_action` method.
 
         """
-        check_array(array=context, name="context", expected_dim=2)
+        check_array(array=context, name="context", expected_dim=2, accept_sparse=True)
 
         n_rounds = context.shape[0]
         action_dist = np.zeros((n_rounds, self.n_actions, self.len_list))
@@ -230,7 +235,7 @@ class IPWLearner(BaseOfflinePolicyLearner):
             Scores for all possible pairs of actions and positions predicted by a classifier.
 
         """
-        check_array(array=context, name="context", expected_dim=2)
+        check_array(array=context, name="context", expected_dim=2, accept_sparse=True)
 
         n = context.shape[0]
         score_predicted = np.zeros((n, self.n_actions, self.len_list))
@@ -285,7 +290,7 @@ class IPWLearner(BaseOfflinePolicyLearner):
             Ranking of actions sampled via the Gumbel softmax trick.
 
         """
-        check_array(array=context, name="context", expected_dim=2)
+        check_array(array=context, name="context", expected_dim=2, accept_sparse=True)
         check_scalar(tau, name="tau", target_type=(int, float), min_val=0)
 
         n = context.shape[0]
@@ -339,7 +344,7 @@ class IPWLearner(BaseOfflinePolicyLearner):
         assert (
             self.len_list == 1
         ), "predict_proba method cannot be used when `len_list != 1`"
-        check_array(array=context, name="context", expected_dim=2)
+        check_array(array=context, name="context", expected_dim=2, accept_sparse=True)
         check_scalar(tau, name="tau", target_type=(int, float), min_val=0)
 
         score_predicted = self.predict_score(context=context)
@@ -351,6 +356,11 @@ class IPWLearner(BaseOfflinePolicyLearner):
 class QLearner(BaseOfflinePolicyLearner):
     """Off-policy learner based on Direct Method (Reward Regression).
 
+    Note
+    -------
+    `context` can be a scipy sparse matrix, in which case `base_model` is trained on sparse feature vectors
+    (see `obp.ope.RegressionModel`).
+
     Parameters
     -----------
     n_actions: int
@@ -430,9 +440,10 @@ class QLearner(BaseOfflinePolicyLearner):
             reward=reward,
             pscore=pscore,
             position=position,
+            accept_sparse=True,
         )
         if pscore is None:
-            n_actions = np.int32(action.max() + 1)
+            n_actions = np.int32(int(action.max()) + 1)
             pscore = np.ones_like(action) / n_actions
         if self.len_list == 1:
             position = np.zeros_like(action, dtype=int)
@@ -481,7 +492,7 @@ class QLearner(BaseOfflinePolicyLearner):
             The output can contain duplicated items (when `len_list > 1`).
 
         """
-        check_array(array=context, name="context", expected_dim=2)
+        check_array(array=context, name="context", expected_dim=2, accept_sparse=True)
         check_scalar(tau, name="tau", target_type=(int, float), min_val=0)
 
         q_hat = self.predict_score(context=context)
@@ -507,7 +518,7 @@ class QLearner(BaseOfflinePolicyLearner):
             Expected rewards for all possible pairs of actions and positions. :math:`\\hat{q}(x,a)`.
 
         """
-        check_array(array=context, name="context", expected_dim=2)
+        check_array(array=context, name="context", expected_dim=2, accept_sparse=True)
 
         q_hat = self.q_estimator.predict(context=context)
         return q_hat
@@ -556,7 +567,7 @@ class QLearner(BaseOfflinePolicyLearner):
             Ranking of actions sampled from the Plackett-Luce ranking distribution via the Gumbel softmax trick.
 
         """
-        check_array(array=context, name="context", expected_dim=2)
+        check_array(array=context, name="context", expected_dim=2, accept_sparse=True)
         check_scalar(tau, name="tau", target_type=(int, float), min_val=0)
 
         n = context.shape[0]
@@ -605,7 +616,7 @@ class QLearner(BaseOfflinePolicyLearner):
             Action choice probabilities obtained from the estimated expected rewards.
 
         """
-        check_array(array=context, name="context", expected_dim=2)
+        check_array(array=context, name="context", expected_dim=2, accept_sparse=True)
         check_scalar(tau, name="tau", target_type=(int, float), min_val=0)
 
         q_hat = self.predict_score(context=context)
@@ -76,7 +76,7 @@ def run_bandit_replay(
         selected_actions_list.append(selected_actions)
 
     action_dist = convert_to_action_dist(
-        n_actions=bandit_feedback["action"].max() + 1,
+        n_actions=int(bandit_feedback["action"].max()) + 1,
         selected_actions=np.array(selected_actions_list),
     )
     return action_dist
@@ -2,11 +2,1093 @@
 # Licensed under the Apache 2.0 License.
 
 """Types."""
+from collections.abc import Mapping
+from collections.abc import MutableMapping
+from dataclasses import dataclass
+import itertools
+import os
+from pathlib import Path
+import shutil
+import tempfile
+from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import FrozenSet
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Union
+import weakref
 
 import numpy as np
+from scipy import sparse
+from sklearn.utils import check_random_state
 
 
 # dataset
 BanditFeedback = Dict[str, Union[int, np.ndarray]]
+
+
+# containers of the validated logged bandit data, which are removed when garbage collected
+_VALIDATED_BANDIT_FEEDBACKS: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+_validated_bandit_feedback_counter = itertools.count()
+
+
+def get_validated_range(array: Any) -> Optional[Tuple[Any, Any]]:
+    """Obtain the minimum and maximum of an array validated by `ValidatedBanditFeedback`.
+
+    Parameters
+    -----------
+    array: object
+        Input object.
+
+    Returns
+    ----------
+    value_range: Tuple[Any, Any] or None
+        Minimum and maximum of `array`. None if `array` is not an array stored in `ValidatedBanditFeedback`
+        or the invariant on its range does not hold.
+
+    """
+    if isinstance(array, np.ndarray):
+        for bandit_feedback in list(_VALIDATED_BANDIT_FEEDBACKS.values()):
+            value_range = bandit_feedback._get_validated_range(array)
+            if value_range is not None:
+                return value_range
+    return None
+
+
+class ValidatedBanditFeedback(Mapping):
+    """Immutable logged bandit data validated once on construction.
+
+    Note
+    -------
+    OPE estimators validate their inputs, such as the range of actions and the positivity of propensity scores,
+    every time they are called. This container validates the logged bandit data only once when it is constructed,
+    and records which invariants hold in `invariants` together with the ranges of the validated arrays.
+    The input checks in `obp.utils` (e.g., `check_ope_inputs`) consult these invariants and skip the redundant scans of the arrays.
+
+    The container owns its arrays and stores them as plain read-only arrays, and thus the recorded ranges cannot become stale.
+    It behaves as a read-only dictionary, and thus it can be used wherever the dictionary of logged bandit data
+    (e.g., the output of `obtain_batch_bandit_feedback` of the dataset classes) is accepted.
+
+    Parameters
+    -----------
+    bandit_feedback: Mapping[str, Union[int, np.ndarray]]
+        Logged bandit data such as the output of `obtain_batch_bandit_feedback` of the dataset classes.
+        The following keys are validated if given: `n_rounds`, `n_actions`, `context`, `action`, `reward`, `pscore`,
+        `position`, `expected_reward`, and `action_context`.
+
+    copy: bool, default=True
+        Whether to copy the given arrays.
+        If False, the arrays owning their data are taken over and made read-only without copying them,
+        and thus they must not be modified afterwards. Views of other arrays are always copied.
+
+    Examples
+    ----------
+
+    .. code-block:: python
+
+        >>> from obp.dataset import SyntheticBanditDataset
+        >>> from obp.types import ValidatedBanditFeedback
+        >>> dataset = SyntheticBanditDataset(n_actions=10, random_state=12345)
+        >>> bandit_feedback = ValidatedBanditFeedback(dataset.obtain_batch_bandit_feedback(n_rounds=10000))
+        >>> sorted(bandit_feedback.invariants)
+        ['action_in_range', 'action_non_negative', 'consistent_n_rounds', 'pscore_positive']
+
+    """
+
+    # invariants guaranteeing the recorded range of each array
+    _RANGE_INVARIANTS = {
+        "action": "action_non_negative",
+        "pscore": "pscore_positive",
+        "position": "position_non_negative",
+    }
+
+    def __init__(self, bandit_feedback: Mapping, copy: bool = True) -> None:
+        """Initialize Class."""
+        data = dict(bandit_feedback)
+        for key_, value in data.items():
+            if isinstance(value, np.ndarray):
+                if copy or value.base is not None:
+                    value = value.copy()
+                value.setflags(write=False)
+                data[key_] = value
+        self._data = data
+        self._ranges = dict()
+        self._invariants = self._validate()
+        _VALIDATED_BANDIT_FEEDBACKS[next(_validated_bandit_feedback_counter)] = self
+
+    def _validate(self) -> FrozenSet[str]:
+        """Validate the logged bandit data and return the invariants that hold."""
+        invariants = set()
+        data = self._data
+        for key_ in ["action", "reward", "pscore", "position"]:
+            if data.get(key_) is not None:
+                if not (isinstance(data[key_], np.ndarray) and data[key_].ndim == 1):
+                    raise ValueError(f"`{key_}` must be 1D array")
+        for key_ in ["context", "expected_reward", "action_context"]:
+            if data.get(key_) is not None:
+                if key_ == "context" and sparse.issparse(data[key_]):
+                    continue
+                if not (isinstance(data[key_], np.ndarray) and data[key_].ndim >= 2):
+                    raise ValueError(f"`{key_}` must be an array with ndim >= 2")
+
+        # the number of rounds
+        round_wise_keys = [
+            key_
+            for key_ in [
+                "context",
+                "action",
+                "reward",
+                "pscore",
+                "position",
+                "expected_reward",
+            ]
+            if data.get(key_) is not None
+        ]
+        n_rounds_list = [data[key_].shape[0] for key_ in round_wise_keys]
+        if data.get("n_rounds") is not None:
+            n_rounds_list.append(data["n_rounds"])
+        if len(set(n_rounds_list)) > 1:
+            raise ValueError(
+                f"Expected the same number of rounds among {round_wise_keys}, but found it False"
+            )
+        invariants.add("consistent_n_rounds")
+
+        # action
+        action = data.get("action")
+        if action is not None and not np.issubdtype(action.dtype, np.integer):
+            raise ValueError("`action` elements must be integers")
+        if action is not None and action.shape[0] > 0:
+            action_min, action_max = self._record_range("action")
+            n_actions = data.get("n_actions")
+            if n_actions is None and data.get("action_context") is not None:
+                n_actions = data["action_context"].shape[0]
+            if n_actions is None:
+                if action_min < 0:
+                    raise ValueError("`action` elements must be non-negative integers")
+            else:
+                if not (action_min >= 0 and action_max < n_actions):
+                    raise ValueError(
+                        "`action` elements must be integers in the range of [0, `n_actions`)"
+                    )
+                invariants.add("action_in_range")
+            invariants.add("action_non_negative")
+
+        # pscore
+        pscore = data.get("pscore")
+        if pscore is not None and pscore.shape[0] > 0:
+            if not self._record_range("pscore")[0] > 0:
+                raise ValueError("`pscore` must be positive")
+            invariants.add("pscore_positive")
+
+        # position
+        position = data.get("position")
+        if position is not None and position.shape[0] > 0:
+            if not (
+                np.issubdtype(position.dtype, np.integer)
+                and self._record_range("position")[0] >= 0
+            ):
+                raise ValueError("`position` elements must be non-negative integers")
+            invariants.add("position_non_negative")
+
+        return frozenset(invariants)
+
+    def _record_range(self, key: str) -> Tuple[Any, Any]:
+        """Record the minimum and maximum of an array."""
+        self._ranges[key] = self._data[key].min(), self._data[key].max()
+        return self._ranges[key]
+
+    def _get_validated_range(self, array: np.ndarray) -> Optional[Tuple[Any, Any]]:
+        """Obtain the recorded range of a stored array if the invariant on its range holds."""
+        for key_, value_range in self._ranges.items():
+            if (
+                self._data[key_] is array
+                and self._RANGE_INVARIANTS[key_] in self._invariants
+            ):
+                return value_range
+        return None
+
+    @property
+    def invariants(self) -> FrozenSet[str]:
+        """Invariants that hold in the logged bandit data.
+
+        - `consistent_n_rounds`: the given round-wise arrays and `n_rounds` share the number of rounds.
+        - `action_non_negative`: `action` elements are non-negative integers.
+        - `action_in_range`: `action` elements are integers in the range of [0, `n_actions`).
+        - `pscore_positive`: `pscore` elements are positive.
+        - `position_non_negative`: `position` elements are non-negative integers.
+
+        """
+        return self._invariants
+
+    def __getitem__(self, key: str) -> Union[int, np.ndarray]:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._data!r})"
+
+
+def _compact_array(array: np.ndarray, is_binary: bool = False) -> np.ndarray:
+    """Convert an array to the narrowest adequate dtype.
+
+    Integer arrays are stored in the narrowest integer dtype holding their range (e.g., uint8 for positions),
+    float arrays in float32, and binary arrays (e.g., clicks) in bool when `is_binary=True`.
+
+    """
+    if array.size == 0 or array.dtype == bool:
+        return array
+    if is_binary and np.isin(array, [0, 1]).all():
+        return array.astype(bool)
+    if np.issubdtype(array.dtype, np.integer):
+        min_, max_ = array.min(), array.max()
+        if min_ >= 0:
+            dtype = np.min_scalar_type(max_)
+        else:
+            dtype = np.promote_types(
+                np.min_scalar_type(min_), np.min_scalar_type(-max_ - 1)
+            )
+        return array.astype(dtype, copy=False)
+    if np.issubdtype(array.dtype, np.floating) and array.dtype.itemsize > 4:
+        return array.astype(np.float32)
+    return array
+
+
+class ColumnarBanditFeedback(MutableMapping):
+    """Columnar logged bandit data stored in compact dtypes with zero-copy row views.
+
+    Note
+    -------
+    The dictionary of logged bandit data stores each round-wise column (e.g., `action` and `reward`) in float64 or int64,
+    and splitting or resampling the data copies every column. This container stores the round-wise columns
+    in the narrowest adequate dtypes (e.g., uint8 positions, bool clicks, and float32 propensity scores),
+    and `take` and `split` create views of the rows that share the columns instead of copying them.
+    The rows of a view are gathered only when its columns are accessed.
+    A sparse `context` is stored as a CSR matrix without compaction.
+
+    The container behaves as a dictionary, and thus it can be used wherever the dictionary of logged bandit data is accepted.
+    Assigning a value to a key stores the value as it is.
+
+    Parameters
+    -----------
+    bandit_feedback: Mapping[str, Union[int, np.ndarray]]
+        Logged bandit data such as the output of `obtain_batch_bandit_feedback` of the dataset classes.
+
+    round_wise_keys: List[str], default=None
+        Keys of the round-wise columns, i.e., arrays whose first dimension corresponds to the rounds.
+        If None, `ROUND_WISE_KEYS` included in `bandit_feedback` are used.
+        The other values, such as `n_actions` and `action_context`, are shared by all the views as they are.
+
+    compact: bool, default=True
+        Whether to convert the round-wise columns to the narrowest adequate dtypes.
+        Note that float columns are stored in float32, which slightly changes the downstream estimates.
+
+    Examples
+    ----------
+
+    .. code-block:: python
+
+        >>> from obp.dataset import OpenBanditDataset
+        >>> from obp.types import ColumnarBanditFeedback
+        >>> dataset = OpenBanditDataset(behavior_policy="random", campaign="all")
+        >>> bandit_feedback = ColumnarBanditFeedback(dataset.obtain_batch_bandit_feedback())
+        >>> bandit_feedback["position"].dtype, bandit_feedback["reward"].dtype
+        (dtype('uint8'), dtype('bool'))
+        # train-test split and bootstrap replicates without copying the columns
+        >>> bandit_feedback_train, bandit_feedback_test = bandit_feedback.split(7000)
+        >>> bootstrap_bandit_feedback = bandit_feedback.take(
+            np.random.randint(bandit_feedback["n_rounds"], size=bandit_feedback["n_rounds"])
+        )
+
+    """
+
+    ROUND_WISE_KEYS = [
+        "context",
+        "action",
+        "position",
+        "reward",
+        "pscore",
+        "expected_reward",
+        "pi_b",
+    ]
+    BINARY_KEYS = ["reward"]
+
+    def __init__(
+        self,
+        bandit_feedback: Mapping,
+        round_wise_keys: Optional[List[str]] = None,
+        compact: bool = True,
+    ) -> None:
+        """Initialize Class."""
+        if round_wise_keys is None:
+            round_wise_keys = [
+                key_
+                for key_ in self.ROUND_WISE_KEYS
+                if isinstance(bandit_feedback.get(key_), np.ndarray)
+                or sparse.issparse(bandit_feedback.get(key_))
+            ]
+        n_rounds_list = [bandit_feedback[key_].shape[0] for key_ in round_wise_keys]
+        if len(set(n_rounds_list)) > 1:
+            raise ValueError(
+                f"Expected the same number of rounds among {round_wise_keys}, but found it False"
+            )
+        self._columns = {
+            key_: sparse.csr_matrix(bandit_feedback[key_])
+            if sparse.issparse(bandit_feedback[key_])
+            else _compact_array(
+                np.asarray(bandit_feedback[key_]), is_binary=key_ in self.BINARY_KEYS
+            )
+            if compact
+            else np.asarray(bandit_feedback[key_])
+            for key_ in round_wise_keys
+        }
+        self._data = {
+            key_: value
+            for key_, value in bandit_feedback.items()
+            if key_ not in self._columns
+        }
+        self._keys = list(bandit_feedback)
+        self._n_base_rounds = n_rounds_list[0] if n_rounds_list else 0
+        self._index = slice(0, self._n_base_rounds)
+        self._shared_columns: Dict[str, Dict[str, Any]] = dict()
+        self._shared_memory: Optional[_SharedMemoryFolder] = None
+
+    @property
+    def n_rounds(self) -> int:
+        """Number of rounds in the view."""
+        if isinstance(self._index, slice):
+            return len(range(self._n_base_rounds)[self._index])
+        return self._index.shape[0]
+
+    @property
+    def index(self) -> Union[slice, np.ndarray]:
+        """Indices of the rows of the view in the underlying columns."""
+        return self._index
+
+    @property
+    def nbytes(self) -> int:
+        """Total bytes consumed by the underlying round-wise columns and the indices of the view."""
+        nbytes = sum(
+            column.data.nbytes + column.indices.nbytes + column.indptr.nbytes
+            if sparse.issparse(column)
+            else column.nbytes
+            for column in self._columns.values()
+        )
+        if isinstance(self._index, np.ndarray):
+            nbytes += self._index.nbytes
+        return nbytes
+
+    def take(self, index: Union[slice, np.ndarray]) -> "ColumnarBanditFeedback":
+        """Create a view of the given rows sharing the underlying columns.
+
+        Parameters
+        -----------
+        index: slice or array-like of int
+            Rows of this view to be selected, e.g., the indices of a bootstrap replicate.
+
+        Returns
+        ----------
+        view: ColumnarBanditFeedback
+            View of the selected rows. Only the indices are stored, and the columns are not copied.
+
+        """
+        if isinstance(index, slice):
+            if isinstance(self._index, slice):
+                rows = range(self._n_base_rounds)[self._index][index]
+                new_index = slice(rows.start, rows.stop, rows.step)
+                if rows.step < 0:
+                    new_index = np.arange(self._n_base_rounds)[new_index]
+            else:
+                new_index = self._index[index]
+        else:
+            index = np.asarray(index)
+            if not np.issubdtype(index.dtype, np.integer):
+                raise ValueError("`index` must be a slice or an array of integers")
+            if isinstance(self._index, slice):
+                new_index = np.arange(self._n_base_rounds)[self._index][index]
+            else:
+                new_index = self._index[index]
+            if self._n_base_rounds <= np.iinfo(np.int32).max:
+                new_index = new_index.astype(np.int32, copy=False)
+        view = self.__class__.__new__(self.__class__)
+        view._columns = self._columns
+        view._data = dict(self._data)
+        view._keys = self._keys
+        view._n_base_rounds = self._n_base_rounds
+        view._index = new_index
+        view._shared_columns = self._shared_columns
+        view._shared_memory = self._shared_memory
+        if "n_rounds" in view._data:
+            view._data["n_rounds"] = view.n_rounds
+        return view
+
+    def split(
+        self, n_rounds_train: int
+    ) -> Tuple["ColumnarBanditFeedback", "ColumnarBanditFeedback"]:
+        """Split the rows into the first `n_rounds_train` rows and the rest without copying.
+
+        Parameters
+        -----------
+        n_rounds_train: int
+            Number of rounds in the first (training) split.
+
+        Returns
+        ----------
+        (view_train, view_test): Tuple[ColumnarBanditFeedback, ColumnarBanditFeedback]
+            Views of the training and test splits.
+
+        """
+        return self.take(slice(0, n_rounds_train)), self.take(
+            slice(n_rounds_train, None)
+        )
+
+    def share_memory(
+        self, folder: Optional[Union[str, Path]] = None
+    ) -> "ColumnarBanditFeedback":
+        """Store the underlying round-wise columns in shared memory to pass the views to the other processes.
+
+        Note
+        -------
+        Pickling a view, e.g., to pass it to a joblib or multiprocessing worker, copies every underlying column
+        for each task. The columns of the returned container are read-only memory maps of files
+        in a memory-backed folder (`/dev/shm` when available), and pickling it or any of its views sends only
+        the paths of the files and the indices of the view. The worker processes map the same memory
+        instead of receiving copies of the columns.
+
+        The files are removed when `release_shared_memory` is called (or the `with` block is exited),
+        or when the returned container and all of its views are garbage collected in this process.
+
+        Parameters
+        -----------
+        folder: str or Path, default=None
+            Folder in which the shared files are created.
+            If None, `/dev/shm` is used when it exists, and the temporary directory otherwise.
+
+        Returns
+        ----------
+        shared_bandit_feedback: ColumnarBanditFeedback
+            View of the same rows whose underlying columns are stored in shared memory.
+
+        """
+        if folder is None and os.path.isdir("/dev/shm"):
+            folder = "/dev/shm"
+        shared_memory = _SharedMemoryFolder(folder)
+        shared_columns = dict()
+        for key_, column in self._columns.items():
+            if sparse.issparse(column):
+                components = dict(
+                    data=column.data, indices=column.indices, indptr=column.indptr
+                )
+                shape = column.shape
+            else:
+                components, shape = dict(array=column), None
+            paths = dict()
+            for name, array in components.items():
+                paths[name] = str(shared_memory.path / f"{key_}.{name}.npy")
+                np.save(paths[name], array)
+            shared_columns[key_] = dict(paths=paths, shape=shape)
+        view = self.take(slice(None))
+        view._columns = {
+            key_: _load_shared_column(spec) for key_, spec in shared_columns.items()
+        }
+        view._shared_columns = shared_columns
+        view._shared_memory = shared_memory
+        return view
+
+    def release_shared_memory(self) -> None:
+        """Remove the shared files created by `share_memory`. The columns already mapped remain accessible."""
+        if self._shared_memory is not None:
+            self._shared_memory.release()
+
+    def __enter__(self) -> "ColumnarBanditFeedback":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.release_shared_memory()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        # the shared columns are sent as the paths of their files
+        state["_columns"] = {
+            key_: column
+            for key_, column in self._columns.items()
+            if key_ not in self._shared_columns
+        }
+        state["_shared_memory"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._columns = dict(
+            self._columns,
+            **{
+                key_: _load_shared_column(spec)
+                for key_, spec in self._shared_columns.items()
+            },
+        )
+
+    def to_dict(self) -> Dict[str, Union[int, np.ndarray]]:
+        """Materialize the view as the dictionary of logged bandit data."""
+        return dict(self)
+
+    def __getitem__(self, key: str) -> Union[int, np.ndarray]:
+        if key in self._columns:
+            return self._columns[key][self._index]
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self._columns:
+            # do not modify the columns shared with the other views
+            self._columns = {
+                key_: column for key_, column in self._columns.items() if key_ != key
+            }
+            self._shared_columns = {
+                key_: spec for key_, spec in self._shared_columns.items() if key_ != key
+            }
+        elif key not in self._data:
+            self._keys = self._keys + [key]
+        self._data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in self._columns:
+            self._columns = {
+                key_: column for key_, column in self._columns.items() if key_ != key
+            }
+            self._shared_columns = {
+                key_: spec for key_, spec in self._shared_columns.items() if key_ != key
+            }
+        else:
+            del self._data[key]
+        self._keys = [key_ for key_ in self._keys if key_ != key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(n_rounds={self.n_rounds}, keys={self._keys})"
+
+
+class _SharedMemoryFolder:
+    """Folder of the shared files of `ColumnarBanditFeedback`, which is removed when this object is garbage collected."""
+
+    def __init__(self, folder: Optional[Union[str, Path]] = None) -> None:
+        self.path = Path(tempfile.mkdtemp(prefix="obp-", dir=folder))
+        self._finalizer = weakref.finalize(
+            self, shutil.rmtree, str(self.path), ignore_errors=True
+        )
+
+    def release(self) -> None:
+        self._finalizer()
+
+
+def _load_shared_column(spec: Dict[str, Any]) -> Union[np.ndarray, sparse.csr_matrix]:
+    """Map a round-wise column stored by `ColumnarBanditFeedback.share_memory` as read-only."""
+    arrays = {
+        name: np.load(path, mmap_mode="r") for name, path in spec["paths"].items()
+    }
+    if "array" in arrays:
+        return arrays["array"]
+    return sparse.csr_matrix(
+        (arrays["data"], arrays["indices"], arrays["indptr"]),
+        shape=spec["shape"],
+        copy=False,
+    )
+
+
+@dataclass(frozen=True)
+class BootstrapReplicate:
+    """Descriptor of a bootstrap replicate of logged bandit data.
+
+    Note
+    -------
+    A descriptor stores only the random seed of the bootstrap sampling together with a reference to
+    the base logged bandit data, which is shared by all the replicates and never modified.
+    The rows of the replicate are sampled when `sample_index` or `materialize` is called,
+    i.e., by the worker evaluating the replicate. When the base data is stored in shared memory
+    by `ColumnarBanditFeedback.share_memory`, pickling a descriptor sends only the seed and the paths of the columns.
+
+    Parameters
+    -----------
+    bandit_feedback: ColumnarBanditFeedback
+        Base logged bandit data from which the replicate is sampled.
+
+    random_state: int
+        Random seed of the bootstrap sampling.
+
+    sample_size: int
+        Number of rounds in the replicate.
+
+    """
+
+    bandit_feedback: ColumnarBanditFeedback
+    random_state: int
+    sample_size: int
+
+    def sample_index(self) -> np.ndarray:
+        """Sample the indices of the rows of the base data included in the replicate."""
+        random_ = check_random_state(self.random_state)
+        return random_.choice(
+            np.arange(self.bandit_feedback.n_rounds),
+            size=self.sample_size,
+            replace=True,
+        )
+
+    def materialize(self) -> ColumnarBanditFeedback:
+        """Obtain the replicate as a view of the base data, whose rows are gathered only when its columns are accessed."""
+        return self.bandit_feedback.take(self.sample_index())
+
+
+# action distribution
+@dataclass
+class SparseActionDist:
+    """Sparse representation of the action choice probabilities of an evaluation policy.
+
+    Note
+    -------
+    A dense `action_dist` of shape (n_rounds, n_actions, len_list) quickly becomes intractable
+    when `n_rounds` and `n_actions` are large. This class stores only the information that OPE estimators
+    actually read, and thus its memory footprint scales with :math:`O(n \\cdot k)` where :math:`k` is
+    the number of actions having non-zero probability (the support) for each round and position.
+
+    - `factual`: the action choice probabilities evaluated at the logged action and position, i.e., :math:`\\pi_e(a_i|x_i)`. This is sufficient for IPW-type estimators such as IPW, SNIPW, and RM.
+    - `indptr`, `indices`, and `data`: the (top-k) support of the evaluation policy stored in the CSR format. The `r`-th row corresponds to the `i`-th round and the `l`-th position with `r = i * len_list + l`. This is needed by model-dependent estimators such as DM and DR.
+
+    Parameters
+    -----------
+    n_actions: int
+        Number of actions.
+
+    len_list: int, default=1
+        Length of a list of actions in a recommendation/ranking inferface, slate size.
+
+    factual: array-like, shape (n_rounds,), default=None
+        Action choice probabilities of the evaluation policy at the logged action and position, i.e., :math:`\\pi_e(a_i|x_i)`.
+
+    indptr: array-like, shape (n_rounds * len_list + 1,), default=None
+        Index pointers of the CSR representation of the support.
+
+    indices: array-like, shape (nnz,), default=None
+        Actions in the support of each row.
+
+    data: array-like, shape (nnz,), default=None
+        Action choice probabilities of the actions in `indices`.
+
+    """
+
+    n_actions: int
+    len_list: int = 1
+    factual: Optional[np.ndarray] = None
+    indptr: Optional[np.ndarray] = None
+    indices: Optional[np.ndarray] = None
+    data: Optional[np.ndarray] = None
+
+    def __post_init__(self) -> None:
+        """Initialize Class."""
+        if not (isinstance(self.n_actions, (int, np.integer)) and self.n_actions >= 1):
+            raise ValueError(
+                f"`n_actions` must be a positive integer, but {self.n_actions} is given"
+            )
+        if not (isinstance(self.len_list, (int, np.integer)) and self.len_list >= 1):
+            raise ValueError(
+                f"`len_list` must be a positive integer, but {self.len_list} is given"
+            )
+        if self.factual is None and self.indptr is None:
+            raise ValueError("either `factual` or `indptr` must be given")
+
+        n_rounds = None
+        if self.factual is not None:
+            if not (isinstance(self.factual, np.ndarray) and self.factual.ndim == 1):
+                raise ValueError("`factual` must be 1D array")
+            n_rounds = self.factual.shape[0]
+
+        if self.indptr is not None:
+            for name, arr in [
+                ("indptr", self.indptr),
+                ("indices", self.indices),
+                ("data", self.data),
+            ]:
+                if not (isinstance(arr, np.ndarray) and arr.ndim == 1):
+                    raise ValueError(f"`{name}` must be 1D array")
+            if (self.indptr.shape[0] - 1) % self.len_list != 0:
+                raise ValueError(
+                    "Expected `(indptr.shape[0] - 1) % len_list == 0`, but found it False"
+                )
+            if n_rounds is None:
+                n_rounds = (self.indptr.shape[0] - 1) // self.len_list
+            elif n_rounds * self.len_list + 1 != self.indptr.shape[0]:
+                raise ValueError(
+                    "Expected `indptr.shape[0] == factual.shape[0] * len_list + 1`, but found it False"
+                )
+            nnz = self.indices.shape[0]
+            if self.data.shape[0] != nnz or self.indptr[-1] != nnz:
+                raise ValueError(
+                    "Expected `indices.shape[0] == data.shape[0] == indptr[-1]`, but found it False"
+                )
+            if self.indptr[0] != 0 or np.any(np.diff(self.indptr) < 0):
+                raise ValueError("`indptr` must be a non-decreasing sequence from 0")
+            if not np.issubdtype(self.indices.dtype, np.integer) or (
+                nnz > 0
+                and (self.indices.min() < 0 or self.indices.max() >= self.n_actions)
+            ):
+                raise ValueError(
+                    "`indices` elements must be integers in the range of [0, `n_actions`)"
+                )
+            # sort the support by (row, action) to enable binary search of factual actions
+            rows = np.repeat(
+                np.arange(self.indptr.shape[0] - 1, dtype=np.int64),
+                np.diff(self.indptr),
+            )
+            keys = rows * self.n_actions + self.indices
+            if np.any(keys[1:] <= keys[:-1]):
+                sorted_idx = np.argsort(keys, kind="stable")
+                keys = keys[sorted_idx]
+                if np.any(keys[1:] == keys[:-1]):
+                    raise ValueError("`indices` must not be duplicated in each row")
+                self.indices = self.indices[sorted_idx]
+                self.data = self.data[sorted_idx]
+            self._keys = keys
+        self._n_rounds = n_rounds
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        """Shape of the corresponding dense action distribution."""
+        return (self._n_rounds, self.n_actions, self.len_list)
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions of the corresponding dense action distribution."""
+        return 3
+
+    @property
+    def has_support(self) -> bool:
+        """Whether the support of the evaluation policy is available."""
+        return self.indptr is not None
+
+    def take_factual(self, action: np.ndarray, position: np.ndarray) -> np.ndarray:
+        """Obtain the action choice probabilities at the given actions and positions, i.e., :math:`\\pi_e(a_i|x_i)`."""
+        if self.factual is not None:
+            return self.factual
+        query = (np.arange(self._n_rounds) * self.len_list + position) * self.n_actions
+        query += action
+        if self._keys.shape[0] == 0:
+            return np.zeros(self._n_rounds)
+        idx = np.minimum(np.searchsorted(self._keys, query), self._keys.shape[0] - 1)
+        return np.where(self._keys[idx] == query, self.data[idx], 0.0)
+
+    def average_at_position(
+        self, values: np.ndarray, position: np.ndarray
+    ) -> np.ndarray:
+        """Compute the expectation of `values` (shape (n_rounds, n_actions, len_list)) over the evaluation policy at the given positions."""
+        if not self.has_support:
+            raise ValueError(
+                "the support (`indptr`, `indices`, and `data`) of `action_dist` must be given "
+                "to compute the expectation over the evaluation policy"
+            )
+        rows = self._keys // self.n_actions
+        round_, pos_ = rows // self.len_list, rows % self.len_list
+        at_position = pos_ == position[round_]
+        round_, pos_ = round_[at_position], pos_[at_position]
+        weighted_values = (
+            self.data[at_position] * values[round_, self.indices[at_position], pos_]
+        )
+        return np.bincount(round_, weights=weighted_values, minlength=self._n_rounds)
+
+    def sum_over_actions(self) -> np.ndarray:
+        """Sum the action choice probabilities over actions for each round and position."""
+        rows = self._keys // self.n_actions
+        sums = np.bincount(
+            rows, weights=self.data, minlength=self._n_rounds * self.len_list
+        )
+        return sums.reshape((self._n_rounds, self.len_list))
+
+    def toarray(self) -> np.ndarray:
+        """Convert to the dense action distribution of shape (n_rounds, n_actions, len_list)."""
+        if not self.has_support:
+            raise ValueError("`action_dist` without the support cannot be densified")
+        action_dist = np.zeros(self.shape)
+        rows = self._keys // self.n_actions
+        action_dist[
+            rows // self.len_list, self.indices, rows % self.len_list
+        ] = self.data
+        return action_dist
+
+    @classmethod
+    def from_dense(cls, action_dist: np.ndarray) -> "SparseActionDist":
+        """Create the sparse representation from a dense action distribution by keeping its non-zero entries."""
+        n_rounds, n_actions, len_list = action_dist.shape
+        round_, pos_, action_ = np.nonzero(action_dist.transpose(0, 2, 1))
+        rows = round_ * len_list + pos_
+        indptr = np.r_[0, np.cumsum(np.bincount(rows, minlength=n_rounds * len_list))]
+        return cls(
+            n_actions=n_actions,
+            len_list=len_list,
+            indptr=indptr,
+            indices=action_,
+            data=action_dist[round_, action_, pos_],
+        )
+
+    @classmethod
+    def concatenate(
+        cls, action_dist_list: List["SparseActionDist"]
+    ) -> "SparseActionDist":
+        """Concatenate the sparse representations of multiple evaluation policies along the rounds.
+
+        Note
+        -------
+        The `k`-th policy is represented by the rounds `k * n_rounds` to `(k + 1) * n_rounds - 1`,
+        so that the intermediates of all the policies are computed at once.
+        `factual` (or the support) is kept only when it is given for all the policies.
+
+        """
+        action_dist = action_dist_list[0]
+        for action_dist_ in action_dist_list[1:]:
+            if action_dist_.shape != action_dist.shape:
+                raise ValueError(
+                    "the action distributions to concatenate must have the same shape"
+                )
+        factual, indptr, indices, data = None, None, None, None
+        if all(action_dist_.factual is not None for action_dist_ in action_dist_list):
+            factual = np.concatenate(
+                [action_dist_.factual for action_dist_ in action_dist_list]
+            )
+        if all(action_dist_.has_support for action_dist_ in action_dist_list):
+            offsets = np.cumsum(
+                [0]
+                + [action_dist_.indices.shape[0] for action_dist_ in action_dist_list]
+            )
+            indptr = np.concatenate(
+                [action_dist.indptr[:1]]
+                + [
+                    action_dist_.indptr[1:] + offset
+                    for action_dist_, offset in zip(action_dist_list, offsets)
+                ]
+            )
+            indices = np.concatenate(
+                [action_dist_.indices for action_dist_ in action_dist_list]
+            )
+            data = np.concatenate(
+                [action_dist_.data for action_dist_ in action_dist_list]
+            )
+        return cls(
+            n_actions=action_dist.n_actions,
+            len_list=action_dist.len_list,
+            factual=factual,
+            indptr=indptr,
+            indices=indices,
+            data=data,
+        )
+
+
+@dataclass
+class CachedActionDist:
+    """Action distribution caching the intermediates shared by multiple OPE estimators.
+
+    Note
+    -------
+    When several OPE estimators are applied to the same logged bandit data, each of them independently
+    computes the same intermediates from `action_dist`, such as the action choice probabilities at the logged actions,
+    i.e., :math:`\\pi_e(a_i|x_i)`, and the expected rewards over the evaluation policy, i.e., :math:`\\hat{q}(x_i,\\pi_e)`.
+    `obp.ope.OffPolicyEvaluation` wraps `action_dist` with this class so that these intermediates
+    (and the validation of `action_dist`) are computed only once and shared by all the estimators.
+
+    The intermediates are cached by the identity of the arrays used to compute them.
+    Thus, the arrays must not be modified in place while this object is in use.
+
+    Parameters
+    -----------
+    action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
+        Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
+
+    """
+
+    action_dist: Union[np.ndarray, SparseActionDist]
+
+    def __post_init__(self) -> None:
+        """Initialize Class."""
+        self._cache = dict()
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        """Shape of the action distribution."""
+        return self.action_dist.shape
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions of the action distribution."""
+        return self.action_dist.ndim
+
+    def get_or_compute(
+        self, name: str, arrays: Tuple[Optional[np.ndarray], ...], compute: Callable
+    ) -> Any:
+        """Return the cached intermediate computed from `arrays` or compute and cache it.
+
+        Parameters
+        -----------
+        name: str
+            Name of the intermediate.
+
+        arrays: Tuple[array-like, ...]
+            Arrays used to compute the intermediate in addition to `action_dist`.
+
+        compute: Callable
+            Function that computes the intermediate without arguments.
+
+        """
+        key = (name,) + tuple(id(array) for array in arrays)
+        if key not in self._cache:
+            # keep references to the arrays so that their identities are not reused
+            self._cache[key] = (arrays, compute())
+        return self._cache[key][1]
+
+
+@dataclass
+class LazyActionDist:
+    """Action distribution of an evaluation policy computed lazily from contexts.
+
+    Note
+    -------
+    Instead of materializing `action_dist` of shape (n_rounds, n_actions, len_list) for the whole logged bandit data,
+    this class evaluates the action choice probabilities of a given policy only for the rounds being accessed,
+    e.g., chunk by chunk in `obp.ope.OffPolicyEvaluation` with `chunk_size`.
+    Thus, the peak memory is bounded by the chunk rather than the whole data.
+
+    Parameters
+    -----------
+    policy: object
+        Evaluation policy having the `predict_proba(context)` method that returns action choice probabilities
+        of shape (n_rounds, n_actions, len_list), such as `obp.policy.IPWLearner` and `obp.policy.NNPolicyLearner`.
+
+    context: array-like, shape (n_rounds, dim_context)
+        Context vectors observed for each data, i.e., :math:`x_i`. This can be `np.memmap`.
+
+    """
+
+    policy: Any
+    context: np.ndarray
+
+    def __post_init__(self) -> None:
+        """Initialize Class."""
+        if not callable(getattr(self.policy, "predict_proba", None)):
+            raise ValueError("`policy` must have the `predict_proba` method")
+        if not (isinstance(self.context, np.ndarray) and self.context.ndim == 2):
+            raise ValueError("`context` must be 2D array")
+        self._shape = (self.context.shape[0],) + self[:1].shape[1:]
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        """Shape of the action distribution."""
+        return self._shape
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions of the action distribution."""
+        return 3
+
+    def __getitem__(self, key: slice) -> np.ndarray:
+        """Compute the action choice probabilities of the evaluation policy for the given rounds."""
+        return self.policy.predict_proba(np.asarray(self.context[key]))
+
+    def toarray(self) -> np.ndarray:
+        """Compute the action choice probabilities of the evaluation policy for all the rounds."""
+        return self[:]
+
+
+@dataclass
+class DeduplicatedEstimatedRewards:
+    """Estimated expected rewards stored once per unique context.
+
+    Note
+    -------
+    When contexts are categorical (e.g., the user features of Open Bandit Dataset), many rounds share
+    the same context vector, and thus the same estimated expected rewards :math:`\\hat{q}(x_i,a)`.
+    This class stores the estimated rewards of the unique contexts and the index of the unique context of each round
+    instead of the dense `estimated_rewards_by_reg_model` of shape (n_rounds, n_actions, len_list).
+
+    Indexing with the round index first (e.g., `estimated_rewards[np.arange(n), action, position]`)
+    behaves as indexing the dense array, and thus OPE estimators such as DM, DR, Switch-DR, and DRos consume this class directly.
+    Indexing only the rounds (e.g., `estimated_rewards[start:stop]`) returns another instance sharing the unique table.
+
+    Parameters
+    -----------
+    unique_estimated_rewards: array-like, shape (n_unique_contexts, n_actions, len_list)
+        Estimated expected rewards of the unique contexts.
+
+    inverse_index: array-like, shape (n_rounds,)
+        Index of the unique context of each round, i.e., the estimated rewards of the `i`-th round
+        are `unique_estimated_rewards[inverse_index[i]]`.
+
+    """
+
+    unique_estimated_rewards: np.ndarray
+    inverse_index: np.ndarray
+
+    def __post_init__(self) -> None:
+        """Initialize Class."""
+        if not (
+            isinstance(self.unique_estimated_rewards, np.ndarray)
+            and self.unique_estimated_rewards.ndim == 3
+        ):
+            raise ValueError("`unique_estimated_rewards` must be 3D array")
+        if not (
+            isinstance(self.inverse_index, np.ndarray)
+            and self.inverse_index.ndim == 1
+            and np.issubdtype(self.inverse_index.dtype, np.integer)
+        ):
+            raise ValueError("`inverse_index` must be 1D array of integers")
+        if self.inverse_index.shape[0] > 0 and (
+            self.inverse_index.min() < 0
+            or self.inverse_index.max() >= self.unique_estimated_rewards.shape[0]
+        ):
+            raise ValueError(
+                "`inverse_index` elements must be in the range of [0, `unique_estimated_rewards.shape[0]`)"
+            )
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        """Shape of the corresponding dense estimated rewards."""
+        return (self.inverse_index.shape[0],) + self.unique_estimated_rewards.shape[1:]
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions of the corresponding dense estimated rewards."""
+        return 3
+
+    @property
+    def n_unique_contexts(self) -> int:
+        """Number of unique contexts."""
+        return self.unique_estimated_rewards.shape[0]
+
+    def __getitem__(
+        self, key: Any
+    ) -> Union[np.ndarray, float, "DeduplicatedEstimatedRewards"]:
+        """Index the estimated rewards as the corresponding dense array."""
+        if not isinstance(key, tuple):
+            key = (key,)
+        rows = self.inverse_index[key[0]]
+        if len(key) == 1 and isinstance(rows, np.ndarray):
+            return DeduplicatedEstimatedRewards(
+                unique_estimated_rewards=self.unique_estimated_rewards,
+                inverse_index=rows,
+            )
+        if isinstance(key[0], slice):
+            # a slice is combined with the other indices differently from an index array
+            return self.unique_estimated_rewards[rows][(slice(None),) + key[1:]]
+        return self.unique_estimated_rewards[(rows,) + key[1:]]
+
+    def __array__(self, dtype: Any = None, copy: Optional[bool] = None) -> np.ndarray:
+        """Convert to the dense estimated rewards."""
+        return self.toarray().astype(dtype, copy=False) if dtype else self.toarray()
+
+    def toarray(self) -> np.ndarray:
+        """Convert to the dense estimated rewards of shape (n_rounds, n_actions, len_list)."""
+        return self.unique_estimated_rewards[self.inverse_index]
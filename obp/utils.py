@@ -2,16 +2,124 @@
 # Licensed under the Apache 2.0 License.
 
 """Useful Tools."""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
 from typing import Dict
+from typing import Iterator
+from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 import numpy as np
 import pandas as pd
+from scipy import sparse
 from sklearn.utils import check_random_state
 from sklearn.utils import check_scalar
 import torch
 
+from .types import CachedActionDist
+from .types import DeduplicatedEstimatedRewards
+from .types import get_validated_range
+from .types import SparseActionDist
+
+
+VALIDATION_LEVELS = ["strict", "fast", "off"]
+_validation_level = "strict"
+# level temporarily set by `validation_level`, which is local to each thread and asynchronous task
+_context_validation_level: ContextVar[Optional[str]] = ContextVar(
+    "validation_level", default=None
+)
+
+
+def set_validation_level(level: str) -> None:
+    """Set the global level of the input validation of OPE estimators and bandit algorithms.
+
+    Parameters
+    -----------
+    level: str
+        Validation level, which must be one of the following.
+
+        - 'strict' (default): validate the shapes, dtypes, and values of inputs.
+        - 'fast': validate only the shapes and dtypes of inputs, and skip the scans of their values (e.g., checking that `action_dist` sums up to one and `pscore` is positive) except for the arrays whose ranges have been recorded by `obp.types.ValidatedBanditFeedback`.
+        - 'off': skip the input validation in `check_bandit_feedback_inputs` and `check_ope_inputs`. This is intended for production runs on inputs that have already been validated.
+
+    """
+    global _validation_level
+    _check_validation_level(level)
+    _validation_level = level
+
+
+def get_validation_level() -> str:
+    """Get the level of the input validation in the current context.
+
+    The level set by :func:`validation_level` takes precedence over the global level set by :func:`set_validation_level`.
+
+    """
+    level = _context_validation_level.get()
+    return _validation_level if level is None else level
+
+
+@contextmanager
+def validation_level(level: str) -> Iterator[None]:
+    """Context manager that temporarily sets the level of the input validation.
+
+    The level is set only in the current thread (or asynchronous task), and thus
+    the input validation running concurrently in the other threads is not affected.
+
+    Parameters
+    -----------
+    level: str
+        Validation level, which must be one of 'strict', 'fast', and 'off'.
+        See :func:`set_validation_level` for details.
+
+    """
+    _check_validation_level(level)
+    token = _context_validation_level.set(level)
+    try:
+        yield
+    finally:
+        _context_validation_level.reset(token)
+
+
+def _check_validation_level(level: str) -> None:
+    """Check that the validation level is valid."""
+    if level not in VALIDATION_LEVELS:
+        raise ValueError(
+            f"`level` must be one of {VALIDATION_LEVELS}, but {level} is given"
+        )
+
+
+def _is_in_range(
+    array: np.ndarray,
+    min_val: Optional[float] = None,
+    max_val: Optional[float] = None,
+    include_min: bool = True,
+) -> bool:
+    """Check whether the elements of an array are in the given range.
+
+    The range validated by `obp.types.ValidatedBanditFeedback` is used without scanning the array.
+    Otherwise, the array is scanned only when the validation level is 'strict'.
+
+    """
+    value_range = get_validated_range(array)
+    if value_range is None:
+        if get_validation_level() != "strict":
+            return True
+        value_range = (
+            array.min() if min_val is not None else None,
+            array.max() if max_val is not None else None,
+        )
+    if min_val is not None:
+        if include_min and not value_range[0] >= min_val:
+            return False
+        if not include_min and not value_range[0] > min_val:
+            return False
+    if max_val is not None and not value_range[1] <= max_val:
+        return False
+    return True
+
 
 def check_confidence_interval_arguments(
     alpha: float = 0.05,
@@ -47,9 +155,20 @@ def estimate_confidence_interval_by_bootstrap(
     alpha: float = 0.05,
     n_bootstrap_samples: int = 10000,
     random_state: Optional[int] = None,
+    resampling: str = "multinomial",
+    max_memory_mb: float = 256.0,
+    resampled_size: Optional[int] = None,
 ) -> Dict[str, float]:
     """Estimate confidence interval using bootstrap.
 
+    Note
+    -------
+    The bootstrap replicates are computed in a vectorized manner, in chunks of replicates
+    whose working memory fits in `max_memory_mb`. The chunking does not change the result.
+
+    - multinomial: resamples the rounds with replacement (i.e., the number of times each round is used follows the multinomial distribution). Given `random_state`, this gives the same statistics as resampling the rounds one replicate at a time with `np.random.RandomState.choice`.
+    - poisson: weights each round by an independent Poisson(1) draw (Poisson bootstrap), which approximates the multinomial resampling for large samples.
+
     Parameters
     ----------
     samples: array-like
@@ -64,6 +183,16 @@ def estimate_confidence_interval_by_bootstrap(
     random_state: int, default=None
         Controls the random seed in bootstrap sampling.
 
+    resampling: str, default="multinomial"
+        Resampling scheme of bootstrap. Must be either "multinomial" or "poisson".
+
+    max_memory_mb: float, default=256.0
+        Memory budget (in MB) for the bootstrap replicates computed at once.
+
+    resampled_size: int, default=None
+        Number of samples resampled in each replicate. If None, the number of the given samples is used.
+        This is only applicable to the multinomial resampling.
+
     Returns
     ----------
     estimated_confidence_interval: Dict[str, float]
@@ -73,11 +202,38 @@ def estimate_confidence_interval_by_bootstrap(
     check_confidence_interval_arguments(
         alpha=alpha, n_bootstrap_samples=n_bootstrap_samples, random_state=random_state
     )
+    if resampling not in ["multinomial", "poisson"]:
+        raise ValueError(
+            f"`resampling` must be either 'multinomial' or 'poisson', but {resampling} is given"
+        )
+    check_scalar(max_memory_mb, "max_memory_mb", target_type=(int, float), min_val=0.0)
 
-    boot_samples = list()
+    n = samples.shape[0]
+    if resampled_size is None:
+        resampled_size = n
+    elif resampling == "poisson":
+        raise ValueError(
+            "`resampled_size` is only applicable to 'multinomial' resampling"
+        )
+    check_scalar(resampled_size, "resampled_size", int, min_val=1)
+    # 32-bit indices are drawn from the same random stream as 64-bit ones
+    index_dtype = np.int32 if n <= np.iinfo(np.int32).max else np.int64
+    # resampled indices (or weights) and the corresponding samples are stored for each replicate
+    chunk_size = max(int(max_memory_mb * 2**20) // (16 * resampled_size), 1)
+    boot_samples = np.zeros(n_bootstrap_samples)
     random_ = check_random_state(random_state)
-    for _ in np.arange(n_bootstrap_samples):
-        boot_samples.append(np.mean(random_.choice(samples, size=samples.shape[0])))
+    for start_ in np.arange(0, n_bootstrap_samples, chunk_size):
+        size = (min(chunk_size, n_bootstrap_samples - start_), resampled_size)
+        if resampling == "multinomial":
+            boot_idx = random_.randint(0, n, size=size, dtype=index_dtype)
+            boot_samples[start_ : start_ + size[0]] = samples[boot_idx].mean(axis=1)
+        else:
+            boot_weights = random_.poisson(1.0, size=size).astype(float)
+            sum_of_weights = np.maximum(boot_weights.sum(axis=1), 1.0)
+            boot_weights *= samples
+            boot_samples[start_ : start_ + size[0]] = (
+                boot_weights.sum(axis=1) / sum_of_weights
+            )
     lower_bound = np.percentile(boot_samples, 100 * (alpha / 2))
     upper_bound = np.percentile(boot_samples, 100 * (1.0 - alpha / 2))
     return {
@@ -87,6 +243,170 @@ def estimate_confidence_interval_by_bootstrap(
     }
 
 
+def estimate_confidence_interval_by_blb(
+    samples: np.ndarray,
+    alpha: float = 0.05,
+    n_bootstrap_samples: int = 100,
+    random_state: Optional[int] = None,
+    n_subsamples: int = 20,
+    subsample_size: Optional[int] = None,
+) -> Dict[str, float]:
+    """Estimate confidence interval using the bag of little bootstraps (BLB).
+
+    Note
+    -------
+    BLB draws `n_subsamples` subsamples of size :math:`b \\ll n` without replacement.
+    For each subsample, it computes bootstrap replicates of the mean by reweighting the :math:`b` samples with
+    multinomial counts summing to :math:`n`, and thus each replicate has the same scale as a replicate of the full bootstrap.
+    The deviations of the confidence bounds from the mean of each subsample are averaged over the subsamples
+    and added to the mean of all the samples.
+    The computational cost is :math:`O(s \\cdot B \\cdot b)` and is nearly independent of :math:`n`.
+
+    Parameters
+    ----------
+    samples: array-like
+        Empirical observed samples to be used to estimate cumulative distribution function.
+
+    alpha: float, default=0.05
+        Significance level.
+
+    n_bootstrap_samples: int, default=100
+        Number of resampling performed for each subsample.
+
+    random_state: int, default=None
+        Controls the random seed in subsampling and bootstrap sampling.
+
+    n_subsamples: int, default=20
+        Number of subsamples.
+
+    subsample_size: int, default=None
+        Size of each subsample. If None, :math:`\\lceil n^{0.6} \\rceil` is used.
+
+    Returns
+    ----------
+    estimated_confidence_interval: Dict[str, float]
+        Dictionary storing the estimated mean and upper-lower confidence bounds.
+
+    References
+    ----------
+    Ariel Kleiner, Ameet Talwalkar, Purnamrita Sarkar, and Michael I. Jordan.
+    "A Scalable Bootstrap for Massive Data.", 2014.
+
+    """
+    check_confidence_interval_arguments(
+        alpha=alpha, n_bootstrap_samples=n_bootstrap_samples, random_state=random_state
+    )
+    check_scalar(n_subsamples, "n_subsamples", int, min_val=1)
+    n = samples.shape[0]
+    if subsample_size is None:
+        subsample_size = int(np.ceil(n**0.6))
+    check_scalar(subsample_size, "subsample_size", int, min_val=1, max_val=n)
+
+    random_ = check_random_state(random_state)
+    # deviations of the bootstrap statistics from the estimate on each subsample
+    deviations = np.zeros((n_subsamples, 3))
+    for s in np.arange(n_subsamples):
+        subsample = samples[
+            _sample_without_replacement(n, size=subsample_size, random_=random_)
+        ]
+        boot_counts = random_.multinomial(
+            n, np.full(subsample_size, 1.0 / subsample_size), size=n_bootstrap_samples
+        )
+        boot_samples = (boot_counts * subsample).sum(axis=1) / n
+        deviations[s] = (
+            np.mean(boot_samples),
+            np.percentile(boot_samples, 100 * (alpha / 2)),
+            np.percentile(boot_samples, 100 * (1.0 - alpha / 2)),
+        )
+        deviations[s] -= subsample.mean()
+    mean, lower_bound, upper_bound = samples.mean() + deviations.mean(axis=0)
+    return {
+        "mean": mean,
+        f"{100 * (1. - alpha)}% CI (lower)": lower_bound,
+        f"{100 * (1. - alpha)}% CI (upper)": upper_bound,
+    }
+
+
+def estimate_confidence_interval_by_m_out_of_n_bootstrap(
+    samples: np.ndarray,
+    alpha: float = 0.05,
+    n_bootstrap_samples: int = 10000,
+    random_state: Optional[int] = None,
+    subsample_size: Optional[int] = None,
+    max_memory_mb: float = 256.0,
+) -> Dict[str, float]:
+    """Estimate confidence interval using the m-out-of-n bootstrap.
+
+    Note
+    -------
+    The m-out-of-n bootstrap resamples only :math:`m \\ll n` samples with replacement in each replicate.
+    The deviations of the replicates from the sample mean are rescaled by :math:`\\sqrt{m/n}`
+    to obtain the confidence bounds of the mean of the :math:`n` samples.
+    The computational cost is :math:`O(B \\cdot m)` in addition to a single pass over the samples.
+
+    Parameters
+    ----------
+    samples: array-like
+        Empirical observed samples to be used to estimate cumulative distribution function.
+
+    alpha: float, default=0.05
+        Significance level.
+
+    n_bootstrap_samples: int, default=10000
+        Number of resampling performed in bootstrap sampling.
+
+    random_state: int, default=None
+        Controls the random seed in bootstrap sampling.
+
+    subsample_size: int, default=None
+        Number of samples resampled in each replicate, :math:`m`. If None, :math:`\\lceil n^{0.6} \\rceil` is used.
+
+    max_memory_mb: float, default=256.0
+        Memory budget (in MB) for the bootstrap replicates computed at once.
+
+    Returns
+    ----------
+    estimated_confidence_interval: Dict[str, float]
+        Dictionary storing the estimated mean and upper-lower confidence bounds.
+
+    References
+    ----------
+    Peter J. Bickel, Friedrich Götze, and Willem R. van Zwet.
+    "Resampling Fewer than n Observations: Gains, Losses, and Remedies for Losses.", 1997.
+
+    """
+    n = samples.shape[0]
+    if subsample_size is None:
+        subsample_size = int(np.ceil(n**0.6))
+    check_scalar(subsample_size, "subsample_size", int, min_val=1)
+
+    estimated_confidence_interval = estimate_confidence_interval_by_bootstrap(
+        samples=samples,
+        alpha=alpha,
+        n_bootstrap_samples=n_bootstrap_samples,
+        random_state=random_state,
+        max_memory_mb=max_memory_mb,
+        resampled_size=subsample_size,
+    )
+    sample_mean, scale = samples.mean(), np.sqrt(subsample_size / n)
+    return {
+        key: sample_mean + scale * (value - sample_mean)
+        for key, value in estimated_confidence_interval.items()
+    }
+
+
+def _sample_without_replacement(
+    n: int, size: int, random_: np.random.RandomState
+) -> np.ndarray:
+    """Sample `size` indices from `n` indices without replacement avoiding a permutation of all the indices."""
+    if 2 * size > n:
+        return random_.permutation(n)[:size]
+    idx = np.unique(random_.randint(0, n, size=size))
+    while idx.shape[0] < size:
+        idx = np.unique(np.r_[idx, random_.randint(0, n, size=size - idx.shape[0])])
+    return idx
+
+
 def sample_action_fast(
     action_dist: np.ndarray, random_state: Optional[int] = None
 ) -> np.ndarray:
@@ -147,10 +467,162 @@ def convert_to_action_dist(
     return action_dist
 
 
+def is_row_invariant_action_dist(
+    action_dist: Union[np.ndarray, SparseActionDist],
+) -> bool:
+    """Check whether an action distribution is shared by all rounds without being copied.
+
+    Note
+    -------
+    Context-free policies such as :class:`obp.policy.Random` and :class:`obp.policy.BernoulliTS`
+    return their action distributions as read-only views created by `np.broadcast_to`,
+    whose stride along the first axis is zero. Such distributions can be processed
+    using only their first row, which is exploited in the fast paths of the OPE estimators.
+
+    Parameters
+    ----------
+    action_dist: array-like, shape (n_rounds, n_actions, len_list) or SparseActionDist
+        Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
+
+    Returns
+    ----------
+    is_row_invariant: bool
+        Whether `action_dist` is broadcast over rounds.
+
+    """
+    return (
+        isinstance(action_dist, np.ndarray)
+        and action_dist.ndim == 3
+        and action_dist.shape[0] > 0
+        and action_dist.strides[0] == 0
+    )
+
+
+def take_factual_action_dist(
+    action_dist: Union[np.ndarray, SparseActionDist, CachedActionDist],
+    action: np.ndarray,
+    position: np.ndarray,
+) -> np.ndarray:
+    """Obtain the action choice probabilities of the evaluation policy at the logged actions and positions.
+
+    Parameters
+    ----------
+    action_dist: array-like, shape (n_rounds, n_actions, len_list), SparseActionDist, or CachedActionDist
+        Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
+
+    action: array-like, shape (n_rounds,)
+        Actions sampled by the logging/behavior policy for each data in logged bandit data, i.e., :math:`a_i`.
+
+    position: array-like, shape (n_rounds,)
+        Indices to differentiate positions in a recommendation interface where the actions are presented.
+
+    Returns
+    ----------
+    factual_action_dist: array-like, shape (n_rounds,)
+        Action choice probabilities of the evaluation policy at the logged actions and positions.
+
+    """
+    if isinstance(action_dist, CachedActionDist):
+        return action_dist.get_or_compute(
+            name="factual",
+            arrays=(action, position),
+            compute=lambda: take_factual_action_dist(
+                action_dist=action_dist.action_dist, action=action, position=position
+            ),
+        ).copy()
+    if isinstance(action_dist, SparseActionDist):
+        return action_dist.take_factual(action=action, position=position)
+    if is_row_invariant_action_dist(action_dist):
+        return action_dist[0, action, position]
+    return action_dist[np.arange(action.shape[0]), action, position]
+
+
+def average_over_action_dist(
+    values: np.ndarray,
+    action_dist: Union[np.ndarray, SparseActionDist, CachedActionDist],
+    position: np.ndarray,
+) -> np.ndarray:
+    """Compute the expectation of given values over the evaluation policy at each position.
+
+    Parameters
+    ----------
+    values: array-like, shape (n_rounds, n_actions, len_list) or DeduplicatedEstimatedRewards
+        Values to be averaged such as the estimated expected rewards, i.e., :math:`\\hat{q}(x_i,a)`.
+
+    action_dist: array-like, shape (n_rounds, n_actions, len_list), SparseActionDist, or CachedActionDist
+        Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
+
+    position: array-like, shape (n_rounds,)
+        Indices to differentiate positions in a recommendation interface where the actions are presented.
+
+    Returns
+    ----------
+    averaged_values: array-like, shape (n_rounds,)
+        Expectation of `values` over the evaluation policy, i.e., :math:`\\hat{q}(x_i,\\pi_e)`.
+
+    """
+    if isinstance(action_dist, CachedActionDist):
+        return action_dist.get_or_compute(
+            name="average",
+            arrays=(values, position),
+            compute=lambda: average_over_action_dist(
+                values=values, action_dist=action_dist.action_dist, position=position
+            ),
+        ).copy()
+    if isinstance(action_dist, SparseActionDist):
+        return action_dist.average_at_position(values=values, position=position)
+    n = position.shape[0]
+    if isinstance(
+        values, DeduplicatedEstimatedRewards
+    ) and is_row_invariant_action_dist(action_dist):
+        # the expectation depends only on the unique context and position
+        action_dist_ = action_dist[0] / action_dist[0].sum(axis=0, keepdims=True)
+        averaged_unique_values = np.einsum(
+            "ual,al->ul", values.unique_estimated_rewards, action_dist_
+        )
+        return averaged_unique_values[values.inverse_index, position]
+    if is_row_invariant_action_dist(action_dist):
+        # one matrix-vector product per position as the evaluation policy is shared by all rounds
+        action_dist_ = action_dist[0] / action_dist[0].sum(axis=0, keepdims=True)
+        averaged_values = np.zeros(n)
+        for pos_ in np.unique(position):
+            idx = position == pos_
+            averaged_values[idx] = values[idx, :, pos_] @ action_dist_[:, pos_]
+        return averaged_values
+    return np.average(
+        values[np.arange(n), :, position],
+        weights=action_dist[np.arange(n), :, position],
+        axis=1,
+    )
+
+
+def load_memmap_if_path(
+    array: Optional[Union[np.ndarray, str, Path]]
+) -> Optional[np.ndarray]:
+    """Memory-map the array stored in a `.npy` file when its path is given.
+
+    Parameters
+    -------------
+    array: array-like, str, or Path
+        Input array or the path to a `.npy` file storing it.
+
+    Returns
+    ----------
+    array: array-like
+        Given array itself or a read-only `np.memmap` of the file, which is loaded lazily
+        when its elements are accessed.
+
+    """
+    if isinstance(array, Path) or (isinstance(array, str) and array.endswith(".npy")):
+        return np.load(array, mmap_mode="r")
+    return array
+
+
 def check_array(
     array: np.ndarray,
     name: str,
     expected_dim: int = 1,
+    accept_sparse: bool = False,
 ) -> ValueError:
     """Input validation on an array.
 
@@ -165,7 +637,16 @@ def check_array(
     expected_dim: int, default=1
         Expected dimension of the input array.
 
+    accept_sparse: bool, default=False
+        Whether to accept a scipy sparse matrix (which is always 2D).
+
     """
+    if accept_sparse and sparse.issparse(array):
+        if expected_dim != 2:
+            raise ValueError(
+                f"`{name}` must be {expected_dim}D array, but got a sparse matrix"
+            )
+        return
     if not isinstance(array, np.ndarray):
         raise ValueError(
             f"`{name}` must be {expected_dim}D array, but got {type(array)}"
@@ -176,6 +657,80 @@ def check_array(
         )
 
 
+def check_estimated_rewards_by_reg_model(
+    estimated_rewards_by_reg_model: Union[np.ndarray, DeduplicatedEstimatedRewards],
+    name: str = "estimated_rewards_by_reg_model",
+) -> ValueError:
+    """Input validation on the estimated expected rewards given as a 3D array or DeduplicatedEstimatedRewards.
+
+    Parameters
+    -------------
+    estimated_rewards_by_reg_model: object
+        Input object to check.
+
+    name: str, default="estimated_rewards_by_reg_model"
+        Name of the input.
+
+    """
+    if isinstance(estimated_rewards_by_reg_model, DeduplicatedEstimatedRewards):
+        return
+    check_array(array=estimated_rewards_by_reg_model, name=name, expected_dim=3)
+
+
+def deduplicate_rows(
+    array: Union[np.ndarray, sparse.spmatrix]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Find the unique rows of a 2D array (or a sparse matrix) by hashing each row once.
+
+    Note
+    -------
+    Each row is viewed as a single byte string and hashed by `pd.factorize`, which scales linearly with
+    the number of rows, unlike `np.unique(array, axis=0)` sorting the rows lexicographically.
+    The rows of a sparse matrix are compared by their (sorted) non-zero indices and values.
+
+    Parameters
+    -----------
+    array: array-like or sparse matrix, shape (n_rows, n_cols)
+        Array whose rows are deduplicated, e.g., context vectors.
+
+    Returns
+    ----------
+    (unique_index, inverse_index): Tuple[np.ndarray, np.ndarray]
+        Indices of the first occurrences of the unique rows (in order of appearance) and
+        the index of the unique row of each row, i.e., `array[unique_index][inverse_index]` equals `array`.
+
+    """
+    n_rows = array.shape[0]
+    if sparse.issparse(array):
+        array = sparse.csr_matrix(array, copy=True)
+        array.eliminate_zeros()
+        array.sum_duplicates()
+        nnz = np.diff(array.indptr)
+        width = int(nnz.max()) if n_rows > 0 else 0
+        rows = np.repeat(np.arange(n_rows), nnz)
+        cols = np.arange(array.nnz) - np.repeat(array.indptr[:-1], nnz)
+        indices = np.full((n_rows, width), -1, dtype=np.int64)
+        indices[rows, cols] = array.indices
+        data = np.zeros((n_rows, width), dtype=array.dtype)
+        data[rows, cols] = array.data
+        keys = np.concatenate(
+            [indices.view(np.uint8), data.view(np.uint8)], axis=1
+        ).reshape((n_rows, -1))
+    else:
+        keys = np.ascontiguousarray(array).reshape((n_rows, -1)).view(np.uint8)
+    if n_rows == 0:
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+    if keys.shape[1] == 0:
+        return np.zeros(1, dtype=int), np.zeros(n_rows, dtype=int)
+    keys = np.ascontiguousarray(keys).view(np.dtype((np.void, keys.shape[1]))).ravel()
+    inverse_index = pd.factorize(keys)[0].astype(int)
+    # the unique rows are numbered in order of appearance
+    is_first = np.r_[
+        True, inverse_index[1:] > np.maximum.accumulate(inverse_index)[:-1]
+    ]
+    return np.flatnonzero(is_first), inverse_index
+
+
 def check_tensor(
     tensor: torch.tensor,
     name: str,
@@ -205,6 +760,33 @@ def check_tensor(
         )
 
 
+def concatenate_features(
+    blocks: List[Union[np.ndarray, sparse.spmatrix]], axis: int = 1
+) -> Union[np.ndarray, sparse.csr_matrix]:
+    """Concatenate blocks of feature vectors without densifying sparse blocks.
+
+    Parameters
+    -----------
+    blocks: list of array-like or sparse matrices
+        2D blocks of feature vectors to be concatenated.
+
+    axis: int, default=1
+        Axis along which the blocks are concatenated.
+        `axis=1` concatenates features (columns), and `axis=0` concatenates samples (rows).
+
+    Returns
+    ---------
+    features: array-like or sparse matrix
+        Concatenated feature vectors.
+        When any of the blocks is sparse, they are concatenated into a CSR matrix.
+
+    """
+    if any(sparse.issparse(block) for block in blocks):
+        stack = sparse.hstack if axis == 1 else sparse.vstack
+        return stack(blocks, format="csr")
+    return np.concatenate(blocks, axis=axis)
+
+
 def check_bandit_feedback_inputs(
     context: np.ndarray,
     action: np.ndarray,
@@ -213,6 +795,7 @@ def check_bandit_feedback_inputs(
     position: Optional[np.ndarray] = None,
     pscore: Optional[np.ndarray] = None,
     action_context: Optional[np.ndarray] = None,
+    accept_sparse: bool = False,
 ) -> Optional[ValueError]:
     """Check inputs for bandit learning or simulation.
 
@@ -239,8 +822,15 @@ def check_bandit_feedback_inputs(
     action_context: array-like, shape (n_actions, dim_action_context)
         Context vectors characterizing each action.
 
+    accept_sparse: bool, default=False
+        Whether to accept `context` given as a scipy sparse matrix.
+
     """
-    check_array(array=context, name="context", expected_dim=2)
+    if get_validation_level() == "off":
+        return
+    check_array(
+        array=context, name="context", expected_dim=2, accept_sparse=accept_sparse
+    )
     check_array(array=action, name="action", expected_dim=1)
     check_array(array=reward, name="reward", expected_dim=1)
     if expected_reward is not None:
@@ -257,14 +847,15 @@ def check_bandit_feedback_inputs(
             )
         if not (
             np.issubdtype(action.dtype, np.integer)
-            and action.min() >= 0
-            and action.max() < expected_reward.shape[1]
+            and _is_in_range(action, min_val=0, max_val=expected_reward.shape[1] - 1)
         ):
             raise ValueError(
                 "`action` elements must be integers in the range of [0, `expected_reward.shape[1]`)"
             )
     else:
-        if not (np.issubdtype(action.dtype, np.integer) and action.min() >= 0):
+        if not (
+            np.issubdtype(action.dtype, np.integer) and _is_in_range(action, min_val=0)
+        ):
             raise ValueError("`action` elements must be non-negative integers")
     if pscore is not None:
         check_array(array=pscore, name="pscore", expected_dim=1)
@@ -275,7 +866,7 @@ def check_bandit_feedback_inputs(
                 "Expected `context.shape[0] == action.shape[0] == reward.shape[0] == pscore.shape[0]`"
                 ", but found it False"
             )
-        if np.any(pscore <= 0):
+        if not _is_in_range(pscore, min_val=0, include_min=False):
             raise ValueError("`pscore` must be positive")
 
     if position is not None:
@@ -287,7 +878,10 @@ def check_bandit_feedback_inputs(
                 "Expected `context.shape[0] == action.shape[0] == reward.shape[0] == position.shape[0]`"
                 ", but found it False"
             )
-        if not (np.issubdtype(position.dtype, np.integer) and position.min() >= 0):
+        if not (
+            np.issubdtype(position.dtype, np.integer)
+            and _is_in_range(position, min_val=0)
+        ):
             raise ValueError("`position` elements must be non-negative integers")
     else:
         if not (context.shape[0] == action.shape[0] == reward.shape[0]):
@@ -299,17 +893,41 @@ def check_bandit_feedback_inputs(
         check_array(array=action_context, name="action_context", expected_dim=2)
         if not (
             np.issubdtype(action.dtype, np.integer)
-            and action.min() >= 0
-            and action.max() < action_context.shape[0]
+            and _is_in_range(action, min_val=0, max_val=action_context.shape[0] - 1)
         ):
             raise ValueError(
                 "`action` elements must be integers in the range of [0, `action_context.shape[0]`)"
             )
     else:
-        if not (np.issubdtype(action.dtype, np.integer) and action.min() >= 0):
+        if not (
+            np.issubdtype(action.dtype, np.integer) and _is_in_range(action, min_val=0)
+        ):
             raise ValueError("`action` elements must be non-negative integers")
 
 
+def _check_action_dist(action_dist: Union[np.ndarray, SparseActionDist]) -> None:
+    """Check that the action distribution is valid."""
+    if isinstance(action_dist, SparseActionDist):
+        if get_validation_level() != "strict":
+            return
+        if action_dist.has_support:
+            if not np.allclose(action_dist.sum_over_actions(), 1):
+                raise ValueError("`action_dist` must be a probability distribution")
+        if action_dist.factual is not None:
+            if np.any(action_dist.factual < 0) or np.any(action_dist.factual > 1):
+                raise ValueError("`action_dist.factual` must be in the range of [0, 1]")
+    else:
+        check_array(array=action_dist, name="action_dist", expected_dim=3)
+        if get_validation_level() != "strict":
+            return
+        if is_row_invariant_action_dist(action_dist):
+            action_dist_ = action_dist[:1]
+        else:
+            action_dist_ = action_dist
+        if not np.allclose(action_dist_.sum(axis=1), 1):
+            raise ValueError("`action_dist` must be a probability distribution")
+
+
 def check_ope_inputs(
     action_dist: np.ndarray,
     position: Optional[np.ndarray] = None,
@@ -323,7 +941,7 @@ def check_ope_inputs(
 
     Parameters
     -----------
-    action_dist: array-like, shape (n_rounds, n_actions, len_list)
+    action_dist: array-like, shape (n_rounds, n_actions, len_list), SparseActionDist, or CachedActionDist
         Action choice probabilities of the evaluation policy (can be deterministic), i.e., :math:`\\pi_e(a_i|x_i)`.
 
     position: array-like, shape (n_rounds,), default=None
@@ -345,10 +963,17 @@ def check_ope_inputs(
         Importance weights estimated via supervised classification, i.e., :math:`\\hat{w}(x_t, a_t)`.
 
     """
+    if get_validation_level() == "off":
+        return
     # action_dist
-    check_array(array=action_dist, name="action_dist", expected_dim=3)
-    if not np.allclose(action_dist.sum(axis=1), 1):
-        raise ValueError("`action_dist` must be a probability distribution")
+    if isinstance(action_dist, CachedActionDist):
+        action_dist.get_or_compute(
+            name="check",
+            arrays=(),
+            compute=lambda: _check_action_dist(action_dist=action_dist.action_dist),
+        )
+    else:
+        _check_action_dist(action_dist=action_dist)
 
     # position
     if position is not None:
@@ -357,9 +982,12 @@ def check_ope_inputs(
             raise ValueError(
                 "Expected `position.shape[0] == action_dist.shape[0]`, but found it False"
             )
-        if not (np.issubdtype(position.dtype, np.integer) and position.min() >= 0):
+        if not (
+            np.issubdtype(position.dtype, np.integer)
+            and _is_in_range(position, min_val=0)
+        ):
             raise ValueError("`position` elements must be non-negative integers")
-        if position.max() >= action_dist.shape[2]:
+        if not _is_in_range(position, max_val=action_dist.shape[2] - 1):
             raise ValueError(
                 "`position` elements must be smaller than `action_dist.shape[2]`"
             )
@@ -380,7 +1008,7 @@ def check_ope_inputs(
             raise ValueError(
                 "Expected `action.shape[0] == estimated_importance_weights.shape[0]`, but found it False"
             )
-        if np.any(estimated_importance_weights < 0):
+        if not _is_in_range(estimated_importance_weights, min_val=0):
             raise ValueError("estimated_importance_weights must be non-negative")
 
     # action, reward
@@ -393,8 +1021,7 @@ def check_ope_inputs(
             )
         if not (
             np.issubdtype(action.dtype, np.integer)
-            and action.min() >= 0
-            and action.max() < action_dist.shape[1]
+            and _is_in_range(action, min_val=0, max_val=action_dist.shape[1] - 1)
         ):
             raise ValueError(
                 "`action` elements must be integers in the range of [0, `action_dist.shape[1]`)"
@@ -408,7 +1035,7 @@ def check_ope_inputs(
             raise ValueError(
                 "Expected `action.shape[0] == reward.shape[0] == pscore.shape[0]`, but found it False"
             )
-        if np.any(pscore <= 0):
+        if not _is_in_range(pscore, min_val=0, include_min=False):
             raise ValueError("`pscore` must be positive")
 
 
@@ -25,6 +25,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     install_requires=[
+        "joblib>=1.0.1",
         "matplotlib>=3.4.3",
         "mypy-extensions>=0.4.3",
         "numpy>=1.21.2",
@@ -33,6 +34,7 @@ setup(
         "seaborn>=0.10.1",
         "scikit-learn>=1.0.2",
         "scipy>=1.7.3",
+        "threadpoolctl>=2.2.0",
         "torch>=1.9.0",
         "tqdm>=4.62.2",
         "pyieoe>=0.1.1",
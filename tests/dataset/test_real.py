@@ -1,11 +1,18 @@
+from pathlib import Path
+import pickle
 from typing import Dict
 from typing import Tuple
 
+from joblib import delayed
+from joblib import Parallel
 import numpy as np
 import pandas as pd
 import pytest
+from scipy import sparse
 
 from obp.dataset import OpenBanditDataset
+from obp.types import BootstrapReplicate
+from obp.types import ColumnarBanditFeedback
 
 
 def test_real_init():
@@ -98,6 +105,8 @@ def test_calc_on_policy_policy_value_estimate():
         behavior_policy="random", campaign="all"
     )
     assert isinstance(ground_truth_policy_value, float)
+    dataset = OpenBanditDataset(behavior_policy="random", campaign="all")
+    assert dataset.calc_on_policy_policy_value() == ground_truth_policy_value
 
 
 def test_sample_bootstrap_bandit_feedback():
@@ -148,3 +157,241 @@ def test_sample_bootstrap_bandit_feedback():
     assert bootstrap_bf["n_rounds"] == sample_size
     for k in bf_keys:
         assert len(bootstrap_bf[k]) == sample_size
+
+
+def test_obtain_columnar_bandit_feedback():
+    dataset = OpenBanditDataset(behavior_policy="random", campaign="all")
+    bandit_feedback = dataset.obtain_batch_bandit_feedback()
+    columnar_bandit_feedback = dataset.obtain_batch_bandit_feedback(columnar=True)
+    assert isinstance(columnar_bandit_feedback, ColumnarBanditFeedback)
+    assert set(columnar_bandit_feedback) == set(bandit_feedback)
+    assert columnar_bandit_feedback["position"].dtype == np.uint8
+    assert columnar_bandit_feedback["reward"].dtype == bool
+    assert columnar_bandit_feedback["pscore"].dtype == np.float32
+    for k in ["action", "position", "reward", "context"]:
+        assert np.all(columnar_bandit_feedback[k] == bandit_feedback[k])
+    assert np.allclose(columnar_bandit_feedback["pscore"], bandit_feedback["pscore"])
+
+    # train-test split without copying
+    bandit_feedback_train, bandit_feedback_test = dataset.obtain_batch_bandit_feedback(
+        is_timeseries_split=True, columnar=True
+    )
+    for k in ["action", "position", "reward", "context"]:
+        assert np.shares_memory(
+            bandit_feedback_train[k], columnar_bandit_feedback[k]
+        ) and np.shares_memory(bandit_feedback_test[k], columnar_bandit_feedback[k])
+    assert (
+        bandit_feedback_train["n_rounds"] + bandit_feedback_test["n_rounds"]
+        == bandit_feedback["n_rounds"]
+    )
+
+    # bootstrap replicates sample the same rows as the dictionary
+    bootstrap_bf = dataset.sample_bootstrap_bandit_feedback(random_state=12345)
+    columnar_bootstrap_bf = dataset.sample_bootstrap_bandit_feedback(
+        random_state=12345, columnar=True
+    )
+    assert columnar_bootstrap_bf["n_rounds"] == bootstrap_bf["n_rounds"]
+    for k in ["action", "position", "reward", "context"]:
+        assert np.all(columnar_bootstrap_bf[k] == bootstrap_bf[k])
+
+
+def _mean_reward_of_replicate(replicate: BootstrapReplicate) -> float:
+    return replicate.materialize()["reward"].mean()
+
+
+def test_generate_bootstrap_replicates():
+    dataset = OpenBanditDataset(behavior_policy="random", campaign="all")
+    with pytest.raises(ValueError):
+        dataset.generate_bootstrap_replicates(n_replicates=0)
+
+    with pytest.raises(ValueError):
+        dataset.generate_bootstrap_replicates(n_replicates=3, sample_size=10000000)
+
+    with pytest.raises(ValueError):
+        dataset.generate_bootstrap_replicates(
+            n_replicates=3, is_timeseries_split=True, test_size=1.3
+        )
+
+    # the arguments are validated before the logged bandit data is stored in shared memory
+    with pytest.raises(TypeError):
+        dataset.generate_bootstrap_replicates(
+            n_replicates=3, is_timeseries_split="True", shared_memory=True
+        )
+    assert not hasattr(dataset, "shared_columnar_bandit_feedback_")
+
+    replicates = list(
+        dataset.generate_bootstrap_replicates(n_replicates=3, random_state=12345)
+    )
+    assert len({replicate.random_state for replicate in replicates}) == 3
+    for replicate in replicates:
+        # the replicates share the base logged bandit data
+        assert replicate.bandit_feedback is replicates[0].bandit_feedback
+        bootstrap_bf = replicate.materialize()
+        expected_bootstrap_bf = dataset.sample_bootstrap_bandit_feedback(
+            random_state=replicate.random_state, columnar=True
+        )
+        assert bootstrap_bf["n_rounds"] == dataset.n_rounds
+        for k in ["action", "position", "reward", "pscore", "context"]:
+            assert np.array_equal(bootstrap_bf[k], expected_bootstrap_bf[k])
+
+    sample_size = 100
+    replicate = next(
+        dataset.generate_bootstrap_replicates(
+            n_replicates=1,
+            sample_size=sample_size,
+            is_timeseries_split=True,
+            random_state=12345,
+        )
+    )
+    bootstrap_bf = replicate.materialize()
+    assert bootstrap_bf["n_rounds"] == sample_size
+    n_rounds_train = dataset.obtain_batch_bandit_feedback(is_timeseries_split=True)[0][
+        "n_rounds"
+    ]
+    assert replicate.sample_index().max() < n_rounds_train
+
+    # shared memory sends only the seed and the paths of the columns to the workers
+    shared_replicates = list(
+        dataset.generate_bootstrap_replicates(
+            n_replicates=3, random_state=12345, shared_memory=True
+        )
+    )
+    shared_bandit_feedback = shared_replicates[0].bandit_feedback
+    assert len(pickle.dumps(shared_replicates[0])) < 0.1 * len(
+        pickle.dumps(replicates[0])
+    )
+    for replicate, shared_replicate in zip(replicates, shared_replicates):
+        unpickled_bootstrap_bf = pickle.loads(
+            pickle.dumps(shared_replicate)
+        ).materialize()
+        bootstrap_bf = replicate.materialize()
+        for k in ["action", "position", "reward", "pscore", "context"]:
+            assert np.array_equal(unpickled_bootstrap_bf[k], bootstrap_bf[k])
+    assert Parallel(n_jobs=2)(
+        delayed(_mean_reward_of_replicate)(replicate) for replicate in shared_replicates
+    ) == [_mean_reward_of_replicate(replicate) for replicate in replicates]
+    shared_folder = shared_bandit_feedback._shared_memory.path
+    assert shared_folder.exists()
+    shared_bandit_feedback.release_shared_memory()
+    assert not Path(shared_folder).exists()
+
+
+def test_real_cache(tmp_path, monkeypatch):
+    with pytest.raises(ValueError):
+        OpenBanditDataset(behavior_policy="random", campaign="all", cache_dir=1)
+
+    dataset = OpenBanditDataset(behavior_policy="random", campaign="all")
+    bandit_feedback = dataset.obtain_batch_bandit_feedback()
+    # the first construction creates the cache, and the second one loads it
+    for _ in range(2):
+        cached_dataset = OpenBanditDataset(
+            behavior_policy="random", campaign="all", cache_dir=tmp_path
+        )
+        cached_bandit_feedback = cached_dataset.obtain_batch_bandit_feedback()
+        for k in bandit_feedback:
+            assert np.array_equal(bandit_feedback[k], cached_bandit_feedback[k])
+    assert len(list(tmp_path.iterdir())) == 1
+    assert isinstance(cached_dataset.context, np.memmap)
+    assert cached_dataset.len_list == dataset.len_list
+    assert (
+        OpenBanditDataset.calc_on_policy_policy_value_estimate(
+            behavior_policy="random", campaign="all", cache_dir=tmp_path
+        )
+        == bandit_feedback["reward"].mean()
+    )
+
+    # the cache is invalidated when the preprocessing is overridden
+    class CustomOpenBanditDataset(OpenBanditDataset):
+        def pre_process(self) -> None:
+            super().pre_process()
+            self.context = self.context[:, :1]
+
+    custom_dataset = CustomOpenBanditDataset(
+        behavior_policy="random", campaign="all", cache_dir=tmp_path
+    )
+    assert custom_dataset.context.shape[1] == 1
+    assert len(list(tmp_path.iterdir())) == 2
+
+    # the cache is invalidated when the library versions change
+    monkeypatch.setattr(pd, "__version__", "0.0.0")
+    OpenBanditDataset(behavior_policy="random", campaign="all", cache_dir=tmp_path)
+    assert len(list(tmp_path.iterdir())) == 3
+
+
+def test_real_chunk_size():
+    with pytest.raises(ValueError):
+        OpenBanditDataset(behavior_policy="random", campaign="all", chunk_size=0)
+
+    class CustomOpenBanditDataset(OpenBanditDataset):
+        def pre_process(self) -> None:
+            super().pre_process()
+
+    with pytest.raises(ValueError):
+        CustomOpenBanditDataset(
+            behavior_policy="random", campaign="all", chunk_size=100
+        )
+
+    dataset = OpenBanditDataset(behavior_policy="random", campaign="all")
+    bandit_feedback = dataset.obtain_batch_bandit_feedback()
+    for chunk_size in [1000, 3333, 10**6]:
+        streamed_dataset = OpenBanditDataset(
+            behavior_policy="random", campaign="all", chunk_size=chunk_size
+        )
+        assert not hasattr(streamed_dataset, "data")
+        streamed_bandit_feedback = streamed_dataset.obtain_batch_bandit_feedback()
+        for k in bandit_feedback:
+            if isinstance(bandit_feedback[k], np.ndarray):
+                assert bandit_feedback[k].dtype == streamed_bandit_feedback[k].dtype
+                assert np.array_equal(bandit_feedback[k], streamed_bandit_feedback[k])
+            else:
+                assert bandit_feedback[k] == streamed_bandit_feedback[k]
+
+
+def test_real_load_multiple():
+    with pytest.raises(ValueError):
+        OpenBanditDataset.load_multiple(prefer="aaa")
+
+    with pytest.raises(ValueError):
+        OpenBanditDataset.load_multiple(behavior_policies=["aaa"])
+
+    for prefer in ["threads", "processes"]:
+        datasets = OpenBanditDataset.load_multiple(
+            behavior_policies=["random"], campaigns=["all"], n_jobs=2, prefer=prefer
+        )
+        assert list(datasets) == [("random", "all")]
+        dataset = OpenBanditDataset(behavior_policy="random", campaign="all")
+        bandit_feedback = dataset.obtain_batch_bandit_feedback()
+        loaded_bandit_feedback = datasets[
+            ("random", "all")
+        ].obtain_batch_bandit_feedback()
+        for k in bandit_feedback:
+            assert np.array_equal(bandit_feedback[k], loaded_bandit_feedback[k])
+        assert datasets[("random", "all")].item_context.equals(dataset.item_context)
+
+
+def test_real_sparse_context(tmp_path):
+    dataset = OpenBanditDataset(behavior_policy="random", campaign="all")
+    bandit_feedback = dataset.obtain_batch_bandit_feedback()
+    for kwargs in [dict(), dict(chunk_size=3000), dict(cache_dir=tmp_path)]:
+        sparse_dataset = OpenBanditDataset(
+            behavior_policy="random", campaign="all", sparse_context=True, **kwargs
+        )
+        sparse_bandit_feedback = sparse_dataset.obtain_batch_bandit_feedback()
+        assert sparse.isspmatrix_csr(sparse_bandit_feedback["context"])
+        assert np.array_equal(
+            sparse_bandit_feedback["context"].toarray(), bandit_feedback["context"]
+        )
+        assert sparse_dataset.dim_context == dataset.dim_context
+
+    # the sparse context is loaded from the cache
+    cached_dataset = OpenBanditDataset(
+        behavior_policy="random",
+        campaign="all",
+        sparse_context=True,
+        cache_dir=tmp_path,
+    )
+    assert sparse.isspmatrix_csr(cached_dataset.context)
+    bootstrap_bandit_feedback = cached_dataset.sample_bootstrap_bandit_feedback(
+        random_state=12345
+    )
+    assert sparse.isspmatrix_csr(bootstrap_bandit_feedback["context"])
@@ -1,10 +1,14 @@
 from conftest import generate_action_dist
 import numpy as np
 import pytest
+from sklearn.linear_model import LogisticRegression
 
 from obp import ope
 from obp.ope import OffPolicyEvaluation
+from obp.policy import IPWLearner
 from obp.types import BanditFeedback
+from obp.types import LazyActionDist
+from obp.types import SparseActionDist
 
 
 # action_dist, action, reward, pscore, position, estimated_rewards_by_reg_model, estimated_pscore, estimated_importance_weights, description
@@ -679,3 +683,578 @@ def test_response_format_of_ope_estimators_using_random_evaluation_policy(
             estimated_intervals[key]["mean"]
             <= estimated_intervals[key]["95.0% CI (upper)"]
         ), f"Invalid confidence interval of {key}: upper bound < mean"
+
+
+def test_estimation_of_all_estimators_using_sparse_action_dist(
+    synthetic_bandit_feedback: BanditFeedback, random_action_dist: np.ndarray
+) -> None:
+    """
+    Test that the sparse representation of action_dist gives the same estimates as the dense one
+    """
+    expected_reward = synthetic_bandit_feedback["expected_reward"][:, :, np.newaxis]
+    action = synthetic_bandit_feedback["action"]
+    # make the evaluation policy sparse (top-2 actions)
+    action_dist = random_action_dist.copy()
+    action_dist[:, 2:, :] = 0.0
+    action_dist /= action_dist.sum(axis=1, keepdims=True)
+    sparse_action_dist = SparseActionDist.from_dense(action_dist)
+    assert np.allclose(sparse_action_dist.toarray(), action_dist)
+    estimators = [
+        getattr(ope.estimators, estimator_name)()
+        for estimator_name in ope.__all_estimators__
+    ]
+    ope_instance = OffPolicyEvaluation(
+        bandit_feedback=synthetic_bandit_feedback, ope_estimators=estimators
+    )
+    estimated_importance_weights = (
+        action_dist[np.arange(action.shape[0]), action, 0]
+        / synthetic_bandit_feedback["pscore"]
+    )
+    dense_policy_value = ope_instance.estimate_policy_values(
+        action_dist=action_dist,
+        estimated_rewards_by_reg_model=expected_reward,
+        estimated_importance_weights=estimated_importance_weights,
+    )
+    sparse_policy_value = ope_instance.estimate_policy_values(
+        action_dist=sparse_action_dist,
+        estimated_rewards_by_reg_model=expected_reward,
+        estimated_importance_weights=estimated_importance_weights,
+    )
+    for key in dense_policy_value:
+        assert np.isclose(
+            dense_policy_value[key], sparse_policy_value[key], equal_nan=True
+        ), f"sparse action_dist gives a different estimate for {key}"
+
+    # IPW-type estimators only need the factual action choice probabilities
+    factual_action_dist = SparseActionDist(
+        n_actions=action_dist.shape[1],
+        factual=action_dist[np.arange(action.shape[0]), action, 0],
+    )
+    for estimator_name in ["InverseProbabilityWeighting", "ReplayMethod"]:
+        estimator = getattr(ope.estimators, estimator_name)()
+        estimated_policy_value = estimator.estimate_policy_value(
+            reward=synthetic_bandit_feedback["reward"],
+            action=action,
+            pscore=synthetic_bandit_feedback["pscore"],
+            action_dist=factual_action_dist,
+        )
+        assert np.isclose(
+            estimated_policy_value, dense_policy_value[estimator.estimator_name]
+        )
+    # model-dependent estimators need the support of the evaluation policy
+    with pytest.raises(ValueError, match=r"the support \(`indptr`"):
+        ope.DirectMethod().estimate_policy_value(
+            reward=synthetic_bandit_feedback["reward"],
+            action=action,
+            action_dist=factual_action_dist,
+            estimated_rewards_by_reg_model=expected_reward,
+        )
+
+
+def test_estimation_of_all_estimators_using_broadcast_action_dist(
+    synthetic_bandit_feedback: BanditFeedback,
+) -> None:
+    """
+    Test that the action_dist broadcast over rounds gives the same estimates as the dense one
+    """
+    n_rounds = synthetic_bandit_feedback["n_rounds"]
+    n_actions = synthetic_bandit_feedback["n_actions"]
+    expected_reward = synthetic_bandit_feedback["expected_reward"][:, :, np.newaxis]
+    action_dist_single_round = generate_action_dist(1, n_actions, 1)
+    broadcast_action_dist = np.broadcast_to(
+        action_dist_single_round, (n_rounds, n_actions, 1)
+    )
+    dense_action_dist = np.tile(action_dist_single_round, (n_rounds, 1, 1))
+    estimators = [
+        getattr(ope.estimators, estimator_name)()
+        for estimator_name in ope.__all_estimators__
+    ]
+    ope_instance = OffPolicyEvaluation(
+        bandit_feedback=synthetic_bandit_feedback, ope_estimators=estimators
+    )
+    estimated_importance_weights = (
+        dense_action_dist[np.arange(n_rounds), synthetic_bandit_feedback["action"], 0]
+        / synthetic_bandit_feedback["pscore"]
+    )
+    dense_policy_value = ope_instance.estimate_policy_values(
+        action_dist=dense_action_dist,
+        estimated_rewards_by_reg_model=expected_reward,
+        estimated_importance_weights=estimated_importance_weights,
+    )
+    broadcast_policy_value = ope_instance.estimate_policy_values(
+        action_dist=broadcast_action_dist,
+        estimated_rewards_by_reg_model=expected_reward,
+        estimated_importance_weights=estimated_importance_weights,
+    )
+    for key in dense_policy_value:
+        assert np.isclose(
+            dense_policy_value[key], broadcast_policy_value[key], equal_nan=True
+        ), f"broadcast action_dist gives a different estimate for {key}"
+
+
+def test_estimation_of_all_estimators_using_fused_ope(
+    synthetic_bandit_feedback: BanditFeedback, random_action_dist: np.ndarray
+) -> None:
+    """
+    Test that sharing the intermediates across estimators does not change the estimates
+    """
+    expected_reward = synthetic_bandit_feedback["expected_reward"][:, :, np.newaxis]
+    action = synthetic_bandit_feedback["action"]
+    estimators = [
+        getattr(ope.estimators, estimator_name)()
+        for estimator_name in ope.__all_estimators__
+    ]
+    estimators += [
+        getattr(ope.estimators_tuning, estimator_name)(
+            lambdas=[1, 100, np.inf], tuning_method="slope"
+        )
+        for estimator_name in ope.__all_estimators_tuning__
+    ]
+    estimators += [
+        getattr(ope.estimators_tuning, estimator_name)(
+            lambdas=[0.001, 0.01, 0.1], tuning_method="slope"
+        )
+        for estimator_name in ope.__all_estimators_tuning_sg__
+    ]
+    estimated_importance_weights = (
+        random_action_dist[np.arange(action.shape[0]), action, 0]
+        / synthetic_bandit_feedback["pscore"]
+    )
+    estimated_policy_values, estimated_intervals = dict(), dict()
+    for fused in [True, False]:
+        ope_instance = OffPolicyEvaluation(
+            bandit_feedback=synthetic_bandit_feedback,
+            ope_estimators=estimators,
+            fused=fused,
+        )
+        estimated_policy_values[fused] = ope_instance.estimate_policy_values(
+            action_dist=random_action_dist,
+            estimated_rewards_by_reg_model=expected_reward,
+            estimated_importance_weights=estimated_importance_weights,
+        )
+        estimated_intervals[fused] = ope_instance.estimate_intervals(
+            action_dist=random_action_dist,
+            estimated_rewards_by_reg_model=expected_reward,
+            estimated_importance_weights=estimated_importance_weights,
+            n_bootstrap_samples=10,
+            random_state=12345,
+        )
+    for key in estimated_policy_values[False]:
+        assert np.isclose(
+            estimated_policy_values[True][key],
+            estimated_policy_values[False][key],
+            equal_nan=True,
+        ), f"fused OPE gives a different estimate for {key}"
+        for stat in estimated_intervals[False][key]:
+            assert np.isclose(
+                estimated_intervals[True][key][stat],
+                estimated_intervals[False][key][stat],
+                equal_nan=True,
+            ), f"fused OPE gives a different confidence interval for {key}"
+
+    with pytest.raises(TypeError, match="fused"):
+        OffPolicyEvaluation(
+            bandit_feedback=synthetic_bandit_feedback,
+            ope_estimators=estimators,
+            fused="True",
+        )
+
+
+@pytest.mark.parametrize(
+    "ci_method",
+    ["bootstrap", "blb", "m_out_of_n", "normal", "hoeffding", "bernstein", "student_t"],
+)
+def test_estimate_intervals_of_all_estimators_using_ci_method(
+    ci_method: str,
+    synthetic_bandit_feedback: BanditFeedback,
+    random_action_dist: np.ndarray,
+) -> None:
+    """
+    Test the response format of the confidence intervals estimated with each ci_method
+    """
+    expected_reward = synthetic_bandit_feedback["expected_reward"][:, :, np.newaxis]
+    estimators = [
+        getattr(ope.estimators, estimator_name)()
+        for estimator_name in ope.__all_estimators__
+        if estimator_name not in ["BalancedInverseProbabilityWeighting"]
+    ]
+    ope_instance = OffPolicyEvaluation(
+        bandit_feedback=synthetic_bandit_feedback, ope_estimators=estimators
+    )
+    estimated_intervals = ope_instance.estimate_intervals(
+        action_dist=random_action_dist,
+        estimated_rewards_by_reg_model=expected_reward,
+        random_state=12345,
+        ci_method=ci_method,
+    )
+    for key in estimated_intervals:
+        assert set(estimated_intervals[key].keys()) == set(
+            ["mean", "95.0% CI (lower)", "95.0% CI (upper)"]
+        ), f"Confidence interval of {key} has invalid keys"
+        assert (
+            estimated_intervals[key]["95.0% CI (lower)"]
+            <= estimated_intervals[key]["mean"]
+            <= estimated_intervals[key]["95.0% CI (upper)"]
+        ), f"Invalid confidence interval of {key}"
+
+    with pytest.raises(ValueError, match="`ci_method` must be one of"):
+        ope_instance.estimate_intervals(
+            action_dist=random_action_dist,
+            estimated_rewards_by_reg_model=expected_reward,
+            ci_method="a",
+        )
+
+
+@pytest.mark.parametrize(
+    "estimator_name",
+    [
+        "ReplayMethod",
+        "InverseProbabilityWeighting",
+        "SelfNormalizedInverseProbabilityWeighting",
+        "DirectMethod",
+        "DoublyRobust",
+        "SelfNormalizedDoublyRobust",
+    ],
+)
+def test_estimation_of_estimators_using_partial_fit_and_merge(
+    estimator_name: str,
+    synthetic_bandit_feedback: BanditFeedback,
+    random_action_dist: np.ndarray,
+) -> None:
+    """
+    Test that the statistics accumulated over chunks give the same estimates as the whole data
+    """
+    n_rounds = synthetic_bandit_feedback["n_rounds"]
+    inputs = {
+        "reward": synthetic_bandit_feedback["reward"],
+        "action": synthetic_bandit_feedback["action"],
+        "pscore": synthetic_bandit_feedback["pscore"],
+        "position": synthetic_bandit_feedback["position"],
+        "action_dist": random_action_dist,
+        "estimated_rewards_by_reg_model": synthetic_bandit_feedback["expected_reward"][
+            :, :, np.newaxis
+        ],
+    }
+    estimator = getattr(ope.estimators, estimator_name)()
+    estimated_policy_value = estimator.estimate_policy_value(**inputs)
+
+    # accumulate the chunks by two workers and merge them
+    workers = [getattr(ope.estimators, estimator_name)() for _ in range(2)]
+    for i, chunk in enumerate(np.array_split(np.arange(n_rounds), 5)):
+        workers[i % 2].partial_fit(
+            **{
+                key: value[chunk] if isinstance(value, np.ndarray) else value
+                for key, value in inputs.items()
+            }
+        )
+    merged_estimator = workers[0].merge(workers[1])
+    assert np.isclose(
+        merged_estimator.estimate_policy_value_from_statistics(),
+        estimated_policy_value,
+    )
+    for ci_method in ["normal", "student_t"]:
+        estimated_interval = estimator.estimate_interval(**inputs, ci_method=ci_method)
+        streaming_interval = merged_estimator.estimate_interval_from_statistics(
+            ci_method=ci_method
+        )
+        for key in estimated_interval:
+            assert np.isclose(estimated_interval[key], streaming_interval[key])
+    # concentration inequalities are exact or conservative
+    for ci_method in ["hoeffding", "bernstein"]:
+        estimated_interval = estimator.estimate_interval(**inputs, ci_method=ci_method)
+        streaming_interval = merged_estimator.estimate_interval_from_statistics(
+            ci_method=ci_method
+        )
+        assert (
+            streaming_interval["95.0% CI (lower)"]
+            <= estimated_interval["95.0% CI (lower)"] + 1e-10
+        )
+        assert (
+            estimated_interval["95.0% CI (upper)"]
+            <= streaming_interval["95.0% CI (upper)"] + 1e-10
+        )
+
+    with pytest.raises(ValueError, match="Call `partial_fit` first"):
+        getattr(
+            ope.estimators, estimator_name
+        )().estimate_policy_value_from_statistics()
+    with pytest.raises(ValueError, match="same class with the same hyperparameters"):
+        merged_estimator.merge(ope.BalancedInverseProbabilityWeighting())
+
+
+def test_estimation_of_estimators_using_memmap_inputs_by_chunk(
+    tmp_path, synthetic_bandit_feedback: BanditFeedback, random_action_dist: np.ndarray
+) -> None:
+    """
+    Test that OPE over the chunks of memory-mapped inputs gives the same estimates as the in-memory one
+    """
+    expected_reward = synthetic_bandit_feedback["expected_reward"][:, :, np.newaxis]
+    memmap_bandit_feedback = dict()
+    for key in ["action", "reward", "pscore", "context"]:
+        np.save(tmp_path / f"{key}.npy", synthetic_bandit_feedback[key])
+        memmap_bandit_feedback[key] = tmp_path / f"{key}.npy"
+    memmap_bandit_feedback["position"] = None
+    np.save(tmp_path / "action_dist.npy", random_action_dist)
+    np.save(tmp_path / "expected_reward.npy", expected_reward)
+    estimator_names = [
+        "ReplayMethod",
+        "InverseProbabilityWeighting",
+        "SelfNormalizedInverseProbabilityWeighting",
+        "DirectMethod",
+        "DoublyRobust",
+        "SelfNormalizedDoublyRobust",
+        "SwitchDoublyRobust",
+        "SubGaussianDoublyRobust",
+    ]
+    estimators = [
+        getattr(ope.estimators, estimator_name)() for estimator_name in estimator_names
+    ]
+    ope_instance = OffPolicyEvaluation(
+        bandit_feedback=synthetic_bandit_feedback, ope_estimators=estimators
+    )
+    chunked_ope_instance = OffPolicyEvaluation(
+        bandit_feedback=memmap_bandit_feedback,
+        ope_estimators=estimators,
+        chunk_size=3000,
+    )
+    estimated_policy_value = ope_instance.estimate_policy_values(
+        action_dist=random_action_dist,
+        estimated_rewards_by_reg_model=expected_reward,
+    )
+    chunked_policy_value = chunked_ope_instance.estimate_policy_values(
+        action_dist=str(tmp_path / "action_dist.npy"),
+        estimated_rewards_by_reg_model=np.load(
+            tmp_path / "expected_reward.npy", mmap_mode="r"
+        ),
+    )
+    for key in estimated_policy_value:
+        assert np.isclose(estimated_policy_value[key], chunked_policy_value[key])
+
+    estimated_intervals = ope_instance.estimate_intervals(
+        action_dist=random_action_dist,
+        estimated_rewards_by_reg_model=expected_reward,
+        ci_method="normal",
+    )
+    chunked_intervals = chunked_ope_instance.estimate_intervals(
+        action_dist=str(tmp_path / "action_dist.npy"),
+        estimated_rewards_by_reg_model=str(tmp_path / "expected_reward.npy"),
+        ci_method="normal",
+    )
+    for key in estimated_intervals:
+        for stat in estimated_intervals[key]:
+            assert np.isclose(
+                estimated_intervals[key][stat], chunked_intervals[key][stat]
+            )
+
+    with pytest.raises(ValueError, match="`ci_method` must be one of 'normal'"):
+        chunked_ope_instance.estimate_intervals(
+            action_dist=random_action_dist,
+            estimated_rewards_by_reg_model=expected_reward,
+            ci_method="bootstrap",
+        )
+    with pytest.raises(ValueError, match="does not implement `partial_fit`"):
+        OffPolicyEvaluation(
+            bandit_feedback=memmap_bandit_feedback,
+            ope_estimators=[ope.BalancedInverseProbabilityWeighting()],
+            chunk_size=3000,
+        )
+
+
+def test_estimation_of_estimators_using_evaluation_policy_by_chunk(
+    synthetic_bandit_feedback: BanditFeedback,
+) -> None:
+    """
+    Test that OPE with an evaluation policy evaluated chunk by chunk gives the same estimates as the materialized action_dist
+    """
+    evaluation_policy = IPWLearner(
+        n_actions=synthetic_bandit_feedback["n_actions"],
+        base_classifier=LogisticRegression(random_state=12345),
+    )
+    evaluation_policy.fit(
+        context=synthetic_bandit_feedback["context"],
+        action=synthetic_bandit_feedback["action"],
+        reward=synthetic_bandit_feedback["reward"],
+        pscore=synthetic_bandit_feedback["pscore"],
+    )
+    action_dist = evaluation_policy.predict_proba(
+        context=synthetic_bandit_feedback["context"]
+    )
+    expected_reward = synthetic_bandit_feedback["expected_reward"][:, :, np.newaxis]
+    estimators = [
+        ope.InverseProbabilityWeighting(),
+        ope.SelfNormalizedInverseProbabilityWeighting(),
+        ope.DirectMethod(),
+        ope.DoublyRobust(),
+    ]
+    estimated_policy_value = OffPolicyEvaluation(
+        bandit_feedback=synthetic_bandit_feedback, ope_estimators=estimators
+    ).estimate_policy_values(
+        action_dist=action_dist, estimated_rewards_by_reg_model=expected_reward
+    )
+    for chunk_size in [None, 3000]:
+        ope_instance = OffPolicyEvaluation(
+            bandit_feedback=synthetic_bandit_feedback,
+            ope_estimators=estimators,
+            chunk_size=chunk_size,
+        )
+        lazy_policy_value = ope_instance.estimate_policy_values(
+            action_dist=evaluation_policy,
+            estimated_rewards_by_reg_model=expected_reward,
+        )
+        for key in estimated_policy_value:
+            assert np.isclose(estimated_policy_value[key], lazy_policy_value[key])
+
+    lazy_action_dist = LazyActionDist(
+        policy=evaluation_policy, context=synthetic_bandit_feedback["context"]
+    )
+    assert lazy_action_dist.shape == action_dist.shape
+    assert np.allclose(lazy_action_dist[100:200], action_dist[100:200])
+    with pytest.raises(ValueError, match="must have the `predict_proba` method"):
+        LazyActionDist(policy=None, context=synthetic_bandit_feedback["context"])
+
+
+@pytest.mark.parametrize("fused", [True, False])
+def test_estimation_of_multiple_policies(
+    fused: bool, synthetic_bandit_feedback: BanditFeedback
+) -> None:
+    """
+    Test that the batched evaluation of multiple policies gives the same estimates as evaluating them one by one
+    """
+    n_rounds = synthetic_bandit_feedback["n_rounds"]
+    n_actions = synthetic_bandit_feedback["n_actions"]
+    expected_reward = synthetic_bandit_feedback["expected_reward"][:, :, np.newaxis]
+    action_dist_list = np.stack(
+        [generate_action_dist(n_rounds, n_actions, 1) for _ in range(3)]
+    )
+    policy_name_list = ["pi_1", "pi_2", "pi_3"]
+    estimators = [
+        getattr(ope.estimators, estimator_name)()
+        for estimator_name in ope.__all_estimators__
+        if estimator_name not in ["BalancedInverseProbabilityWeighting"]
+    ]
+    ope_instance = OffPolicyEvaluation(
+        bandit_feedback=synthetic_bandit_feedback,
+        ope_estimators=estimators,
+        fused=fused,
+    )
+    policy_value_dict = ope_instance.estimate_policy_values_of_multiple_policies(
+        policy_name_list=policy_name_list,
+        action_dist_list=action_dist_list,
+        estimated_rewards_by_reg_model=expected_reward,
+    )
+    interval_dict = ope_instance.estimate_intervals_of_multiple_policies(
+        policy_name_list=policy_name_list,
+        action_dist_list=list(action_dist_list),
+        estimated_rewards_by_reg_model=expected_reward,
+        ci_method="normal",
+    )
+    for policy_name, action_dist in zip(policy_name_list, action_dist_list):
+        policy_value = ope_instance.estimate_policy_values(
+            action_dist=action_dist,
+            estimated_rewards_by_reg_model=expected_reward,
+        )
+        interval = ope_instance.estimate_intervals(
+            action_dist=action_dist,
+            estimated_rewards_by_reg_model=expected_reward,
+            ci_method="normal",
+        )
+        for key in policy_value:
+            assert np.isclose(
+                policy_value_dict[policy_name][key], policy_value[key], equal_nan=True
+            )
+            for stat in interval[key]:
+                assert np.isclose(
+                    interval_dict[policy_name][key][stat],
+                    interval[key][stat],
+                    equal_nan=True,
+                )
+
+    # the sparse action distributions are evaluated at once as well
+    sparse_policy_value_dict = ope_instance.estimate_policy_values_of_multiple_policies(
+        policy_name_list=policy_name_list,
+        action_dist_list=[
+            SparseActionDist.from_dense(action_dist) for action_dist in action_dist_list
+        ],
+        estimated_rewards_by_reg_model=expected_reward,
+    )
+    for policy_name in policy_name_list:
+        for key in policy_value_dict[policy_name]:
+            assert np.isclose(
+                sparse_policy_value_dict[policy_name][key],
+                policy_value_dict[policy_name][key],
+                equal_nan=True,
+            )
+
+    with pytest.raises(ValueError, match="the length of `policy_name_list`"):
+        ope_instance.estimate_policy_values_of_multiple_policies(
+            policy_name_list=policy_name_list[:2],
+            action_dist_list=action_dist_list,
+            estimated_rewards_by_reg_model=expected_reward,
+        )
+    with pytest.raises(ValueError, match="must be a probability distribution"):
+        ope_instance.estimate_policy_values_of_multiple_policies(
+            policy_name_list=policy_name_list,
+            action_dist_list=action_dist_list * 2,
+            estimated_rewards_by_reg_model=expected_reward,
+        )
+
+
+@pytest.mark.parametrize(
+    "estimator_name, tuning_method, use_bias_upper_bound",
+    [
+        (estimator_name, tuning_method, use_bias_upper_bound)
+        for estimator_name in ope.__all_estimators_tuning__
+        + ope.__all_estimators_tuning_sg__
+        for tuning_method in ["slope", "mse"]
+        for use_bias_upper_bound in [True, False]
+    ],
+)
+def test_tuning_of_estimators_using_lambda_sweep(
+    estimator_name: str,
+    tuning_method: str,
+    use_bias_upper_bound: bool,
+    synthetic_bandit_feedback: BanditFeedback,
+    random_action_dist: np.ndarray,
+    monkeypatch,
+) -> None:
+    """
+    Test that the vectorized sweep over lambdas selects the same hyperparameter as evaluating each candidate
+    """
+    if estimator_name in ope.__all_estimators_tuning_sg__:
+        lambdas = [0.0, 0.001, 0.01, 0.05, 0.1, 0.5, 1.0]
+    else:
+        lambdas = [0.0, 1.0, 2.0, 5.0, 10.0, 100.0, 10000.0, np.inf]
+    inputs = {
+        "reward": synthetic_bandit_feedback["reward"],
+        "action": synthetic_bandit_feedback["action"],
+        "pscore": synthetic_bandit_feedback["pscore"],
+        "position": synthetic_bandit_feedback["position"],
+        "action_dist": random_action_dist,
+        "estimated_rewards_by_reg_model": synthetic_bandit_feedback["expected_reward"][
+            :, :, np.newaxis
+        ],
+    }
+
+    def _tune() -> ope.estimators_tuning.BaseOffPolicyEstimatorTuning:
+        estimator = getattr(ope.estimators_tuning, estimator_name)(
+            lambdas=list(lambdas),
+            tuning_method=tuning_method,
+            use_bias_upper_bound=use_bias_upper_bound,
+        )
+        estimator.estimate_policy_value(**inputs)
+        return estimator
+
+    estimator = _tune()
+    # evaluate each candidate by instantiating the base estimator
+    monkeypatch.setattr(ope.estimators_tuning, "_WEIGHT_MODIFICATIONS", dict())
+    reference_estimator = _tune()
+    assert estimator.best_hyperparam == reference_estimator.best_hyperparam
+    if tuning_method == "mse":
+        for (
+            hyperparam_,
+            estimated_mse_score,
+        ) in estimator.estimated_mse_score_dict.items():
+            assert np.isclose(
+                estimated_mse_score,
+                reference_estimator.estimated_mse_score_dict[hyperparam_],
+            )
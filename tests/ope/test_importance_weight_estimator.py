@@ -4,6 +4,7 @@ from typing import Dict
 from conftest import generate_action_dist
 import numpy as np
 import pytest
+from scipy import sparse
 from sklearn.base import BaseEstimator
 from sklearn.ensemble import GradientBoostingClassifier
 from sklearn.ensemble import RandomForestClassifier
@@ -774,3 +775,124 @@ def test_performance_of_binary_outcome_models(
         assert (
             auc_scores[model_name] > 0.5
         ), f"AUC of {model_name} should be greater than 0.5"
+
+
+@pytest.mark.parametrize("fitting_method", ["sample", "raw"])
+def test_importance_weight_estimator_using_sparse_context(fitting_method: str) -> None:
+    context = np.random.binomial(1, 0.1, size=(n_rounds, 20)).astype(float)
+    action = np.random.choice(n_actions, size=n_rounds)
+    position = np.random.choice(len_list, size=n_rounds)
+    action_dist = generate_action_dist(n_rounds, n_actions, len_list)
+    estimated_importance_weights_list = []
+    for context_ in [context, sparse.csr_matrix(context)]:
+        importance_weight_estimator = ImportanceWeightEstimator(
+            n_actions=n_actions,
+            len_list=len_list,
+            base_model=LogisticRegression(tol=1e-10),
+            fitting_method=fitting_method,
+            calibration_cv=1,
+        )
+        estimated_importance_weights_list.append(
+            importance_weight_estimator.fit_predict(
+                context=context_,
+                action=action,
+                action_dist=action_dist,
+                position=position,
+                n_folds=2,
+                random_state=12345,
+            )
+        )
+    assert np.allclose(
+        estimated_importance_weights_list[0], estimated_importance_weights_list[1]
+    )
+
+
+@pytest.mark.parametrize("fitting_method", ["sample", "raw"])
+def test_importance_weight_estimator_using_parallel_fitting(
+    fitting_method: str,
+) -> None:
+    with pytest.raises(TypeError):
+        ImportanceWeightEstimator(
+            n_actions=n_actions, base_model=LogisticRegression(), n_jobs="a"
+        )
+
+    with pytest.raises(ValueError):
+        ImportanceWeightEstimator(
+            n_actions=n_actions, base_model=LogisticRegression(), prefer="a"
+        )
+
+    context = np.random.normal(size=(n_rounds, 5))
+    action = np.random.choice(n_actions, size=n_rounds)
+    position = np.random.choice(len_list, size=n_rounds)
+    action_dist = generate_action_dist(n_rounds, n_actions, len_list)
+    estimated_importance_weights_list = []
+    for n_jobs, prefer in [(1, "processes"), (2, "processes"), (-1, "threads")]:
+        importance_weight_estimator = ImportanceWeightEstimator(
+            n_actions=n_actions,
+            len_list=len_list,
+            base_model=LogisticRegression(),
+            fitting_method=fitting_method,
+            calibration_cv=1,
+            n_jobs=n_jobs,
+            prefer=prefer,
+        )
+        for n_folds in [1, 3]:
+            estimated_importance_weights_list.append(
+                importance_weight_estimator.fit_predict(
+                    context=context,
+                    action=action,
+                    action_dist=action_dist,
+                    position=position,
+                    n_folds=n_folds,
+                    random_state=12345,
+                )
+            )
+        assert len(importance_weight_estimator.base_model_list) == len_list
+    # the estimates do not depend on the workers
+    for k in [2, 4]:
+        assert np.allclose(
+            estimated_importance_weights_list[k], estimated_importance_weights_list[0]
+        )
+        assert np.allclose(
+            estimated_importance_weights_list[k + 1],
+            estimated_importance_weights_list[1],
+        )
+
+    # the dense training data are identical to the stacked logged and evaluation-policy samples
+    importance_weight_estimator = ImportanceWeightEstimator(
+        n_actions=n_actions,
+        len_list=len_list,
+        base_model=LogisticRegression(),
+        action_context=np.random.normal(size=(n_actions, 2)),
+        fitting_method=fitting_method,
+        calibration_cv=1,
+    )
+    sampled_action = np.random.choice(n_actions, size=n_rounds)
+    X, y = importance_weight_estimator._pre_process_for_clf_model(
+        context=context,
+        action=action,
+        action_dist_at_pos=action_dist[:, :, 0],
+        sampled_action_at_position=sampled_action,
+    )
+    X_sparse, y_sparse = importance_weight_estimator._pre_process_for_clf_model(
+        context=sparse.csr_matrix(context),
+        action=action,
+        action_dist_at_pos=action_dist[:, :, 0],
+        sampled_action_at_position=sampled_action,
+    )
+    action_context = importance_weight_estimator.action_context
+    evaluation_action_feature = (
+        action_dist[:, :, 0]
+        if fitting_method == "raw"
+        else action_context[sampled_action]
+    )
+    assert np.array_equal(
+        X,
+        np.r_[
+            np.c_[context, action_context[action]],
+            np.c_[context, evaluation_action_feature],
+        ],
+    )
+    assert np.array_equal(X, X_sparse.toarray())
+    assert np.array_equal(y, np.r_[np.zeros(n_rounds), np.ones(n_rounds)])
+    assert np.array_equal(y, y_sparse)
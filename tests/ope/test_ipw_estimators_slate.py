@@ -1367,3 +1367,37 @@ def test_boundedness_of_slate_snipw_using_random_evaluation_policy() -> None:
         assert (
             estimated_policy_value[key] <= len_list
         ), f"estimated policy value of snipw should be smaller than or equal to {len_list} (because of its 1-boundedness for each position), but the value is: {estimated_policy_value}"
+
+
+@pytest.mark.parametrize("ci_method", ["normal", "hoeffding", "bernstein", "student_t"])
+def test_estimate_intervals_of_sips_using_analytic_ci_method(ci_method) -> None:
+    random_ = np.random.RandomState(12345)
+    n_slates = 100
+    slate_id = np.repeat(np.arange(n_slates), len_list)
+    reward = random_.binomial(1, 0.5, size=n_slates * len_list)
+    pscore = np.repeat(random_.uniform(0.1, 1.0, size=n_slates), len_list)
+    position = np.tile(np.arange(len_list), n_slates)
+    evaluation_policy_pscore = np.repeat(
+        random_.uniform(0.1, 1.0, size=n_slates), len_list
+    )
+    estimated_policy_value = sips.estimate_policy_value(
+        slate_id=slate_id,
+        reward=reward,
+        pscore=pscore,
+        position=position,
+        evaluation_policy_pscore=evaluation_policy_pscore,
+    )
+    estimated_interval = sips.estimate_interval(
+        slate_id=slate_id,
+        reward=reward,
+        pscore=pscore,
+        position=position,
+        evaluation_policy_pscore=evaluation_policy_pscore,
+        ci_method=ci_method,
+    )
+    assert np.isclose(estimated_interval["mean"], estimated_policy_value)
+    assert (
+        estimated_interval["95.0% CI (lower)"]
+        < estimated_policy_value
+        < estimated_interval["95.0% CI (upper)"]
+    )
@@ -3,6 +3,7 @@ from typing import Dict
 
 import numpy as np
 import pytest
+from scipy import sparse
 from sklearn.base import BaseEstimator
 from sklearn.ensemble import GradientBoostingClassifier
 from sklearn.ensemble import RandomForestClassifier
@@ -536,3 +537,68 @@ def test_performance_of_binary_outcome_models(
         assert (
             auc_scores[model_name] > 0.5
         ), f"AUC of {model_name} should be greater than 0.5"
+
+
+def test_propensity_score_estimator_using_sparse_context() -> None:
+    context = np.random.binomial(1, 0.1, size=(n_rounds, 20)).astype(float)
+    action = np.random.choice(n_actions, size=n_rounds)
+    position = np.random.choice(len_list, size=n_rounds)
+    estimated_pscore_list = []
+    for context_ in [context, sparse.csr_matrix(context)]:
+        propensity_score_estimator = PropensityScoreEstimator(
+            n_actions=n_actions,
+            len_list=len_list,
+            base_model=LogisticRegression(tol=1e-10),
+            calibration_cv=1,
+        )
+        estimated_pscore_list.append(
+            propensity_score_estimator.fit_predict(
+                context=context_,
+                action=action,
+                position=position,
+                n_folds=2,
+                random_state=12345,
+            )
+        )
+    assert np.allclose(estimated_pscore_list[0], estimated_pscore_list[1])
+
+
+def test_propensity_score_estimator_using_parallel_fitting() -> None:
+    with pytest.raises(TypeError):
+        PropensityScoreEstimator(
+            n_actions=n_actions, base_model=LogisticRegression(), n_jobs="a"
+        )
+
+    with pytest.raises(ValueError):
+        PropensityScoreEstimator(
+            n_actions=n_actions, base_model=LogisticRegression(), prefer="a"
+        )
+
+    context = np.random.normal(size=(n_rounds, 5))
+    action = np.random.choice(n_actions, size=n_rounds)
+    position = np.random.choice(len_list, size=n_rounds)
+    estimated_pscore_list = []
+    for n_jobs, prefer in [(1, "processes"), (2, "processes"), (-1, "threads")]:
+        propensity_score_estimator = PropensityScoreEstimator(
+            n_actions=n_actions,
+            len_list=len_list,
+            base_model=LogisticRegression(),
+            calibration_cv=1,
+            n_jobs=n_jobs,
+            prefer=prefer,
+        )
+        for n_folds in [1, 3]:
+            estimated_pscore_list.append(
+                propensity_score_estimator.fit_predict(
+                    context=context,
+                    action=action,
+                    position=position,
+                    n_folds=n_folds,
+                    random_state=12345,
+                )
+            )
+        assert len(propensity_score_estimator.base_model_list) == len_list
+    # the estimates do not depend on the workers
+    for k in [2, 4]:
+        assert np.allclose(estimated_pscore_list[k], estimated_pscore_list[0])
+        assert np.allclose(estimated_pscore_list[k + 1], estimated_pscore_list[1])
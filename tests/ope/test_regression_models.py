@@ -4,16 +4,23 @@ from typing import Dict
 from conftest import generate_action_dist
 import numpy as np
 import pytest
+from scipy import sparse
 from sklearn.base import BaseEstimator
 from sklearn.ensemble import GradientBoostingClassifier
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.linear_model import LogisticRegression
 from sklearn.linear_model import Ridge
+from sklearn.linear_model import SGDClassifier
 from sklearn.metrics import roc_auc_score
 import yaml
 
+from obp.ope import DirectMethod
+from obp.ope import DoublyRobust
+from obp.ope import DoublyRobustWithShrinkageTuning
 from obp.ope import RegressionModel
+from obp.ope import SwitchDoublyRobustTuning
 from obp.types import BanditFeedback
+from obp.types import DeduplicatedEstimatedRewards
 
 
 np.random.seed(1)
@@ -922,3 +929,336 @@ def test_performance_of_binary_outcome_models(
         assert (
             auc_scores[model_name] > 0.5
         ), f"AUC of {model_name} should be greater than 0.5"
+
+
+def test_regression_models_using_sparse_context() -> None:
+    context = np.random.binomial(1, 0.1, size=(n_rounds, 20)).astype(float)
+    action = np.random.choice(n_actions, size=n_rounds)
+    reward = np.random.binomial(1, 0.5, size=n_rounds)
+    position = np.random.choice(len_list, size=n_rounds)
+    q_hat_list = []
+    for context_ in [context, sparse.csr_matrix(context)]:
+        regression_model = RegressionModel(
+            n_actions=n_actions,
+            len_list=len_list,
+            base_model=LogisticRegression(tol=1e-10),
+        )
+        q_hat_list.append(
+            regression_model.fit_predict(
+                context=context_,
+                action=action,
+                reward=reward,
+                position=position,
+                n_folds=2,
+                random_state=12345,
+            )
+        )
+    assert np.allclose(q_hat_list[0], q_hat_list[1])
+
+
+def test_regression_models_using_batched_prediction() -> None:
+    with pytest.raises(ValueError):
+        RegressionModel(
+            n_actions=n_actions, base_model=LogisticRegression(), predict_batch_size=0
+        )
+
+    with pytest.raises(ValueError):
+        RegressionModel(
+            n_actions=n_actions, base_model=LogisticRegression(), dtype=np.int64
+        )
+
+    context = np.random.normal(size=(n_rounds, 5))
+    action = np.random.choice(n_actions, size=n_rounds)
+    reward = np.random.binomial(1, 0.5, size=n_rounds)
+    position = np.random.choice(len_list, size=n_rounds)
+    regression_model = RegressionModel(
+        n_actions=n_actions,
+        len_list=len_list,
+        base_model=LogisticRegression(),
+    )
+    regression_model.fit(
+        context=context, action=action, reward=reward, position=position
+    )
+    # predictions of the base model of each position for each action one by one
+    expected_q_hat = np.zeros((n_rounds, n_actions, len_list))
+    for action_ in np.arange(n_actions):
+        for pos_ in np.arange(len_list):
+            X = np.c_[context, np.eye(n_actions)[np.full(n_rounds, action_)]]
+            expected_q_hat[:, action_, pos_] = regression_model.base_model_list[
+                pos_
+            ].predict_proba(X)[:, 1]
+    # the stacked design matrices are split into chunks of rounds of different sizes
+    for predict_batch_size in [1, 100, 100000]:
+        regression_model.predict_batch_size = predict_batch_size
+        q_hat = regression_model.predict(context=context)
+        assert q_hat.dtype == np.float64
+        assert np.allclose(q_hat, expected_q_hat)
+
+    regression_model.dtype = np.float32
+    q_hat = regression_model.predict(context=context)
+    assert q_hat.dtype == np.float32
+    assert np.allclose(q_hat, expected_q_hat, atol=1e-6)
+
+
+@pytest.mark.parametrize("fitting_method", ["normal", "iw"])
+def test_regression_models_using_parallel_fitting(fitting_method: str) -> None:
+    with pytest.raises(TypeError):
+        RegressionModel(
+            n_actions=n_actions, base_model=LogisticRegression(), n_jobs="a"
+        )
+
+    with pytest.raises(ValueError):
+        RegressionModel(
+            n_actions=n_actions, base_model=LogisticRegression(), prefer="a"
+        )
+
+    context = np.random.normal(size=(n_rounds, 5))
+    action = np.random.choice(n_actions, size=n_rounds)
+    reward = np.random.binomial(1, 0.5, size=n_rounds)
+    position = np.random.choice(len_list, size=n_rounds)
+    pscore = np.ones(n_rounds) / n_actions
+    action_dist = generate_action_dist(n_rounds, n_actions, len_list)
+    q_hat_list = []
+    for n_jobs, prefer in [(1, "processes"), (2, "processes"), (-1, "threads")]:
+        regression_model = RegressionModel(
+            n_actions=n_actions,
+            len_list=len_list,
+            base_model=LogisticRegression(),
+            fitting_method=fitting_method,
+            n_jobs=n_jobs,
+            prefer=prefer,
+        )
+        for n_folds in [1, 3]:
+            q_hat_list.append(
+                regression_model.fit_predict(
+                    context=context,
+                    action=action,
+                    reward=reward,
+                    pscore=pscore,
+                    position=position,
+                    action_dist=action_dist,
+                    n_folds=n_folds,
+                    random_state=12345,
+                )
+            )
+        assert len(regression_model.base_model_list) == len_list
+    # the estimates do not depend on the workers
+    for k in [2, 4]:
+        assert np.allclose(q_hat_list[k], q_hat_list[0])
+        assert np.allclose(q_hat_list[k + 1], q_hat_list[1])
+
+
+def test_regression_models_using_cache(tmp_path, monkeypatch) -> None:
+    with pytest.raises(ValueError):
+        RegressionModel(
+            n_actions=n_actions, base_model=LogisticRegression(), cache_dir=1
+        )
+
+    with pytest.raises(ValueError):
+        RegressionModel(
+            n_actions=n_actions, base_model=LogisticRegression(), max_cache_mb=-1.0
+        )
+
+    context = np.random.normal(size=(n_rounds, 5))
+    action = np.random.choice(n_actions, size=n_rounds)
+    reward = np.random.binomial(1, 0.5, size=n_rounds)
+    position = np.random.choice(len_list, size=n_rounds)
+    kwargs = dict(
+        context=context,
+        action=action,
+        reward=reward,
+        position=position,
+        n_folds=3,
+        random_state=12345,
+    )
+    regression_model = RegressionModel(
+        n_actions=n_actions,
+        len_list=len_list,
+        base_model=LogisticRegression(),
+        cache_dir=tmp_path,
+    )
+    q_hat = regression_model.fit_predict(**kwargs)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # the second call loads the estimated rewards and the fitted models without training
+    def _fit_base_models(*args, **kwargs):
+        raise AssertionError("the base models must not be fitted")
+
+    with monkeypatch.context() as m:
+        m.setattr(RegressionModel, "_fit_base_models", _fit_base_models)
+        cached_regression_model = RegressionModel(
+            n_actions=n_actions,
+            len_list=len_list,
+            base_model=LogisticRegression(),
+            cache_dir=tmp_path,
+        )
+        cached_q_hat = cached_regression_model.fit_predict(**kwargs)
+    assert np.allclose(cached_q_hat, q_hat)
+    assert np.allclose(
+        cached_regression_model.predict(context), regression_model.predict(context)
+    )
+    dm = DirectMethod()
+    action_dist = generate_action_dist(n_rounds, n_actions, len_list)
+    assert np.isclose(
+        dm.estimate_policy_value(
+            action_dist=action_dist,
+            estimated_rewards_by_reg_model=cached_q_hat,
+            position=position,
+        ),
+        dm.estimate_policy_value(
+            action_dist=action_dist,
+            estimated_rewards_by_reg_model=q_hat,
+            position=position,
+        ),
+    )
+
+    # different data or configurations create new entries
+    regression_model.fit_predict(**dict(kwargs, random_state=0))
+    regression_model.fit_predict(**dict(kwargs, reward=1 - reward))
+    RegressionModel(
+        n_actions=n_actions,
+        len_list=len_list,
+        base_model=LogisticRegression(C=0.1),
+        cache_dir=tmp_path,
+    ).fit_predict(**kwargs)
+    assert len(list(tmp_path.iterdir())) == 4
+    # random folds are not cached
+    regression_model.fit_predict(**dict(kwargs, random_state=None))
+    assert len(list(tmp_path.iterdir())) == 4
+
+    # the least recently used entries are removed
+    entry_size = sum(
+        file_.stat().st_size for file_ in next(tmp_path.iterdir()).iterdir()
+    )
+    RegressionModel(
+        n_actions=n_actions,
+        len_list=len_list,
+        base_model=LogisticRegression(),
+        cache_dir=tmp_path,
+        max_cache_mb=2.5 * entry_size / 2**20,
+    ).fit_predict(**dict(kwargs, random_state=1))
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_regression_models_using_partial_fit() -> None:
+    with pytest.raises(ValueError):
+        RegressionModel(
+            n_actions=n_actions, base_model=LogisticRegression(), max_windows=0
+        )
+
+    windows = []
+    for _ in np.arange(3):
+        windows.append(
+            dict(
+                context=np.random.normal(size=(n_rounds, 5)),
+                action=np.random.choice(n_actions, size=n_rounds),
+                reward=np.random.binomial(1, 0.5, size=n_rounds),
+                position=np.random.choice(len_list, size=n_rounds),
+            )
+        )
+
+    # models without `partial_fit` and `warm_start` cannot be updated incrementally
+    with pytest.raises(ValueError):
+        RegressionModel(
+            n_actions=n_actions, len_list=len_list, base_model=LogisticRegression()
+        ).partial_fit(**windows[0])
+
+    # models implementing `partial_fit` are updated with each window
+    regression_model = RegressionModel(
+        n_actions=n_actions,
+        len_list=len_list,
+        base_model=SGDClassifier(loss="log_loss", random_state=12345),
+    )
+    base_model_list = [
+        SGDClassifier(loss="log_loss", random_state=12345) for _ in np.arange(len_list)
+    ]
+    for window in windows:
+        regression_model.partial_fit(**window)
+        for pos_ in np.arange(len_list):
+            idx = window["position"] == pos_
+            base_model_list[pos_].partial_fit(
+                np.c_[window["context"][idx], np.eye(n_actions)[window["action"][idx]]],
+                window["reward"][idx],
+                classes=np.array([0, 1]),
+            )
+    context = windows[0]["context"]
+    for pos_ in np.arange(len_list):
+        assert np.allclose(
+            regression_model.base_model_list[pos_].coef_, base_model_list[pos_].coef_
+        )
+    assert regression_model.predict(context).shape == (n_rounds, n_actions, len_list)
+
+    # the trees of the expired windows are removed from random forests
+    regression_model = RegressionModel(
+        n_actions=n_actions,
+        len_list=len_list,
+        base_model=RandomForestClassifier(n_estimators=3, random_state=12345),
+        max_windows=2,
+    )
+    regression_model.fit(**windows[0])
+    regression_model.partial_fit(**windows[1])
+    estimators_of_second_window = regression_model.base_model_list[0].estimators_[3:]
+    regression_model.partial_fit(**windows[2])
+    for base_model in regression_model.base_model_list:
+        assert len(base_model.estimators_) == base_model.n_estimators == 6
+    assert regression_model.base_model_list[0].estimators_[:3] == (
+        estimators_of_second_window
+    )
+    q_hat = regression_model.predict(context)
+    assert np.all((0 <= q_hat) & (q_hat <= 1))
+
+
+@pytest.mark.parametrize("n_folds", [1, 3])
+def test_regression_models_with_deduplicated_context(n_folds: int) -> None:
+    # categorical contexts shared by many rounds
+    context = np.random.binomial(1, 0.5, size=(n_rounds, 3)).astype(float)
+    action = np.random.choice(n_actions, size=n_rounds)
+    reward = np.random.binomial(1, 0.5, size=n_rounds)
+    position = np.random.choice(len_list, size=n_rounds)
+    pscore = np.ones(n_rounds) / n_actions
+    q_hat_list = []
+    for deduplicate_context in [False, True]:
+        regression_model = RegressionModel(
+            n_actions=n_actions,
+            len_list=len_list,
+            base_model=LogisticRegression(),
+        )
+        q_hat_list.append(
+            regression_model.fit_predict(
+                context=context,
+                action=action,
+                reward=reward,
+                position=position,
+                n_folds=n_folds,
+                random_state=12345,
+                deduplicate_context=deduplicate_context,
+            )
+        )
+    q_hat, deduplicated_q_hat = q_hat_list
+    assert isinstance(deduplicated_q_hat, DeduplicatedEstimatedRewards)
+    assert deduplicated_q_hat.n_unique_contexts <= 8 * n_folds
+    assert np.allclose(np.asarray(deduplicated_q_hat), q_hat)
+
+    # OPE estimators consume the deduplicated estimated rewards directly
+    action_dist = generate_action_dist(n_rounds, n_actions, len_list)
+    for estimator in [
+        DirectMethod(),
+        DoublyRobust(),
+        SwitchDoublyRobustTuning(lambdas=[1, 10, np.inf]),
+        DoublyRobustWithShrinkageTuning(lambdas=[1, 10, np.inf]),
+    ]:
+        kwargs = dict(
+            reward=reward,
+            action=action,
+            position=position,
+            pscore=pscore,
+            action_dist=action_dist,
+        )
+        assert np.isclose(
+            estimator.estimate_policy_value(
+                estimated_rewards_by_reg_model=q_hat, **kwargs
+            ),
+            estimator.estimate_policy_value(
+                estimated_rewards_by_reg_model=deduplicated_q_hat, **kwargs
+            ),
+        )
@@ -100,6 +100,9 @@ def test_random_compute_batch_action_dist():
     assert action_dist.shape[2] == len_list
     assert len(np.unique(action_dist)) == 1
     assert np.unique(action_dist)[0] == 1 / n_actions
+    # the distribution is broadcast over rounds without copying
+    assert action_dist.strides[0] == 0
+    assert not action_dist.flags.writeable
 
 
 def test_bernoulli_ts_zozotown_prior():
@@ -160,3 +163,29 @@ def test_bernoulli_ts_compute_batch_action_dist():
     assert action_dist.shape[0] == n_rounds
     assert action_dist.shape[1] == n_actions
     assert action_dist.shape[2] == len_list
+    assert np.allclose(action_dist.sum(axis=1), 1)
+
+    # chunked and parallel simulations are reproducible given random_state
+    action_dist_list = []
+    for n_jobs in [1, 2]:
+        policy = BernoulliTS(n_actions=n_actions, len_list=len_list, random_state=12)
+        action_dist_list.append(
+            policy.compute_batch_action_dist(
+                n_rounds=n_rounds, n_sim=1000, max_memory_mb=0.001, n_jobs=n_jobs
+            )
+        )
+    assert np.array_equal(action_dist_list[0], action_dist_list[1])
+
+    # the best action is always selected at the first position
+    policy = BernoulliTS(
+        n_actions=n_actions,
+        len_list=len_list,
+        alpha=np.array([1000.0, 1.0, 1.0, 1.0, 1.0]),
+        beta=np.array([1.0, 1000.0, 1000.0, 1000.0, 1000.0]),
+    )
+    action_dist = policy.compute_batch_action_dist(n_rounds=n_rounds, n_sim=100)
+    assert np.allclose(action_dist[:, 0, 0], 1)
+    assert np.allclose(action_dist[:, 0, 1], 0)
+
+    with pytest.raises(ValueError):
+        policy.compute_batch_action_dist(n_sim=0)
@@ -1,5 +1,6 @@
 import numpy as np
 import pytest
+from scipy import sparse
 from sklearn.linear_model import LinearRegression
 from sklearn.linear_model import LogisticRegression
 import torch
@@ -433,6 +434,26 @@ def test_q_learner_sample_action():
     assert sampled_action.shape[2] == len_list
 
 
+def test_offline_learners_using_sparse_context():
+    n_rounds = 100
+    context = np.random.binomial(1, 0.2, size=(n_rounds, 10)).astype(float)
+    action = np.random.choice(3, size=n_rounds)
+    reward = np.random.binomial(1, 0.5, size=n_rounds)
+    position = np.random.choice(2, size=n_rounds)
+    for learner_cls, kwargs in [
+        (IPWLearner, dict(base_classifier=LogisticRegression(tol=1e-10))),
+        (QLearner, dict(base_model=LogisticRegression(tol=1e-10))),
+    ]:
+        action_dist_list = []
+        for context_ in [context, sparse.csr_matrix(context)]:
+            learner = learner_cls(n_actions=3, len_list=2, **kwargs)
+            learner.fit(
+                context=context_, action=action, reward=reward, position=position
+            )
+            action_dist_list.append(learner.predict(context=context_))
+        assert np.array_equal(action_dist_list[0], action_dist_list[1])
+
+
 # n_actions, len_list, dim_context, off_policy_objective, policy_reg_param, var_reg_param, hidden_layer_size,
 # activation, solver, alpha, batch_size, learning_rate_init, max_iter, shuffle, random_state, tol,
 # momentum, nesterovs_momentum, early_stopping, validation_fraction, beta_1, beta_2, epsilon, n_iter_no_change,
@@ -1,7 +1,30 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
+import pytest
+from scipy import sparse
 
+from obp.dataset import SyntheticBanditDataset
+from obp.ope import InverseProbabilityWeighting
+from obp.ope import OffPolicyEvaluation
+from obp.policy import IPWLearner
+from obp.types import ColumnarBanditFeedback
+from obp.types import DeduplicatedEstimatedRewards
+from obp.types import get_validated_range
+from obp.types import ValidatedBanditFeedback
+from obp.utils import average_over_action_dist
+from obp.utils import check_array
+from obp.utils import check_ope_inputs
+from obp.utils import concatenate_features
+from obp.utils import deduplicate_rows
+from obp.utils import estimate_confidence_interval_by_blb
+from obp.utils import estimate_confidence_interval_by_bootstrap
+from obp.utils import estimate_confidence_interval_by_m_out_of_n_bootstrap
 from obp.utils import sample_action_fast
+from obp.utils import get_validation_level
+from obp.utils import set_validation_level
 from obp.utils import softmax
+from obp.utils import validation_level
 
 
 def test_sample_action_fast():
@@ -19,3 +42,364 @@ def test_sample_action_fast():
         sampled_action_counts = np.unique(sampled_action_arr[i], return_counts=True)[1]
         empirical_probs = sampled_action_counts / n_sim
         assert np.isclose(true_probs[i], empirical_probs, rtol=5e-2, atol=1e-3).all()
+
+
+def test_estimate_confidence_interval_by_bootstrap():
+    samples = np.random.normal(size=1000)
+    n_bootstrap_samples = 100
+    random_state = 12345
+
+    # the vectorized bootstrap is identical to resampling one replicate at a time
+    random_ = np.random.RandomState(random_state)
+    boot_samples = [
+        np.mean(random_.choice(samples, size=samples.shape[0]))
+        for _ in np.arange(n_bootstrap_samples)
+    ]
+    ci = estimate_confidence_interval_by_bootstrap(
+        samples=samples,
+        n_bootstrap_samples=n_bootstrap_samples,
+        random_state=random_state,
+    )
+    assert np.isclose(ci["mean"], np.mean(boot_samples))
+    assert np.isclose(ci["95.0% CI (lower)"], np.percentile(boot_samples, 2.5))
+    assert np.isclose(ci["95.0% CI (upper)"], np.percentile(boot_samples, 97.5))
+
+    # the memory budget does not change the result
+    for resampling in ["multinomial", "poisson"]:
+        ci = estimate_confidence_interval_by_bootstrap(
+            samples=samples,
+            n_bootstrap_samples=n_bootstrap_samples,
+            random_state=random_state,
+            resampling=resampling,
+        )
+        ci_with_small_budget = estimate_confidence_interval_by_bootstrap(
+            samples=samples,
+            n_bootstrap_samples=n_bootstrap_samples,
+            random_state=random_state,
+            resampling=resampling,
+            max_memory_mb=0.01,
+        )
+        assert ci == ci_with_small_budget
+        assert ci["95.0% CI (lower)"] <= ci["mean"] <= ci["95.0% CI (upper)"]
+
+    with pytest.raises(ValueError, match="`resampling` must be either"):
+        estimate_confidence_interval_by_bootstrap(samples=samples, resampling="a")
+
+
+@pytest.mark.parametrize(
+    "estimate_confidence_interval",
+    [
+        estimate_confidence_interval_by_blb,
+        estimate_confidence_interval_by_m_out_of_n_bootstrap,
+    ],
+)
+def test_estimate_confidence_interval_by_subsampling(estimate_confidence_interval):
+    samples = np.random.normal(size=100000)
+    ci = estimate_confidence_interval(
+        samples=samples, n_bootstrap_samples=100, random_state=12345
+    )
+    # the width of the interval is that of the full sample mean, not that of the subsample mean
+    width = ci["95.0% CI (upper)"] - ci["95.0% CI (lower)"]
+    expected_width = 2 * 1.96 * samples.std() / np.sqrt(samples.shape[0])
+    assert np.isclose(width, expected_width, rtol=0.2)
+    assert ci["95.0% CI (lower)"] <= samples.mean() <= ci["95.0% CI (upper)"]
+    assert ci == estimate_confidence_interval(
+        samples=samples, n_bootstrap_samples=100, random_state=12345
+    )
+
+    with pytest.raises(ValueError):
+        estimate_confidence_interval(samples=samples, subsample_size=0)
+
+
+def test_bandit_feedback_container():
+    dataset = SyntheticBanditDataset(n_actions=5, random_state=12345)
+    raw_bandit_feedback = dataset.obtain_batch_bandit_feedback(n_rounds=100)
+    bandit_feedback = ValidatedBanditFeedback(raw_bandit_feedback)
+    assert bandit_feedback.invariants == frozenset(
+        [
+            "consistent_n_rounds",
+            "action_non_negative",
+            "action_in_range",
+            "pscore_positive",
+        ]
+    )
+    assert set(bandit_feedback) == set(raw_bandit_feedback)
+    assert np.allclose(bandit_feedback["reward"], raw_bandit_feedback["reward"])
+    assert get_validated_range(bandit_feedback["action"]) == (
+        raw_bandit_feedback["action"].min(),
+        raw_bandit_feedback["action"].max(),
+    )
+    assert get_validated_range(raw_bandit_feedback["action"]) is None
+
+    # immutable
+    with pytest.raises(TypeError):
+        bandit_feedback["reward"] = None
+    with pytest.raises(ValueError, match="read-only"):
+        bandit_feedback["reward"][0] = 1
+    # the arrays are owned by the container, and thus modifying the given arrays does not affect it
+    raw_bandit_feedback["action"][0] = 10
+    assert bandit_feedback["action"][0] != 10
+    raw_bandit_feedback["action"][0] = 0
+    # the arrays owning their data are taken over without copying them
+    action = np.array([0, 1, 2])
+    bandit_feedback_ = ValidatedBanditFeedback(
+        dict(action=action, n_actions=3), copy=False
+    )
+    assert np.shares_memory(bandit_feedback_["action"], action)
+    with pytest.raises(ValueError, match="read-only"):
+        action[0] = 1
+    # views of the validated arrays are not validated
+    assert get_validated_range(bandit_feedback["action"][:10]) is None
+    assert get_validated_range(bandit_feedback["action"] + 1) is None
+    # the stored arrays are plain arrays, and thus the estimates are plain floats
+    assert type(bandit_feedback["action"]) is np.ndarray
+    estimated_policy_value = InverseProbabilityWeighting().estimate_policy_value(
+        reward=bandit_feedback["reward"],
+        action=bandit_feedback["action"],
+        pscore=bandit_feedback["pscore"],
+        action_dist=np.ones((100, 5, 1)) / 5,
+    )
+    assert isinstance(estimated_policy_value, float)
+
+    # usable wherever the dictionary of logged bandit data is accepted
+    action_dist = np.ones((100, 5, 1)) / 5
+    ope = OffPolicyEvaluation(
+        bandit_feedback=bandit_feedback, ope_estimators=[InverseProbabilityWeighting()]
+    )
+    assert np.isclose(
+        ope.estimate_policy_values(action_dist=action_dist)["ipw"],
+        OffPolicyEvaluation(
+            bandit_feedback=raw_bandit_feedback,
+            ope_estimators=[InverseProbabilityWeighting()],
+        ).estimate_policy_values(action_dist=action_dist)["ipw"],
+    )
+
+    # invalid inputs
+    with pytest.raises(ValueError, match="`pscore` must be positive"):
+        ValidatedBanditFeedback(
+            dict(raw_bandit_feedback, pscore=-raw_bandit_feedback["pscore"])
+        )
+    with pytest.raises(ValueError, match="`action` elements must be integers in"):
+        ValidatedBanditFeedback(
+            dict(raw_bandit_feedback, action=raw_bandit_feedback["action"] + 5)
+        )
+    with pytest.raises(ValueError, match="Expected the same number of rounds"):
+        ValidatedBanditFeedback(dict(raw_bandit_feedback, n_rounds=99))
+
+
+def test_validation_level():
+    action_dist = np.ones((5, 4, 1))  # not a probability distribution
+    inputs = dict(
+        action=np.zeros(5, dtype=int),
+        reward=np.zeros(5),
+        pscore=-np.ones(5),  # not positive
+    )
+    assert get_validation_level() == "strict"
+    with pytest.raises(ValueError, match="`action_dist` must be a probability"):
+        check_ope_inputs(action_dist=action_dist, **inputs)
+    with pytest.raises(ValueError, match="`pscore` must be positive"):
+        check_ope_inputs(action_dist=action_dist / 4, **inputs)
+    for level in ["fast", "off"]:
+        with validation_level(level):
+            assert get_validation_level() == level
+            check_ope_inputs(action_dist=action_dist, **inputs)
+    assert get_validation_level() == "strict"
+
+    # the temporary level does not affect the input validation in the other threads
+    with validation_level("off"):
+        check_ope_inputs(action_dist=action_dist, **inputs)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(
+                check_ope_inputs, action_dist=action_dist, **inputs
+            )
+            with pytest.raises(ValueError, match="`action_dist` must be a probability"):
+                future.result()
+    # while the global level is shared by all the threads
+    set_validation_level("off")
+    try:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(
+                check_ope_inputs, action_dist=action_dist, **inputs
+            ).result()
+    finally:
+        set_validation_level("strict")
+
+    # shapes are still validated in the fast level
+    with validation_level("fast"):
+        with pytest.raises(ValueError, match="`action_dist` must be 3D array"):
+            check_ope_inputs(action_dist=action_dist[:, :, 0], **inputs)
+
+    # the recorded ranges are used even in the fast level
+    bandit_feedback = ValidatedBanditFeedback(
+        dict(action=np.array([0, 1, 5]), reward=np.zeros(3), pscore=np.ones(3))
+    )
+    with validation_level("fast"):
+        with pytest.raises(ValueError, match="`action` elements must be integers in"):
+            check_ope_inputs(
+                action_dist=np.ones((3, 4, 1)) / 4,
+                action=bandit_feedback["action"],
+                reward=bandit_feedback["reward"],
+                pscore=bandit_feedback["pscore"],
+            )
+
+    with pytest.raises(ValueError, match="`level` must be one of"):
+        set_validation_level("none")
+
+
+def test_columnar_bandit_feedback():
+    dataset = SyntheticBanditDataset(
+        n_actions=5, reward_type="binary", random_state=12345
+    )
+    raw_bandit_feedback = dataset.obtain_batch_bandit_feedback(n_rounds=100)
+    bandit_feedback = ColumnarBanditFeedback(raw_bandit_feedback)
+    assert list(bandit_feedback) == list(raw_bandit_feedback)
+    assert bandit_feedback["action"].dtype == np.uint8
+    assert bandit_feedback["reward"].dtype == bool
+    assert bandit_feedback["pscore"].dtype == np.float32
+    assert bandit_feedback["action_context"] is raw_bandit_feedback["action_context"]
+    assert np.all(bandit_feedback["action"] == raw_bandit_feedback["action"])
+
+    # views share the columns
+    bandit_feedback_train, bandit_feedback_test = bandit_feedback.split(70)
+    assert bandit_feedback_train["n_rounds"] == 70
+    assert bandit_feedback_test["n_rounds"] == 30
+    assert np.shares_memory(bandit_feedback_test["context"], bandit_feedback["context"])
+    bootstrap_idx = np.random.RandomState(12345).choice(30, size=30)
+    bootstrap_bandit_feedback = bandit_feedback_test.take(bootstrap_idx)
+    assert bootstrap_bandit_feedback.nbytes == bandit_feedback.nbytes + 30 * 4
+    for key_ in ["context", "action", "reward", "expected_reward"]:
+        assert np.allclose(
+            bootstrap_bandit_feedback[key_],
+            raw_bandit_feedback[key_][70:][bootstrap_idx],
+        )
+    assert np.all(
+        bootstrap_bandit_feedback.take(slice(None, None, -1))["action"]
+        == raw_bandit_feedback["action"][70:][bootstrap_idx][::-1]
+    )
+
+    # assignment does not affect the other views
+    bootstrap_bandit_feedback["reward"] = np.zeros(30)
+    assert np.all(bootstrap_bandit_feedback["reward"] == 0)
+    assert np.all(bandit_feedback["reward"] == raw_bandit_feedback["reward"])
+
+    # usable wherever the dictionary of logged bandit data is accepted
+    action_dist = np.ones((30, 5, 1)) / 5
+    estimated_policy_value = OffPolicyEvaluation(
+        bandit_feedback=bandit_feedback_test,
+        ope_estimators=[InverseProbabilityWeighting()],
+    ).estimate_policy_values(action_dist=action_dist)["ipw"]
+    assert np.isclose(
+        estimated_policy_value,
+        (
+            raw_bandit_feedback["reward"][70:] / raw_bandit_feedback["pscore"][70:] / 5
+        ).mean(),
+    )
+
+    # the number of actions inferred from the compacted actions does not overflow
+    bandit_feedback = ColumnarBanditFeedback(dict(action=np.arange(256)))
+    assert bandit_feedback["action"].dtype == np.uint8
+    ipw_learner = IPWLearner(n_actions=256)
+    ipw_learner.fit(
+        context=np.zeros((256, 1)),
+        action=bandit_feedback["action"],
+        reward=np.ones(256),
+    )
+    assert ipw_learner.predict(context=np.zeros((1, 1))).shape == (1, 256, 1)
+
+
+def test_concatenate_features():
+    context = np.random.binomial(1, 0.1, size=(10, 5))
+    action_context = np.random.normal(size=(10, 3))
+    features = concatenate_features([context, action_context])
+    assert isinstance(features, np.ndarray)
+    assert np.array_equal(features, np.c_[context, action_context])
+
+    sparse_features = concatenate_features([sparse.csr_matrix(context), action_context])
+    assert sparse.isspmatrix_csr(sparse_features)
+    assert np.allclose(sparse_features.toarray(), features)
+    sparse_samples = concatenate_features(
+        [sparse.csr_matrix(context), sparse.csr_matrix(context)], axis=0
+    )
+    assert sparse_samples.shape == (20, 5)
+    assert np.array_equal(sparse_samples.toarray(), np.r_[context, context])
+
+    # sparse matrices are accepted only when `accept_sparse=True`
+    with pytest.raises(ValueError):
+        check_array(sparse.csr_matrix(context), name="context", expected_dim=2)
+    with pytest.raises(ValueError):
+        check_array(
+            sparse.csr_matrix(context),
+            name="context",
+            expected_dim=1,
+            accept_sparse=True,
+        )
+    check_array(
+        sparse.csr_matrix(context), name="context", expected_dim=2, accept_sparse=True
+    )
+    bandit_feedback = ValidatedBanditFeedback(
+        dict(context=sparse.csr_matrix(context), action=np.zeros(10, dtype=int))
+    )
+    columnar_bandit_feedback = ColumnarBanditFeedback(bandit_feedback).take(
+        np.array([3, 1])
+    )
+    assert np.array_equal(
+        columnar_bandit_feedback["context"].toarray(), context[[3, 1]]
+    )
+
+
+def test_deduplicate_rows():
+    context = np.random.binomial(1, 0.3, size=(500, 4)).astype(float)
+    unique_index, inverse_index = deduplicate_rows(context)
+    assert unique_index.shape[0] == np.unique(context, axis=0).shape[0]
+    assert np.array_equal(context[unique_index][inverse_index], context)
+    # the unique rows are numbered in order of appearance
+    assert np.array_equal(np.unique(inverse_index, return_index=True)[1], unique_index)
+    sparse_unique_index, sparse_inverse_index = deduplicate_rows(
+        sparse.csr_matrix(context)
+    )
+    assert np.array_equal(sparse_unique_index, unique_index)
+    assert np.array_equal(sparse_inverse_index, inverse_index)
+
+    n_rounds, n_actions, len_list = inverse_index.shape[0], 5, 2
+    unique_estimated_rewards = np.random.uniform(
+        size=(unique_index.shape[0], n_actions, len_list)
+    )
+    estimated_rewards = DeduplicatedEstimatedRewards(
+        unique_estimated_rewards=unique_estimated_rewards, inverse_index=inverse_index
+    )
+    dense_estimated_rewards = unique_estimated_rewards[inverse_index]
+    assert estimated_rewards.shape == dense_estimated_rewards.shape
+    assert np.array_equal(np.asarray(estimated_rewards), dense_estimated_rewards)
+    action = np.random.choice(n_actions, size=n_rounds)
+    position = np.random.choice(len_list, size=n_rounds)
+    for key in [
+        (np.arange(n_rounds), action, position),
+        (np.arange(n_rounds), slice(None), position),
+        (slice(10, 20), action[:10], position[:10]),
+        (3, slice(None), 1),
+    ]:
+        assert np.array_equal(estimated_rewards[key], dense_estimated_rewards[key])
+    assert isinstance(estimated_rewards[10:20], DeduplicatedEstimatedRewards)
+    assert np.array_equal(
+        np.asarray(estimated_rewards[10:20]), dense_estimated_rewards[10:20]
+    )
+
+    # the expectation over a context-free evaluation policy is computed per unique context
+    action_dist = np.broadcast_to(
+        np.random.dirichlet(np.ones(n_actions), size=len_list).T,
+        (n_rounds, n_actions, len_list),
+    )
+    assert np.allclose(
+        average_over_action_dist(
+            values=estimated_rewards, action_dist=action_dist, position=position
+        ),
+        average_over_action_dist(
+            values=dense_estimated_rewards, action_dist=action_dist, position=position
+        ),
+    )
+
+    with pytest.raises(ValueError):
+        DeduplicatedEstimatedRewards(
+            unique_estimated_rewards=unique_estimated_rewards,
+            inverse_index=inverse_index + unique_index.shape[0],
+        )